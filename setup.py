@@ -2,6 +2,9 @@
 # Date: 3-Oct-2018
 #
 # Update:
+# 16-Oct-2026 jdw add wwpdb_wf_compile_registry console script
+# 16-Oct-2026 jdw add optional msgpack extra for data object serialization
+# 17-Oct-2026 jdw require Python 3.7 - drop the 2.7 and 3.6 classifiers
 #
 import re
 
@@ -34,11 +37,11 @@ setup(
         "Natural Language :: English",
         "License :: OSI Approved :: Apache Software License",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3 :: Only",
         "Programming Language :: Python :: 3.7",
     ],
+    python_requires=">=3.7",
     #
     install_requires=["mysqlclient", "wwpdb.utils.config >= 0.42", "wwpdb.io", "mmcif", "wwpdb.utils.dp ~= 0.52", "wwpdb.utils.session"],
     packages=find_packages(exclude=["wwpdb.utils.tests_wf", "mock-data", "tests.*"]),
@@ -47,6 +50,12 @@ setup(
         "": ["*.md", "*.rst", "*.txt", "*.cfg"],
     },
     #
+    entry_points={
+        "console_scripts": [
+            "wwpdb_wf_compile_registry=wwpdb.utils.wf.process.ActionRegistryCompile:main",
+        ],
+    },
+    #
     # These basic tests require no database services -
     test_suite="wwpdb.utils.tests_wf",
     tests_require=["tox", "wwpdb.utils.testing >= 0.3"],
@@ -55,6 +64,7 @@ setup(
     extras_require={
         "dev": ["check-manifest"],
         "test": ["coverage"],
+        "msgpack": ["msgpack"],
     },
     # Added for
     command_options={"build_sphinx": {"project": ("setup.py", thisPackage), "version": ("setup.py", version), "release": ("setup.py", version)}},
@@ -0,0 +1,226 @@
+##
+# File:    ActionRegistryTests.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw add compiled registry cache test
+# 16-Oct-2026 jdw add lazy registry test
+# 16-Oct-2026 jdw add registry compile test
+# 16-Oct-2026 jdw add reverse index test
+# 16-Oct-2026 jdw add scheduling hint test
+##
+"""
+Test cases for the action registry.
+
+"""
+import os
+import shutil
+import sys
+import unittest
+import traceback
+
+if __package__ is None or __package__ == "":
+    from os import path
+
+    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
+    from commonsetup import TESTOUTPUT, mockTopPath  # pylint: disable=import-error,unused-import
+else:
+    from .commonsetup import TESTOUTPUT, mockTopPath  # noqa: F401
+
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.wf.process.ActionRegistry import ActionRegistry, getSharedActionRegistry
+from wwpdb.utils.wf.process.ActionRegistryIo import ActionRegistryIo
+from wwpdb.utils.wf.process.ActionRegistryCompile import compileRegistry
+from wwpdb.utils.wf.process.ActionResultCache import ActionResultCache
+from wwpdb.utils.wf.process.ProcessRunner import ProcessRunner
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+
+
+class ActionRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.__verbose = True
+        self.__lfh = sys.stderr
+        self.__regPath = ConfigInfo().get("SITE_REGISTRY_FILE_PATH")
+
+    def testSharedRegistry(self):
+        """Test the process-wide shared registry instance."""
+        try:
+            aReg = getSharedActionRegistry()
+            self.assertIs(getSharedActionRegistry(), aReg)
+            self.assertIs(ProcessRunner(verbose=False, log=self.__lfh).getActionRegistry(), aReg)
+            self.assertEqual(sorted(aReg.getActions()), sorted(ActionRegistry().getActions()))
+            self.assertTrue(aReg.isDefinedAction("sizeof"))
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testSharedRegistryReload(self):
+        """Test reloading the shared registry when the registry file changes."""
+        try:
+            regPath = os.path.join(TESTOUTPUT, "actionData-reload.xml")
+            shutil.copyfile(self.__regPath, regPath)
+            aReg = getSharedActionRegistry(regPath)
+            self.assertIs(getSharedActionRegistry(regPath), aReg)
+            self.assertFalse(aReg.isDefinedAction("sizeof-copy"))
+            #
+            with open(regPath, "r") as ifh:
+                regText = ifh.read()
+            with open(regPath, "w") as ofh:
+                ofh.write(regText.replace("</actionList>", '<action name="sizeof-copy"><moduleName>FileUtils</moduleName></action></actionList>'))
+            bReg = getSharedActionRegistry(regPath)
+            self.assertIsNot(bReg, aReg)
+            self.assertTrue(bReg.isDefinedAction("sizeof-copy"))
+            self.assertFalse(aReg.isDefinedAction("sizeof-copy"))
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testRegistryCache(self):
+        """Test loading the registry from the compiled registry cache."""
+        try:
+            regPath = os.path.join(TESTOUTPUT, "actionData-cache.xml")
+            shutil.copyfile(self.__regPath, regPath)
+            aR = ActionRegistryIo(filePath=regPath, verbose=self.__verbose, log=self.__lfh)
+            cachePath = aR.getCacheFilePath()
+            self.assertTrue(os.access(cachePath, os.R_OK))
+            regD = ActionRegistryIo(filePath=regPath, useCache=False, log=self.__lfh).getRegistry()
+            self.assertEqual(aR.getRegistry(), regD)
+            self.assertEqual(ActionRegistryIo(filePath=regPath, log=self.__lfh).getRegistry(), regD)
+            # a damaged cache is rebuilt
+            with open(cachePath, "wb") as ofh:
+                ofh.write(b"not a cache")
+            self.assertEqual(ActionRegistryIo(filePath=regPath, log=self.__lfh).getRegistry(), regD)
+            self.assertEqual(ActionRegistryIo(filePath=regPath, log=self.__lfh).getRegistry(), regD)
+            self.assertGreater(os.path.getsize(cachePath), len(b"not a cache"))
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testLazyRegistry(self):
+        """Test parsing action definitions on first access."""
+        try:
+            regD = ActionRegistryIo(filePath=self.__regPath, useCache=False, log=self.__lfh).getRegistry()
+            lazyD = ActionRegistryIo(filePath=self.__regPath, lazy=True, log=self.__lfh).getRegistry()
+            self.assertEqual(list(lazyD), list(regD))
+            self.assertEqual(lazyD.getParsedCount(), 0)
+            self.assertEqual(lazyD["sizeof"], regD["sizeof"])
+            self.assertEqual(lazyD.getParsedCount(), 1)
+            self.assertEqual(dict(lazyD.items()), regD)
+            #
+            aReg = ActionRegistry(filePath=self.__regPath, lazy=True)
+            self.assertTrue(aReg.isDefinedAction("sizeof"))
+            self.assertFalse(aReg.isDefinedAction("not-an-action"))
+            self.assertEqual(aReg.getModuleName("sizeof"), ActionRegistry(filePath=self.__regPath).getModuleName("sizeof"))
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testCompileRegistry(self):
+        """Test verifying and compiling the registry and loading the compiled registry without the registry file."""
+        try:
+            regPath = os.path.join(TESTOUTPUT, "actionData-compile.xml")
+            with open(self.__regPath, "r") as ifh:
+                regText = ifh.read()
+            badAction = '<action name="sizeof-bad"><moduleName>wwpdb.utils.wf.plugins.FileUtils</moduleName><methodName>noSuchOp</methodName></action>'
+            with open(regPath, "w") as ofh:
+                ofh.write(regText.replace("</actionList>", badAction + "</actionList>"))
+            cachePath = regPath + ".cache"
+            if os.path.exists(cachePath):
+                os.remove(cachePath)
+            ok, errD = compileRegistry(regPath, verbose=self.__verbose, log=self.__lfh)
+            self.assertFalse(ok)
+            self.assertIn("sizeof-bad", errD)
+            self.assertFalse(os.path.exists(cachePath))
+            #
+            deployPath = os.path.join(TESTOUTPUT, "deploy-compile")
+            if not os.path.isdir(deployPath):
+                os.makedirs(deployPath)
+            ok, _errD = compileRegistry(regPath, outputPath=os.path.join(deployPath, "actionData.xml.cache"), verify=False)
+            self.assertTrue(ok)
+            aReg = ActionRegistry(filePath=os.path.join(deployPath, "actionData.xml"))
+            self.assertTrue(aReg.isDefinedAction("sizeof"))
+            self.assertTrue(aReg.isDefinedAction("sizeof-bad"))
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testReverseIndexes(self):
+        """Test listing actions by plugin module, data object content type and format and parameter name."""
+        try:
+            aReg = ActionRegistry(filePath=self.__regPath)
+            for actionId in aReg.getActions():
+                moduleName = aReg.getModuleName(actionId)
+                if moduleName is not None:
+                    self.assertIn(actionId, aReg.getActionsByModule(moduleName))
+                    self.assertIn(actionId, aReg.getActionsByModule(moduleName.split(".")[-1]))
+                for inpName in aReg.getInputObjectNames(actionId):
+                    contentType, fileFormat = aReg.getInputContentType(actionId, inpName), aReg.getInputFileFormat(actionId, inpName)
+                    if contentType is not None or fileFormat is not None:
+                        self.assertIn(actionId, aReg.getActionsByInput(contentType, fileFormat))
+                        self.assertIn(actionId, aReg.getActionsByInput(contentType=contentType))
+                        self.assertIn(actionId, aReg.getActionsByInput(fileFormat=fileFormat))
+                for outName in aReg.getOutputObjectNames(actionId):
+                    contentType, fileFormat = aReg.getOutputContentType(actionId, outName), aReg.getOutputFileFormat(actionId, outName)
+                    if contentType is not None or fileFormat is not None:
+                        self.assertIn(actionId, aReg.getActionsByOutput(contentType, fileFormat))
+                for paramName in aReg.getUserParameterDict(actionId):
+                    self.assertIn(actionId, aReg.getActionsByParameter(paramName))
+            #
+            self.assertEqual(aReg.getActionsByModule("not-a-module"), [])
+            self.assertEqual(aReg.getActionsByInput("not-a-content-type", "pdbx"), [])
+            byModuleL = aReg.getActionsByModule(aReg.getModuleName("sizeof"))
+            self.assertEqual(byModuleL, [actionId for actionId in aReg.getActions() if actionId in byModuleL])
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testHints(self):
+        """Test reading action scheduling hints and skipping the result cache for non-cacheable actions."""
+        try:
+            aReg = ActionRegistry(filePath=self.__regPath)
+            hints = "<hints><cpuCores>4</cpuCores><peakMemory>2e9</peakMemory><runtime>120</runtime><parallelSafe>no</parallelSafe><cacheable>no</cacheable></hints>"
+            action = '<action name="sizeof-nocache">%s<moduleName>%s</moduleName><methodName>%s</methodName></action>' % (hints, aReg.getModuleName("sizeof"), aReg.getMethodName("sizeof"))
+            regPath = os.path.join(TESTOUTPUT, "actionData-hints.xml")
+            with open(self.__regPath, "r") as ifh:
+                regText = ifh.read()
+            with open(regPath, "w") as ofh:
+                ofh.write(regText.replace("</actionList>", action + "</actionList>"))
+            #
+            aReg = ActionRegistry(filePath=regPath)
+            self.assertEqual(aReg.getCpuCores("sizeof-nocache"), 4)
+            self.assertEqual(aReg.getPeakMemory("sizeof-nocache"), 2e9)
+            self.assertEqual(aReg.getTypicalRuntime("sizeof-nocache"), 120.0)
+            self.assertFalse(aReg.isParallelSafe("sizeof-nocache", default=True))
+            self.assertFalse(aReg.isCacheable("sizeof-nocache"))
+            self.assertEqual(aReg.getCpuCores("not-an-action"), 1)
+            self.assertIsNone(aReg.isCacheable("not-an-action"))
+            #
+            cachePath = os.path.join(TESTOUTPUT, "action-result-cache-hints")
+            if os.path.exists(cachePath):
+                shutil.rmtree(cachePath)
+            cache = ActionResultCache(cachePath, verbose=self.__verbose, log=self.__lfh)
+            for _ in range(2):
+                wfoInp = WfDataObject()
+                wfoInp.setDepositionDataSetId("D_000001")
+                wfoInp.setStorageType("archive")
+                wfoInp.setContentTypeAndFormat("model", "pdbx")
+                wfoInp.setVersionId("original")
+                wfoOut = WfDataObject()
+                wfoOut.setContainerTypeName("value")
+                wfoOut.setValueTypeName("integer")
+                pR = ProcessRunner(verbose=self.__verbose, log=self.__lfh, actionRegistry=aReg)
+                pR.setResultCache(cache)
+                pR.setInput("src", wfoInp)
+                pR.setOutput("dst", wfoOut)
+                self.assertTrue(pR.setAction("sizeof-nocache"))
+                self.assertTrue(pR.run())
+                self.assertGreater(wfoOut.getValue(), 0)
+            self.assertEqual(cache.getStats()["stores"], 0)
+            self.assertEqual(cache.getStats()["hits"], 0)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+
+if __name__ == "__main__":
+    unittest.main()
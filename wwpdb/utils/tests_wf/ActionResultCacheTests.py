@@ -0,0 +1,195 @@
+##
+# File:    ActionResultCacheTests.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw input rewritten with the same size and modification time
+# 17-Oct-2026 jdw store shared by two instances and restore of an incomplete entry
+##
+"""
+Test cases for memoizing action results in the content-addressed result cache.
+
+"""
+import glob
+import hashlib
+import os
+import pickle
+import sys
+import shutil
+import unittest
+import traceback
+
+if __package__ is None or __package__ == "":
+    from os import path
+
+    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
+    from commonsetup import TESTOUTPUT, mockTopPath  # pylint: disable=import-error,unused-import
+else:
+    from .commonsetup import TESTOUTPUT, mockTopPath  # noqa: F401
+
+from wwpdb.utils.wf.process.ProcessRunner import ProcessRunner
+from wwpdb.utils.wf.process.ActionResultCache import ActionResultCache
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+
+
+class ActionResultCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.__verbose = True
+        self.__lfh = sys.stderr
+        self.__cachePath = os.path.join(TESTOUTPUT, "action-result-cache")
+        for pth in [self.__cachePath, self.__cachePath + "-small"]:
+            if os.path.exists(pth):
+                shutil.rmtree(pth)
+
+    def __getInput(self):
+        wfoInp = WfDataObject()
+        wfoInp.setDepositionDataSetId("D_000001")
+        wfoInp.setStorageType("archive")
+        wfoInp.setContentTypeAndFormat("model", "pdbx")
+        wfoInp.setVersionId("original")
+        return wfoInp
+
+    def __runSizeOf(self, cache):
+        wfoOut = WfDataObject()
+        wfoOut.setContainerTypeName("value")
+        wfoOut.setValueTypeName("integer")
+        pR = ProcessRunner(verbose=self.__verbose, log=self.__lfh)
+        pR.setResultCache(cache)
+        pR.setInput("src", self.__getInput())
+        pR.setOutput("dst", wfoOut)
+        self.assertTrue(pR.setAction("sizeof"))
+        self.assertTrue(pR.run())
+        return wfoOut.getValue()
+
+    def testCacheSizeOfOp(self):
+        """Test restoring a value output from the result cache."""
+        try:
+            cache = ActionResultCache(self.__cachePath, verbose=self.__verbose, log=self.__lfh)
+            nBytesL = [self.__runSizeOf(cache) for _ in range(3)]
+            self.assertEqual(len(set(nBytesL)), 1)
+            sD = cache.getStats()
+            self.__lfh.write("Cache statistics %r\n" % sD)
+            self.assertEqual(sD["misses"], 1)
+            self.assertEqual(sD["hits"], 2)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def __runCopy(self, cache, wfoInp, outPath):
+        if os.path.exists(outPath):
+            os.remove(outPath)
+        wfoOut = WfDataObject()
+        wfoOut.setReferenceType("file")
+        wfoOut.setExternalFilePath(outPath)
+        pR = ProcessRunner(verbose=self.__verbose, log=self.__lfh)
+        pR.setResultCache(cache)
+        pR.setInput("src", wfoInp)
+        pR.setOutput("dst", wfoOut)
+        self.assertTrue(pR.setAction("copy"))
+        self.assertTrue(pR.run())
+
+    def testCacheCopyOp(self):
+        """Test restoring a file output from the result cache and LRU eviction."""
+        try:
+            wfoInp = self.__getInput()
+            inpPath = wfoInp.getFilePathReference()
+            outPath = os.path.join(TESTOUTPUT, "cache-copy-model.cif")
+            cache = ActionResultCache(self.__cachePath, verbose=self.__verbose, log=self.__lfh)
+            for _ in range(2):
+                self.__runCopy(cache, wfoInp, outPath)
+                self.assertEqual(os.path.getsize(outPath), os.path.getsize(inpPath))
+            self.assertEqual(cache.getStats()["hits"], 1)
+            #
+            # A store too small for the copied file evicts each result
+            smallCache = ActionResultCache(self.__cachePath + "-small", maxBytes=os.path.getsize(inpPath) - 1, verbose=self.__verbose, log=self.__lfh)
+            for _ in range(2):
+                self.__runCopy(smallCache, wfoInp, outPath)
+            sD = smallCache.getStats()
+            self.assertEqual(sD["hits"], 0)
+            self.assertEqual(sD["evictions"], 2)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testCacheRewrittenInput(self):
+        """Test that an input rewritten with the same size and modification time is not restored from the cache."""
+        try:
+            inpPath = os.path.join(TESTOUTPUT, "cache-rewritten-input.txt")
+            outPath = os.path.join(TESTOUTPUT, "cache-rewritten-output.txt")
+            wfoInp = WfDataObject()
+            wfoInp.setReferenceType("file")
+            wfoInp.setExternalFilePath(inpPath)
+            cache = ActionResultCache(self.__cachePath, verbose=self.__verbose, log=self.__lfh)
+            for content in ["aaaa", "bbbb"]:
+                with open(inpPath, "w") as ofh:
+                    ofh.write(content)
+                os.utime(inpPath, ns=(1000000000, 1000000000))
+                self.__runCopy(cache, wfoInp, outPath)
+                with open(outPath, "r") as ifh:
+                    self.assertEqual(ifh.read(), content)
+            self.assertEqual(cache.getStats()["hits"], 0)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def __getExternalFile(self, fileName, content, fileFormat="any"):
+        fP = os.path.join(TESTOUTPUT, fileName)
+        with open(fP, "w") as ofh:
+            ofh.write(content)
+        wfo = WfDataObject()
+        wfo.setReferenceType("file")
+        wfo.setExternalFilePath(fP, fileFormat=fileFormat)
+        return wfo
+
+    def __checkStore(self, maxBytes):
+        """Every entry references stored objects and the objects are within the size limit."""
+        objPathL = [pth for pth in glob.glob(os.path.join(self.__cachePath, "objects", "*", "*")) if len(os.path.basename(pth)) == 64]
+        self.assertLessEqual(sum(os.path.getsize(pth) for pth in objPathL), maxBytes)
+        for entryPath in glob.glob(os.path.join(self.__cachePath, "entries", "*.pic")):
+            with open(entryPath, "rb") as ifh:
+                eD = pickle.load(ifh)
+            for tup in eD["OUTPUT"].values():
+                if tup[0] == "file":
+                    self.assertTrue(os.access(os.path.join(self.__cachePath, "objects", tup[1][:2], tup[1]), os.R_OK))
+
+    def testCacheSharedStore(self):
+        """Test two instances sharing a store -- shared objects are kept and the size limit applies to the whole store."""
+        try:
+            maxBytes = 1050
+            cacheA = ActionResultCache(self.__cachePath, maxBytes=maxBytes, verbose=self.__verbose, log=self.__lfh)
+            cacheB = ActionResultCache(self.__cachePath, maxBytes=maxBytes, verbose=self.__verbose, log=self.__lfh)
+            outPath = os.path.join(TESTOUTPUT, "cache-shared-output.txt")
+            # the first two entries (inputs differing in format) share the output content
+            stepL = [(cacheA, "x1", "x" * 100, "any"), (cacheB, "x2", "x" * 100, "txt"), (cacheA, "y", "y" * 1000, "any"), (cacheB, "z", "z" * 1000, "any")]
+            for cache, fileName, content, fileFormat in stepL:
+                self.__runCopy(cache, self.__getExternalFile("cache-shared-%s.txt" % fileName, content, fileFormat), outPath)
+                self.__checkStore(maxBytes)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testCacheIncompleteEntry(self):
+        """Test that an entry with a missing output object is a miss that leaves the outputs unchanged."""
+        try:
+            cache = ActionResultCache(self.__cachePath, verbose=self.__verbose, log=self.__lfh)
+            outD = {"a": self.__getExternalFile("cache-incomplete-a.txt", "aaaa"), "b": self.__getExternalFile("cache-incomplete-b.txt", "bbbb")}
+            ref = cache.lookup("copy", {}, {}, {}, outD)
+            self.assertTrue(cache.store(ref, outD))
+            digest = hashlib.sha256(b"bbbb").hexdigest()
+            os.remove(os.path.join(self.__cachePath, "objects", digest[:2], digest))
+            with open(outD["a"].getFilePathReference(), "w") as ofh:
+                ofh.write("changed")
+            self.assertFalse(cache.restore(ref, outD))
+            with open(outD["a"].getFilePathReference(), "r") as ifh:
+                self.assertEqual(ifh.read(), "changed")
+            # an output without a path is a miss
+            self.assertTrue(cache.store(ref, outD))
+            self.assertFalse(cache.restore({"KEY": ref["KEY"], "ACTION_ID": "copy", "OUTPUT_PATH_DICT": {"a": outD["a"].getFilePathReference(), "b": None}}, outD))
+            self.assertEqual(cache.getStats()["misses"], 2)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+
+if __name__ == "__main__":
+    unittest.main()
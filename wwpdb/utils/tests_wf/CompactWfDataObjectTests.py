@@ -0,0 +1,100 @@
+##
+# File:    CompactWfDataObjectTests.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw compare resolved session file paths
+# 16-Oct-2026 jdw check the slot names and relax the memory comparison
+# 17-Oct-2026 jdw compare the per-instance state of full and compact data objects with a shared site configuration
+##
+"""
+Test cases for the compact workflow data object.
+
+"""
+import gc
+import pickle
+import sys
+import tracemalloc
+import unittest
+import traceback
+
+if __package__ is None or __package__ == "":
+    from os import path
+
+    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
+    from commonsetup import TESTOUTPUT, mockTopPath  # pylint: disable=import-error,unused-import
+else:
+    from .commonsetup import TESTOUTPUT, mockTopPath  # noqa: F401
+
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+from wwpdb.utils.wf.CompactWfDataObject import CompactWfDataObject
+
+
+class CompactWfDataObjectTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stderr
+
+    def __getFileObject(self, idx):
+        wfo = WfDataObject()
+        wfo.setReferenceType("file")
+        wfo.setSessionDataSetId("D_%09d" % idx)
+        wfo.setStorageType("session")
+        wfo.setSessionPath(TESTOUTPUT)
+        wfo.setContentTypeAndFormat("model", "pdbx")
+        wfo.setVersionId("none")
+        return wfo
+
+    def testRoundTrip(self):
+        """Test compacting and expanding file reference and value data objects."""
+        try:
+            wfo = self.__getFileObject(1)
+            cObj = CompactWfDataObject(wfo)
+            self.assertEqual((cObj.getContentType(), cObj.getFileFormat(), cObj.getStorageType()), ("model", "pdbx", "session"))
+            self.assertIs(cObj.getContentType(), CompactWfDataObject(self.__getFileObject(2)).getContentType())
+            for tObj in [cObj.toWfDataObject(), pickle.loads(pickle.dumps(cObj)).toWfDataObject()]:
+                self.assertIsNotNone(tObj.getFilePathReference())
+                self.assertEqual(tObj.getFilePathReference(), wfo.getFilePathReference())
+            #
+            wfo = WfDataObject()
+            wfo.setContainerTypeName("list")
+            wfo.setValueTypeName("integer")
+            wfo.setValue([1, 2, 3])
+            tObj = CompactWfDataObject(wfo).toWfDataObject()
+            self.assertEqual(tObj.getValue(), [1, 2, 3])
+            self.assertTrue(tObj.isValueValid())
+            self.assertEqual(CompactWfDataObject().toWfDataObject().getContainerTypeName(), None)
+            self.assertEqual(sorted(CompactWfDataObject.__slots__), sorted(WfDataObject().toDict()))
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testMemory(self):
+        """Benchmark the memory used by pending data objects in full and compact form.
+
+        The full data objects are built with fromDict() so that they share the site configuration
+        and the comparison is of the per-instance state alone (compact is about 1/8 of full).
+        """
+        try:
+            nObj = 200
+            dataL = [self.__getFileObject(idx).toDict() for idx in range(nObj)]
+            WfDataObject.fromDict(dataL[0])
+            gc.collect()
+            tracemalloc.start()
+            fullL = [WfDataObject.fromDict(dataD) for dataD in dataL]
+            fullBytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            gc.collect()
+            tracemalloc.start()
+            compactL = [CompactWfDataObject(wfo) for wfo in fullL]
+            compactBytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            self.__lfh.write("+CompactWfDataObjectTests.testMemory() bytes per data object full %.0f compact %.0f\n" % (fullBytes / nObj, compactBytes / nObj))
+            self.assertEqual(len(compactL), nObj)
+            self.assertLess(compactBytes * 4, fullBytes)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+##
+# File:    LogSinkTests.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw unbuffered caller handles and text kept after a failed write
+# 17-Oct-2026 jdw buffered standard error sink
+##
+"""
+Test cases for the buffered log sink.
+
+"""
+import io
+import os
+import sys
+import logging
+import unittest
+import traceback
+from unittest import mock
+
+if __package__ is None or __package__ == "":
+    from os import path
+
+    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
+    from commonsetup import TESTOUTPUT, mockTopPath  # pylint: disable=import-error,unused-import
+else:
+    from .commonsetup import TESTOUTPUT, mockTopPath  # noqa: F401
+
+from wwpdb.utils.wf.process.LogSink import LOG_FLUSH_INTERVAL_ENV_NAME, LogSink, getLogSink
+
+
+class _Unformattable(object):
+    def __repr__(self):
+        raise RuntimeError("formatted a disabled message")
+
+
+class _FailingStream(io.StringIO):
+    def __init__(self):
+        super(_FailingStream, self).__init__()
+        self.nFail = 1
+
+    def write(self, s):
+        if self.nFail > 0:
+            self.nFail -= 1
+            raise OSError("write failed")
+        return super(_FailingStream, self).write(s)
+
+
+class LogSinkTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stderr
+
+    def testLevelAndBuffering(self):
+        """Test deferred formatting of disabled messages and flushing of buffered output."""
+        try:
+            ofh = io.StringIO()
+            sink = LogSink(ofh, level=logging.INFO)
+            sink.debug("+LogSinkTests.testLevelAndBuffering() %r", _Unformattable())
+            sink.info("+LogSinkTests.testLevelAndBuffering() info %d", 1)
+            sink.write("plain text\n")
+            sink.flush()
+            self.assertEqual(ofh.getvalue(), "+LogSinkTests.testLevelAndBuffering() info 1\nplain text\n")
+            # errors are written immediately
+            sink.error("+LogSinkTests.testLevelAndBuffering() error %s", "msg")
+            self.assertTrue(ofh.getvalue().endswith("error msg\n"))
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testGetLogSink(self):
+        """Test wrapping file handles and sharing an existing sink."""
+        try:
+            ofh = io.StringIO()
+            sink = getLogSink(ofh, verbose=True)
+            self.assertTrue(sink.isEnabledFor(logging.DEBUG))
+            # caller-supplied handles are written without buffering
+            sink.write("plain text\n")
+            self.assertEqual(ofh.getvalue(), "plain text\n")
+            self.assertFalse(sink.isBuffered())
+            self.assertIs(getLogSink(sink, verbose=False), sink)
+            # the standard error stream is buffered
+            with mock.patch.dict(os.environ, {LOG_FLUSH_INTERVAL_ENV_NAME: "0.25"}):
+                sink = getLogSink(sys.stderr)
+            self.assertFalse(sink.isEnabledFor(logging.DEBUG))
+            self.assertTrue(sink.isBuffered())
+            sink.flush()
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testFailedWrite(self):
+        """Test that buffered text which could not be written is kept for the next flush."""
+        try:
+            ofh = _FailingStream()
+            sink = LogSink(ofh)
+            sink.write("first\n")
+            self.assertRaises(OSError, sink.flush)
+            sink.write("second\n")
+            sink.flush()
+            self.assertEqual(ofh.getvalue(), "first\nsecond\n")
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testFork(self):
+        """Test that output pending at a fork is written once by the parent."""
+        try:
+            fP = os.path.join(TESTOUTPUT, "log-sink-fork.txt")
+            with open(fP, "w") as ofh:
+                sink = LogSink(ofh)
+                sink.write("parent\n")
+                pid = os.fork()
+                if pid == 0:
+                    sink.write("child\n")
+                    sink.flush()
+                    os._exit(0)  # pylint: disable=protected-access
+                os.waitpid(pid, 0)
+                sink.flush()
+            with open(fP, "r") as ifh:
+                self.assertEqual(sorted(ifh.read().split()), ["child", "parent"])
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+##
+# File:    ProcessAsyncRunnerTests.py
+# Date:    16-Oct-2026
+#
+# Updates:
+#
+##
+"""
+Test cases for running actions from asyncio code.
+
+"""
+import asyncio
+import sys
+import unittest
+import traceback
+
+if __package__ is None or __package__ == "":
+    from os import path
+
+    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
+    from commonsetup import TESTOUTPUT, mockTopPath  # pylint: disable=import-error,unused-import
+else:
+    from .commonsetup import TESTOUTPUT, mockTopPath  # noqa: F401
+
+from wwpdb.utils.wf.process.ProcessAsyncRunner import ProcessAsyncRunner
+from wwpdb.utils.wf.process.ProcessJob import makeJob
+from wwpdb.utils.wf.process.ProcessRunner import ProcessRunner
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+
+
+class ProcessAsyncRunnerTests(unittest.TestCase):
+    def setUp(self):
+        self.__verbose = True
+        self.__lfh = sys.stderr
+        self.__depDataSetId = "D_000001"
+
+    def __getInput(self, versionId):
+        wfoInp = WfDataObject()
+        wfoInp.setDepositionDataSetId(self.__depDataSetId)
+        wfoInp.setStorageType("archive")
+        wfoInp.setContentTypeAndFormat("model", "pdbx")
+        wfoInp.setVersionId(versionId)
+        return wfoInp
+
+    def __getSizeOutput(self):
+        wfoOut = WfDataObject()
+        wfoOut.setContainerTypeName("value")
+        wfoOut.setValueTypeName("integer")
+        return wfoOut
+
+    def testRunAsyncSizeOfOp(self):
+        """Test awaiting a single file size action."""
+        try:
+            wfoOut = self.__getSizeOutput()
+            pR = ProcessRunner(verbose=self.__verbose, log=self.__lfh)
+            pR.setInput("src", self.__getInput("original"))
+            pR.setOutput("dst", wfoOut)
+            self.assertTrue(pR.setAction("sizeof"))
+            self.assertTrue(asyncio.run(pR.runAsync()))
+            self.assertGreater(wfoOut.getValue(), 0)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testAsyncBatchSizeOfOp(self):
+        """Test awaiting a batch of file size actions with bounded concurrency."""
+        try:
+            aR = ProcessAsyncRunner(concurrencyD={"FileUtils": 2}, verbose=self.__verbose, log=self.__lfh)
+            self.assertEqual(aR.getActionClassName("sizeof"), "FileUtils")
+            outL = []
+            jobL = []
+            for versionId in ["original", "latest", 2, 3] * 5:
+                wfoOut = self.__getSizeOutput()
+                outL.append(wfoOut)
+                jobL.append(makeJob("sizeof", inputObjectD={"src": self.__getInput(versionId)}, outputObjectD={"dst": wfoOut}))
+            jobL.append(makeJob("not-an-action"))
+            rL = asyncio.run(aR.runJobs(jobL))
+            self.assertEqual(len(rL), len(jobL))
+            for rD in rL[:-1]:
+                self.assertTrue(rD["STATUS"])
+            self.assertFalse(rL[-1]["STATUS"])
+            for wfoOut in outL:
+                self.assertGreater(wfoOut.getValue(), 0)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+##
+# File:    ProcessBatchRunnerTests.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw add fan-out test
+# 17-Oct-2026 jdw add merge test for reference settings of returned output data objects
+##
+"""
+Test cases for running batches of actions in a process pool.
+
+"""
+import sys
+import pickle
+import unittest
+import traceback
+
+if __package__ is None or __package__ == "":
+    from os import path
+
+    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
+    from commonsetup import TESTOUTPUT, mockTopPath  # pylint: disable=import-error,unused-import
+else:
+    from .commonsetup import TESTOUTPUT, mockTopPath  # noqa: F401
+
+from wwpdb.utils.wf.process.ProcessBatchRunner import ProcessBatchRunner
+from wwpdb.utils.wf.process.ProcessJob import makeJob, mergeJobResult, runFanOutJob
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+
+
+class ProcessBatchRunnerTests(unittest.TestCase):
+    def setUp(self):
+        self.__verbose = True
+        self.__lfh = sys.stderr
+        self.__depDataSetId = "D_000001"
+
+    def __getInput(self, versionId):
+        wfoInp = WfDataObject()
+        wfoInp.setDepositionDataSetId(self.__depDataSetId)
+        wfoInp.setStorageType("archive")
+        wfoInp.setContentTypeAndFormat("model", "pdbx")
+        wfoInp.setVersionId(versionId)
+        return wfoInp
+
+    def testPickleDataObject(self):
+        """Test pickling a file reference data object without its site configuration."""
+        try:
+            wfoInp = self.__getInput("original")
+            wfoCopy = pickle.loads(pickle.dumps(wfoInp))
+            self.assertEqual(wfoCopy.getFilePathReference(), wfoInp.getFilePathReference())
+            self.assertEqual(wfoCopy.getSitePrefix(), wfoInp.getSitePrefix())
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testMergeJobResult(self):
+        """Test that reference settings and values of returned output data objects are merged."""
+        try:
+            wfoOut = self.__getInput("next")
+            jobD = makeJob("sizeof", outputObjectD={"dst": wfoOut})
+            # output data object as returned from a worker process
+            wfoRet = pickle.loads(pickle.dumps(wfoOut))
+            wfoRet.setVersionId(3)
+            wfoRet.setPartitionNumber(2)
+            wfoRet.setValue(10)
+            self.assertTrue(mergeJobResult(jobD, {"OUTPUT_OBJECT_DICT": {"dst": wfoRet}}))
+            self.assertEqual((wfoOut.getVersionId(), wfoOut.getPartitionNumber(), wfoOut.getValue()), ("3", 2, 10))
+            self.assertEqual(wfoOut.getFilePathReference(), wfoRet.getFilePathReference())
+            self.assertEqual(wfoOut.getSitePrefix(), wfoRet.getSitePrefix())
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testBatchSizeOfOp(self):
+        """Test running a batch of file size actions in a process pool."""
+        try:
+            bR = ProcessBatchRunner(numProc=2, verbose=self.__verbose, log=self.__lfh)
+            outL = []
+            for versionId in ["original", "latest", 2, 3]:
+                wfoOut = WfDataObject()
+                wfoOut.setContainerTypeName("value")
+                wfoOut.setValueTypeName("integer")
+                outL.append(wfoOut)
+                bR.addJob("sizeof", inputObjectD={"src": self.__getInput(versionId)}, outputObjectD={"dst": wfoOut})
+            bR.addJob("not-an-action")
+            rL = bR.run()
+            self.assertEqual(len(rL), 5)
+            for rD in rL[:4]:
+                self.assertTrue(rD["STATUS"])
+                self.assertIsNone(rD["EXCEPTION"])
+            self.assertFalse(rL[4]["STATUS"])
+            self.assertIsNotNone(rL[4]["EXCEPTION"])
+            for wfoOut in outL:
+                self.assertGreater(wfoOut.getValue(), 0)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testBatchPreCheck(self):
+        """Test checking a batch of jobs against the registry type requirements of their actions."""
+        try:
+            bR = ProcessBatchRunner(verbose=self.__verbose, log=self.__lfh)
+            wfoOut = WfDataObject()
+            wfoOut.setContainerTypeName("value")
+            wfoOut.setValueTypeName("integer")
+            bR.addJob("sizeof", inputObjectD={"src": self.__getInput("original")}, outputObjectD={"dst": wfoOut})
+            # missing input and output of the wrong container type
+            wfoBad = WfDataObject()
+            wfoBad.setContainerTypeName("list")
+            wfoBad.setValueTypeName("string")
+            bR.addJob("sizeof", outputObjectD={"dst": wfoBad})
+            bR.addJob("not-an-action")
+            errLL = bR.preCheck()
+            self.assertEqual(len(errLL), 3)
+            self.assertGreaterEqual(len(errLL[1]), 2)
+            self.assertEqual(len(errLL[2]), 1)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testFanOutSizeOfOp(self):
+        """Test applying a file size action to a list of deposition data sets."""
+        try:
+            wfoOut = WfDataObject()
+            wfoOut.setContainerTypeName("value")
+            wfoOut.setValueTypeName("integer")
+            inpD = {"src": self.__getInput("latest")}
+            outD = {"dst": wfoOut}
+            depIdL = [self.__depDataSetId, "D_000002"]
+            rL = runFanOutJob("sizeof", depIdL, inputTemplateD=inpD, outputTemplateD=outD, verbose=self.__verbose, log=self.__lfh)
+            bR = ProcessBatchRunner(numProc=2, verbose=self.__verbose, log=self.__lfh)
+            rL.extend(bR.runFanOut("sizeof", depIdL, inputTemplateD=inpD, outputTemplateD=outD, chunkSize=1))
+            self.assertEqual([rD["JOB_ID"] for rD in rL], depIdL + depIdL)
+            for rD in rL[::2]:
+                self.assertTrue(rD["STATUS"])
+                self.assertGreater(rD["OUTPUT_OBJECT_DICT"]["dst"].getValue(), 0)
+            # no data for D_000002
+            for rD in rL[1::2]:
+                self.assertFalse(rD["STATUS"])
+            # templates are not modified
+            self.assertEqual(inpD["src"].getDepositionDataSetId(), self.__depDataSetId)
+            self.assertFalse(wfoOut.isValueSet())
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+
+if __name__ == "__main__":
+    unittest.main()
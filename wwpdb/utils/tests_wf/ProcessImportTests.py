@@ -27,7 +27,17 @@ else:
 
 from wwpdb.utils.wf.process.ActionRegistry import ActionRegistry  # noqa: F401
 from wwpdb.utils.wf.process.ActionRegistryIo import ActionRegistryIo  # noqa: F401
+from wwpdb.utils.wf.process.ActionRegistryCompile import compileRegistry  # noqa: F401
 from wwpdb.utils.wf.process.ProcessRunner import ProcessRunner  # noqa: F401
+from wwpdb.utils.wf.process.ActionValidator import ActionValidator  # noqa: F401
+from wwpdb.utils.wf.process.ActionResultCache import ActionResultCache  # noqa: F401
+from wwpdb.utils.wf.process.ProcessJob import runJob  # noqa: F401
+from wwpdb.utils.wf.process.ProcessBatchRunner import ProcessBatchRunner  # noqa: F401
+from wwpdb.utils.wf.process.ProcessPipeline import ProcessPipeline  # noqa: F401
+from wwpdb.utils.wf.process.ProcessAsyncRunner import ProcessAsyncRunner  # noqa: F401
+from wwpdb.utils.wf.process.ProcessPlanner import ProcessPlanner  # noqa: F401
+from wwpdb.utils.wf.process.ProcessRunnerDaemon import ProcessRunnerDaemon  # noqa: F401
+from wwpdb.utils.wf.process.LogSink import LogSink  # noqa: F401
 
 
 class ImportTests(unittest.TestCase):
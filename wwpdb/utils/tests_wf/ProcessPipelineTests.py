@@ -0,0 +1,126 @@
+##
+# File:    ProcessPipelineTests.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 17-Oct-2026 jdw add pipeline test sharing an output data object with a next version
+##
+"""
+Test cases for running a dependency graph of actions.
+
+"""
+import os
+import shutil
+import sys
+import unittest
+import traceback
+
+if __package__ is None or __package__ == "":
+    from os import path
+
+    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
+    from commonsetup import TESTOUTPUT, mockTopPath  # pylint: disable=import-error,unused-import
+else:
+    from .commonsetup import TESTOUTPUT, mockTopPath  # noqa: F401
+
+from wwpdb.utils.wf.process.ProcessPipeline import ProcessPipeline
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+
+
+class ProcessPipelineTests(unittest.TestCase):
+    def setUp(self):
+        self.__verbose = True
+        self.__lfh = sys.stderr
+        self.__depDataSetId = "D_000001"
+        self.__wfInstanceId = "W_000001"
+
+    def __getSizeOutput(self):
+        wfoOut = WfDataObject()
+        wfoOut.setContainerTypeName("value")
+        wfoOut.setValueTypeName("integer")
+        return wfoOut
+
+    def testPipelineCopySizeOfOp(self):
+        """Test a pipeline copying a file to workflow instance storage and measuring both copies."""
+        try:
+            wfoInp = WfDataObject()
+            wfoInp.setDepositionDataSetId(self.__depDataSetId)
+            wfoInp.setStorageType("archive")
+            wfoInp.setContentTypeAndFormat("model", "pdbx")
+            wfoInp.setVersionId("latest")
+
+            wfoOut = WfDataObject()
+            wfoOut.setDepositionDataSetId(self.__depDataSetId)
+            wfoOut.setWorkflowInstanceId(self.__wfInstanceId)
+            wfoOut.setStorageType("wf-instance")
+            wfoOut.setContentTypeAndFormat("model", "pdbx")
+            wfoOut.setVersionId(wfoInp.getFileVersionNumber())
+
+            sizeInpOut = self.__getSizeOutput()
+            sizeCopyOut = self.__getSizeOutput()
+            pP = ProcessPipeline(numProc=2, verbose=self.__verbose, log=self.__lfh)
+            self.assertTrue(pP.addStep("mkdir", "mkdir", inputObjectD={"src": wfoOut}))
+            self.assertTrue(pP.addStep("copy", "copy", inputObjectD={"src": wfoInp}, outputObjectD={"dst": wfoOut}, dependsOn=["mkdir"]))
+            self.assertTrue(pP.addStep("size-copy", "sizeof", inputObjectD={"src": wfoOut}, outputObjectD={"dst": sizeCopyOut}))
+            self.assertTrue(pP.addStep("size-input", "sizeof", inputObjectD={"src": wfoInp}, outputObjectD={"dst": sizeInpOut}))
+            self.assertTrue(pP.addStep("bad", "not-an-action"))
+            self.assertTrue(pP.addStep("after-bad", "sizeof", inputObjectD={"src": wfoInp}, outputObjectD={"dst": self.__getSizeOutput()}, dependsOn=["bad"]))
+            self.assertFalse(pP.addStep("undefined-dependency", "sizeof", dependsOn=["not-a-step"]))
+            #
+            self.assertEqual(pP.getDependencies("copy"), ["mkdir"])
+            self.assertEqual(pP.getDependencies("size-copy"), ["copy"])
+            self.assertEqual(pP.getDependencies("size-input"), [])
+            #
+            rD = pP.run()
+            self.assertEqual(len(rD), 6)
+            for stepId in ["mkdir", "copy", "size-copy", "size-input"]:
+                self.assertTrue(rD[stepId]["STATUS"])
+            self.assertFalse(rD["bad"]["STATUS"])
+            self.assertFalse(rD["after-bad"]["STATUS"])
+            self.assertIsNone(rD["after-bad"]["PID"])
+            self.assertGreater(sizeInpOut.getValue(), 0)
+            self.assertEqual(sizeCopyOut.getValue(), sizeInpOut.getValue())
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testPipelineNextVersion(self):
+        """Test a pipeline writing the next version of a file and measuring it in a dependent step."""
+        try:
+            sessionPath = os.path.join(TESTOUTPUT, "pipeline-session")
+            if os.path.exists(sessionPath):
+                shutil.rmtree(sessionPath)
+            os.makedirs(sessionPath)
+            srcPath = os.path.join(sessionPath, "source.cif")
+            with open(srcPath, "w") as ofh:
+                ofh.write("data_test\n")
+            wfoInp = WfDataObject()
+            wfoInp.setReferenceType("file")
+            wfoInp.setExternalFilePath(srcPath, fileFormat="pdbx")
+
+            wfoOut = WfDataObject()
+            wfoOut.setSessionDataSetId("D_000000002")
+            wfoOut.setStorageType("session")
+            wfoOut.setSessionPath(sessionPath)
+            wfoOut.setContentTypeAndFormat("model", "pdbx")
+            wfoOut.setVersionId("next")
+
+            sizeCopyOut = self.__getSizeOutput()
+            pP = ProcessPipeline(numProc=2, verbose=self.__verbose, log=self.__lfh)
+            self.assertTrue(pP.addStep("copy", "copy", inputObjectD={"src": wfoInp}, outputObjectD={"dst": wfoOut}))
+            self.assertTrue(pP.addStep("size-copy", "sizeof", inputObjectD={"src": wfoOut}, outputObjectD={"dst": sizeCopyOut}))
+            self.assertEqual(pP.getDependencies("size-copy"), ["copy"])
+            rD = pP.run()
+            self.assertTrue(rD["copy"]["STATUS"])
+            self.assertTrue(rD["size-copy"]["STATUS"])
+            # the output version is pinned to the version written by the copy step
+            self.assertEqual(wfoOut.getVersionId(), "1")
+            self.assertTrue(wfoOut.getFilePathReference().endswith(".V1"))
+            self.assertEqual(sizeCopyOut.getValue(), os.path.getsize(srcPath))
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+
+if __name__ == "__main__":
+    unittest.main()
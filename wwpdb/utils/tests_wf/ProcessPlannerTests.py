@@ -0,0 +1,72 @@
+##
+# File:    ProcessPlannerTests.py
+# Date:    16-Oct-2026
+#
+# Updates:
+#
+##
+"""
+Test cases for dry-run planning of action jobs.
+
+"""
+import sys
+import unittest
+import traceback
+
+if __package__ is None or __package__ == "":
+    from os import path
+
+    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
+    from commonsetup import TESTOUTPUT, mockTopPath  # pylint: disable=import-error,unused-import
+else:
+    from .commonsetup import TESTOUTPUT, mockTopPath  # noqa: F401
+
+from wwpdb.utils.wf.process.ProcessJob import makeJob
+from wwpdb.utils.wf.process.ProcessPlanner import ProcessPlanner
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+
+
+class ProcessPlannerTests(unittest.TestCase):
+    def setUp(self):
+        self.__verbose = True
+        self.__lfh = sys.stderr
+        self.__depDataSetId = "D_000001"
+
+    def __getInput(self, versionId):
+        wfoInp = WfDataObject()
+        wfoInp.setDepositionDataSetId(self.__depDataSetId)
+        wfoInp.setStorageType("archive")
+        wfoInp.setContentTypeAndFormat("model", "pdbx")
+        wfoInp.setVersionId(versionId)
+        return wfoInp
+
+    def __getSizeOutput(self, containerType="value"):
+        wfoOut = WfDataObject()
+        wfoOut.setContainerTypeName(containerType)
+        wfoOut.setValueTypeName("integer")
+        return wfoOut
+
+    def testPlanSizeOfOp(self):
+        """Test planning file size actions for present and missing archival data files."""
+        try:
+            jobL = [
+                makeJob("sizeof", inputObjectD={"src": self.__getInput("original")}, outputObjectD={"dst": self.__getSizeOutput()}),
+                makeJob("sizeof", inputObjectD={"src": self.__getInput(999)}, outputObjectD={"dst": self.__getSizeOutput()}),
+                makeJob("sizeof", inputObjectD={"src": self.__getInput("latest")}, outputObjectD={"dst": self.__getSizeOutput("list")}),
+            ]
+            pP = ProcessPlanner(verbose=self.__verbose, log=self.__lfh)
+            planL = pP.plan(jobL)
+            self.assertEqual(len(planL), 3)
+            self.assertTrue(planL[0]["READY"])
+            self.assertEqual(planL[0]["INPUT_PATH_DICT"]["src"], jobL[0]["INPUT_OBJECT_DICT"]["src"].getFilePathReference())
+            self.assertFalse(planL[1]["READY"])
+            self.assertEqual(len(planL[1]["ERROR_LIST"]), 1)
+            self.assertIn("missing", planL[1]["ERROR_LIST"][0])
+            self.assertFalse(planL[2]["READY"])
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+##
+# File:    ProcessRunnerDaemonTests.py
+# Date:    16-Oct-2026
+#
+# Updates:
+#
+##
+"""
+Test cases for running actions in the pre-warmed worker daemon.
+
+"""
+import os
+import sys
+import time
+import unittest
+import traceback
+import multiprocessing
+
+if __package__ is None or __package__ == "":
+    from os import path
+
+    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
+    from commonsetup import TESTOUTPUT, mockTopPath  # pylint: disable=import-error,unused-import
+else:
+    from .commonsetup import TESTOUTPUT, mockTopPath  # noqa: F401
+
+from wwpdb.utils.wf.process.ProcessJob import makeJob
+from wwpdb.utils.wf.process.ProcessRunnerDaemon import ProcessRunnerDaemon, ProcessRunnerClient
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+
+
+def _serve(socketPath):
+    daemon = ProcessRunnerDaemon(socketPath, maxChildren=2, verbose=True)
+    daemon.preload()
+    daemon.serve()
+
+
+class ProcessRunnerDaemonTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stderr
+        self.__socketPath = os.path.join(TESTOUTPUT, "process-runner-%d.sock" % os.getpid())
+        self.__proc = multiprocessing.Process(target=_serve, args=(self.__socketPath,))
+        self.__proc.start()
+        for _ in range(200):
+            if os.path.exists(self.__socketPath):
+                break
+            time.sleep(0.05)
+
+    def tearDown(self):
+        self.__proc.terminate()
+        self.__proc.join()
+
+    def testDaemonSizeOfOp(self):
+        """Test running file size actions in the worker daemon."""
+        try:
+            client = ProcessRunnerClient(self.__socketPath, timeout=60)
+            for versionId in ["original", "latest"]:
+                wfoInp = WfDataObject()
+                wfoInp.setDepositionDataSetId("D_000001")
+                wfoInp.setStorageType("archive")
+                wfoInp.setContentTypeAndFormat("model", "pdbx")
+                wfoInp.setVersionId(versionId)
+                wfoOut = WfDataObject()
+                wfoOut.setContainerTypeName("value")
+                wfoOut.setValueTypeName("integer")
+                rD = client.run(makeJob("sizeof", {"src": wfoInp}, {"dst": wfoOut}, jobId=versionId))
+                self.__lfh.write("Job %r status %r pid %r elapsed %.3f\n" % (rD["JOB_ID"], rD["STATUS"], rD["PID"], rD["ELAPSED_SEC"]))
+                self.assertTrue(rD["STATUS"])
+                self.assertNotEqual(rD["PID"], os.getpid())
+                self.assertGreater(wfoOut.getValue(), 0)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+
+if __name__ == "__main__":
+    unittest.main()
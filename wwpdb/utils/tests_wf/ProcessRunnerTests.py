@@ -5,11 +5,20 @@
 # Updates:
 #
 # 20-Apr-2010 jdw additional diff test cases added.
+# 16-Oct-2026 jdw add dispatch cache test case
+# 16-Oct-2026 jdw add resource limit test case
+# 16-Oct-2026 jdw add phase timing test case
+# 16-Oct-2026 jdw add profiling test case
+# 16-Oct-2026 jdw add retry policy test case
+# 16-Oct-2026 jdw run a resource limited action from a worker thread
 ##
 """
 Test cases for process manager class.  Simple file system tests are included in this module.
 
 """
+import concurrent.futures
+import json
+import os
 import sys
 import unittest
 import traceback
@@ -391,6 +400,192 @@ class ProcessRunnerTests(unittest.TestCase):
             traceback.print_exc(file=self.__lfh)
             self.fail()
 
+    def testDispatchCacheSizeOfOp(self):
+        """Test repeated actions dispatched through the process-wide plugin dispatch cache."""
+        self.__lfh.write("\n------------------------ ")
+        self.__lfh.write("Starting test function  testDispatchCacheSizeOfOp")
+        self.__lfh.write(" -------------------------\n")
+        try:
+            ProcessRunner.clearDispatchCache()
+            ok = ProcessRunner.warmDispatchCache(verbose=self.__verbose, log=self.__lfh)
+            self.__lfh.write("warmDispatchCache() returns status %r\n" % ok)
+
+            wfoInp = WfDataObject()
+            wfoInp.setDepositionDataSetId(self.__depDataSetId)
+            wfoInp.setStorageType("archive")
+            wfoInp.setContentTypeAndFormat("model", "pdbx")
+            wfoInp.setVersionId("original")
+
+            nBytesL = []
+            for _ in range(10):
+                wfoOut = WfDataObject()
+                wfoOut.setContainerTypeName("value")
+                wfoOut.setValueTypeName("integer")
+                pR = ProcessRunner(verbose=False, log=self.__lfh)
+                pR.setInput("src", wfoInp)
+                pR.setOutput("dst", wfoOut)
+                self.assertTrue(pR.setAction("sizeof"))
+                self.assertTrue(pR.run())
+                nBytesL.append(wfoOut.getValue())
+            self.assertEqual(len(set(nBytesL)), 1)
+            self.assertGreater(nBytesL[0], 0)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def __runSizeOfLimited(self, wfoInp, limitD):
+        wfoOut = WfDataObject()
+        wfoOut.setContainerTypeName("value")
+        wfoOut.setValueTypeName("integer")
+        pR = ProcessRunner(verbose=self.__verbose, log=self.__lfh)
+        pR.setInput("src", wfoInp)
+        pR.setOutput("dst", wfoOut)
+        self.assertTrue(pR.setAction("sizeof"))
+        pR.setResourceLimits(**limitD)
+        self.assertEqual(pR.getResourceLimits(), limitD)
+        self.assertTrue(pR.run())
+        self.assertFalse(pR.getTimedOut())
+        return wfoOut.getValue()
+
+    def testResourceLimitSizeOfOp(self):
+        """Test obtaining the size of an archival data file in a resource limited child process
+        started from the main thread and from a worker thread.
+        """
+        self.__lfh.write("\n------------------------ ")
+        self.__lfh.write("Starting test function  testResourceLimitSizeOfOp")
+        self.__lfh.write(" -------------------------\n")
+        try:
+            wfoInp = WfDataObject()
+            wfoInp.setDepositionDataSetId(self.__depDataSetId)
+            wfoInp.setStorageType("archive")
+            wfoInp.setContentTypeAndFormat("model", "pdbx")
+            wfoInp.setVersionId("original")
+
+            limitD = {"wallTime": 60, "cpuTime": 60, "addressSpace": 8 * 1024**3}
+            nBytesL = [self.__runSizeOfLimited(wfoInp, {}), self.__runSizeOfLimited(wfoInp, limitD)]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                nBytesL.append(executor.submit(self.__runSizeOfLimited, wfoInp, limitD).result())
+            self.assertEqual(len(set(nBytesL)), 1)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testTimingsSizeOfOp(self):
+        """Test phase timings and the timing log for obtaining the size of an archival data file."""
+        self.__lfh.write("\n------------------------ ")
+        self.__lfh.write("Starting test function  testTimingsSizeOfOp")
+        self.__lfh.write(" -------------------------\n")
+        try:
+            timingLogPath = os.path.join(TESTOUTPUT, "process-timings.jsonl")
+            if os.path.exists(timingLogPath):
+                os.remove(timingLogPath)
+            wfoInp = WfDataObject()
+            wfoInp.setDepositionDataSetId(self.__depDataSetId)
+            wfoInp.setStorageType("archive")
+            wfoInp.setContentTypeAndFormat("model", "pdbx")
+            wfoInp.setVersionId("original")
+            wfoOut = WfDataObject()
+            wfoOut.setContainerTypeName("value")
+            wfoOut.setValueTypeName("integer")
+
+            pR = ProcessRunner(verbose=self.__verbose, log=self.__lfh)
+            pR.setTimingLogPath(timingLogPath)
+            pR.setInput("src", wfoInp)
+            pR.setOutput("dst", wfoOut)
+            self.assertTrue(pR.setAction("sizeof"))
+            self.assertTrue(pR.preCheck())
+            self.assertTrue(pR.run())
+            tD = pR.getTimings()
+            self.__lfh.write("Timings: %r\n" % tD)
+            for phase in ["registryLookup", "preCheck", "moduleImport", "pluginInit", "methodRun"]:
+                self.assertIn(phase, tD)
+                self.assertGreaterEqual(tD[phase]["WALL_SEC"], 0.0)
+            with open(timingLogPath, "r") as ifh:
+                rL = [json.loads(line) for line in ifh]
+            self.assertEqual(len(rL), 1)
+            self.assertEqual(rL[0]["ACTION_ID"], "sizeof")
+            self.assertTrue(rL[0]["STATUS"])
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testProfileCopyOp(self):
+        """Test profiling a file copy from archival to workflow instance storage."""
+        self.__lfh.write("\n------------------------ ")
+        self.__lfh.write("Starting test function  testProfileCopyOp")
+        self.__lfh.write(" -------------------------\n")
+        try:
+            wfoInp = WfDataObject()
+            wfoInp.setDepositionDataSetId(self.__depDataSetId)
+            wfoInp.setStorageType("archive")
+            wfoInp.setContentTypeAndFormat("model", "pdbx")
+            wfoInp.setVersionId("latest")
+
+            wfoOut = WfDataObject()
+            wfoOut.setDepositionDataSetId(self.__depDataSetId)
+            wfoOut.setWorkflowInstanceId(self.__wfInstanceId)
+            wfoOut.setStorageType("wf-instance")
+            wfoOut.setContentTypeAndFormat("model", "pdbx")
+            wfoOut.setVersionId(wfoInp.getFileVersionNumber())
+
+            pR = ProcessRunner(verbose=self.__verbose, log=self.__lfh)
+            pR.setInput("src", wfoOut)
+            self.assertTrue(pR.setAction("mkdir"))
+            self.assertTrue(pR.run())
+            self.assertEqual(pR.getProfilePaths(), [])
+
+            pR = ProcessRunner(verbose=self.__verbose, log=self.__lfh)
+            pR.setInput("src", wfoInp)
+            pR.setOutput("dst", wfoOut)
+            self.assertTrue(pR.setAction("copy"))
+            self.assertTrue(pR.setParameterDict({"_profile": "yes"}))
+            self.assertTrue(pR.run())
+            pathL = pR.getProfilePaths()
+            self.assertEqual(len(pathL), 2)
+            for pth in pathL:
+                self.assertTrue(os.path.exists(pth))
+                self.assertEqual(os.path.dirname(pth), wfoOut.getDirPathReference())
+                os.remove(pth)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testRetrySizeOfOp(self):
+        """Test the retry policy for obtaining the size of a missing archival data file."""
+        self.__lfh.write("\n------------------------ ")
+        self.__lfh.write("Starting test function  testRetrySizeOfOp")
+        self.__lfh.write(" -------------------------\n")
+        try:
+            wfoInp = WfDataObject()
+            wfoInp.setDepositionDataSetId(self.__depDataSetId)
+            wfoInp.setStorageType("archive")
+            wfoInp.setContentTypeAndFormat("model", "pdbx")
+            wfoInp.setVersionId(999)
+            wfoOut = WfDataObject()
+            wfoOut.setContainerTypeName("value")
+            wfoOut.setValueTypeName("integer")
+
+            pR = ProcessRunner(verbose=self.__verbose, log=self.__lfh)
+            pR.setInput("src", wfoInp)
+            pR.setOutput("dst", wfoOut)
+            self.assertTrue(pR.setAction("sizeof"))
+            self.assertEqual(pR.getRetryPolicy()["attempts"], 1)
+            self.assertFalse(pR.run())
+            self.assertEqual(len(pR.getAttempts()), 1)
+            #
+            pR.setRetryPolicy(attempts=3, backoff=0.01, retryOn=["failure"])
+            self.assertFalse(pR.run())
+            attemptL = pR.getAttempts()
+            self.assertEqual([aD["ATTEMPT"] for aD in attemptL], [1, 2, 3])
+            self.assertEqual(set(aD["FAILURE_KIND"] for aD in attemptL), set(["failure"]))
+            #
+            pR.setRetryPolicy(retryOn=["exception", "timeout"])
+            self.assertFalse(pR.run())
+            self.assertEqual(len(pR.getAttempts()), 1)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
 
 def suite():
     return unittest.makeSuite(ProcessRunnerTests, "test")
@@ -0,0 +1,205 @@
+##
+# File:    WfDataObjectTests.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw add bulk version resolution test
+# 16-Oct-2026 jdw add serialization test
+# 16-Oct-2026 jdw add float value type test
+# 16-Oct-2026 jdw add typed array list value test
+# 16-Oct-2026 jdw path memo cleared by setReferenceType() and not shared by fromDict() copies
+# 16-Oct-2026 jdw compare bulk version resolution with DataFileReference() including stray version names
+# 17-Oct-2026 jdw round trip an external file reference
+##
+"""
+Test cases for the workflow data object.
+
+"""
+import array
+import os
+import shutil
+import sys
+import unittest
+import traceback
+from datetime import date, datetime
+from unittest import mock
+
+if __package__ is None or __package__ == "":
+    from os import path
+
+    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
+    from commonsetup import TESTOUTPUT, mockTopPath  # pylint: disable=import-error,unused-import
+else:
+    from .commonsetup import TESTOUTPUT, mockTopPath  # noqa: F401
+
+from wwpdb.io.locator.DataReference import DataFileReference
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+
+
+class WfDataObjectTests(unittest.TestCase):
+    def setUp(self):
+        self.__lfh = sys.stderr
+        self.__sessionPath = os.path.join(TESTOUTPUT, "wfo-session")
+        if os.path.exists(self.__sessionPath):
+            shutil.rmtree(self.__sessionPath)
+        os.makedirs(self.__sessionPath)
+
+    def __getSessionObject(self, contentType, fileFormat, versionId, cls=WfDataObject):
+        wfo = cls()
+        wfo.setReferenceType("file")
+        wfo.setSessionDataSetId("D_000000001")
+        wfo.setStorageType("session")
+        wfo.setSessionPath(self.__sessionPath)
+        wfo.setContentTypeAndFormat(contentType, fileFormat)
+        wfo.setVersionId(versionId)
+        return wfo
+
+    def testPathMemo(self):
+        """Test memoized path references, invalidation by setters and refresh()."""
+        try:
+            wfo = self.__getSessionObject("model", "pdbx", "next")
+            fP = wfo.getFilePathReference()
+            self.assertTrue(fP.endswith(".V1"))
+            self.assertEqual(wfo.getDirPathReference(), self.__sessionPath)
+            with open(fP, "w") as ofh:
+                ofh.write("data_test\n")
+            # memoized until refreshed
+            self.assertEqual(wfo.getFilePathReference(), fP)
+            wfo.refresh()
+            self.assertTrue(wfo.getFilePathReference().endswith(".V2"))
+            # invalidated by identity setters
+            wfo.setVersionId("latest")
+            self.assertEqual(wfo.getFilePathReference(), fP)
+            wfo.setContentTypeAndFormat("model", "pdb")
+            self.assertNotEqual(wfo.getFilePathReference(), fP)
+            wfo.setSessionDataSetId("D_000000002")
+            self.assertIn("D_000000002", wfo.getFilePathReference())
+            wfo.setReferenceType("value")
+            self.assertFalse(wfo.isFilePathReferenceResolved())
+            # data objects built from the dictionary form do not share the memo
+            wfo1, wfo2 = WfDataObject.fromDict(wfo.toDict()), WfDataObject.fromDict(wfo.toDict())
+            wfo1.setResolvedFilePathReference(fP)
+            self.assertFalse(wfo2.isFilePathReferenceResolved())
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testResolveFilePathReferences(self):
+        """Test resolving symbolic versions of many file references from one directory scan."""
+        try:
+            for version in range(1, 4):
+                with open(self.__getSessionObject("model", "pdbx", version).getFilePathReference(), "w") as ofh:
+                    ofh.write("data_test\n")
+            with open(self.__getSessionObject("structure-factors", "pdbx", 1).getFilePathReference(), "w") as ofh:
+                ofh.write("data_test\n")
+            #
+            specL = [("model", "pdbx", "latest"), ("model", "pdbx", "next"), ("model", "pdbx", "previous"), ("model", "pdb", "latest"), ("model", "pdb", "previous")]
+            specL += [("structure-factors", "pdbx", "latest"), ("structure-factors", "pdbx", "previous"), ("model", "pdbx", 2)]
+            expectedL = [self.__getSessionObject(*spec, cls=DataFileReference).getFilePathReference() for spec in specL]
+            with mock.patch("os.scandir", wraps=os.scandir) as scandir:
+                wfoL = [self.__getSessionObject(*spec) for spec in specL]
+                self.assertEqual(WfDataObject.resolveFilePathReferences(wfoL), expectedL)
+                self.assertEqual(scandir.call_count, 1)
+            self.assertTrue(expectedL[0].endswith(".V3"))
+            self.assertTrue(expectedL[1].endswith(".V4"))
+            self.assertIsNone(expectedL[6])
+            self.assertEqual([wfo.getFilePathReference() for wfo in wfoL], expectedL)
+            #
+            # any name starting with the base name is a version (e.g. D_000000001_model_P1.cif-old.V9)
+            with open(expectedL[0][: -len(".V3")] + "-old.V9", "w") as ofh:
+                ofh.write("data_test\n")
+            expectedL = [self.__getSessionObject(*spec, cls=DataFileReference).getFilePathReference() for spec in specL[:3]]
+            self.assertEqual([os.path.splitext(fP)[1] for fP in expectedL], [".V9", ".V10", ".V8"])
+            self.assertEqual(WfDataObject.resolveFilePathReferences([self.__getSessionObject(*spec) for spec in specL[:3]]), expectedL)
+            self.assertEqual([self.__getSessionObject(*spec).getFilePathReference() for spec in specL[:3]], expectedL)
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testSerialization(self):
+        """Test dictionary and binary round trips of file reference, selector and value data objects."""
+        try:
+            wfo = self.__getSessionObject("model", "pdbx", "latest")
+            wfo.setSelectCategoryName("entity_poly")
+            wfo.addSelectAttributeName("pdbx_seq_one_letter_code")
+            wfo.addSelectCondition("entity_id", "1")
+            wfoL = [wfo]
+            wfo = WfDataObject()
+            wfo.setReferenceType("file")
+            wfo.setExternalFilePath(os.path.join(self.__sessionPath, "external.cif"), fileFormat="pdbx")
+            wfoL.append(wfo)
+            valueL = [("value", "datetime", datetime(2026, 10, 16, 12, 30, 5)), ("list", "date", [date(2026, 10, 16)]), ("dict", "string", {"a": "b"})]
+            valueL.append(("list", "float", array.array("d", [1.5, -2.0])))
+            for containerTypeName, valueTypeName, value in valueL:
+                wfo = WfDataObject()
+                wfo.setContainerTypeName(containerTypeName)
+                wfo.setValueTypeName(valueTypeName)
+                wfo.setValue(value)
+                wfoL.append(wfo)
+            #
+            for wfo in wfoL:
+                dataD = wfo.toDict()
+                for tObj in [WfDataObject.fromDict(dataD), WfDataObject.fromBytes(wfo.toBytes()), WfDataObject.fromBytes(wfo.toBytes(useMsgpack=False))]:
+                    self.assertEqual(tObj.toDict(), dataD)
+                    self.assertEqual(tObj.getFilePathReference(), wfo.getFilePathReference())
+                    self.assertEqual(tObj.getSelectConditionList(), wfo.getSelectConditionList())
+                    self.assertEqual(tObj.isValueValid(), wfo.isValueValid())
+                    self.assertEqual(tObj.isValueArray(), wfo.isValueArray())
+            self.assertIsInstance(WfDataObject.fromBytes(wfoL[2].toBytes(useMsgpack=False)).getValue(), datetime)
+            self.assertEqual(WfDataObject.fromDict(wfoL[1].toDict()).getFilePathReference(), os.path.join(self.__sessionPath, "external.cif"))
+            # objects built from the dictionary form do not share selections
+            self.assertEqual(WfDataObject.fromDict(WfDataObject().toDict()).getSelectAttributeList(), [])
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testFloatValueType(self):
+        """Test that float and double values validate against the float and double value types."""
+        try:
+            for valueTypeName in ["float", "double"]:
+                wfo = WfDataObject()
+                wfo.setContainerTypeName("list")
+                wfo.setValueTypeName(valueTypeName)
+                wfo.setValue([1.5, -2.0])
+                self.assertTrue(wfo.isValueValid())
+                wfo.setValue([1, 2])
+                self.assertFalse(wfo.isValueValid())
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+    def testValueArray(self):
+        """Test typed array storage of int, float and boolean list values."""
+        try:
+            for valueTypeName, valueList, expectedL in [("integer", ["1", "2", "-3"], [1, 2, -3]), ("float", ["1.5", 2], [1.5, 2.0]), ("boolean", ["y", "N", 1], [1, 0, 1])]:
+                for useNumpy in [False, None]:
+                    wfo = WfDataObject()
+                    wfo.setContainerTypeName("list")
+                    wfo.setValueTypeName(valueTypeName)
+                    self.assertTrue(wfo.setValueArray(valueList, useNumpy=useNumpy))
+                    self.assertTrue(wfo.isValueArray())
+                    self.assertTrue(wfo.isValueValid())
+                    self.assertEqual([int(v) if valueTypeName == "boolean" else v for v in wfo.getValue()], expectedL)
+            # values that do not convert and untyped lists keep the plain list value
+            self.assertFalse(wfo.setValueArray(["y", "?"]))
+            self.assertEqual(list(wfo.getValue()), [1, 0, 1])
+            wfo = WfDataObject()
+            wfo.setContainerTypeName("list")
+            wfo.setValueTypeName("string")
+            self.assertFalse(wfo.setValueArray(["a"]))
+            wfo.setValue(["a"])
+            self.assertFalse(wfo.isValueArray())
+            self.assertTrue(wfo.isValueValid())
+            # a typed array of the wrong type is not valid
+            wfo = WfDataObject()
+            wfo.setContainerTypeName("list")
+            wfo.setValueTypeName("integer")
+            wfo.setValue(array.array("d", [1.0]))
+            self.assertFalse(wfo.isValueValid())
+        except Exception as _e:  # noqa: F841
+            traceback.print_exc(file=self.__lfh)
+            self.fail()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+##
+# File:    CompactWfDataObject.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw share the attribute list of WfDataObject.toDict()
+# 16-Oct-2026 jdw literal slot names and compaction through WfDataObject.toDict()/fromDict()
+# 17-Oct-2026 jdw intern and convert slot values in one place for construction and unpickling
+# 17-Oct-2026 jdw drop the site identifier slot (not part of the dictionary form)
+##
+"""
+Compact representation of the workflow data object for holding large numbers of pending data objects.
+
+A WfDataObject() instance carries the site configuration, several per-instance lookup lists and
+a full instance dictionary.  CompactWfDataObject() keeps only the identifying state of the data
+object in slots, with the content type, file format, storage type and other enumerated names
+interned, and is expanded to a WfDataObject() with toWfDataObject() when the object is used.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+
+#
+# Slots holding names drawn from small vocabularies which are interned
+_INTERNED_SLOT_LIST = ["referenceType", "contentType", "fileFormat", "storageType", "versionId", "sessionPath", "selectorType", "containerTypeName", "valueTypeName"]
+#
+# Slots holding lists which are stored as tuples
+_LIST_SLOT_LIST = ["selectAttributeList", "selectConditionList"]
+
+
+def _intern(val):
+    return sys.intern(val) if isinstance(val, str) else val
+
+
+def _toTuple(valList):
+    return tuple(tuple(v) if isinstance(v, list) else v for v in valList or [])
+
+
+def _compactValue(slotName, val):
+    """Returns the input value of slot *slotName* interned or as a tuple as the slot requires."""
+    if slotName in _INTERNED_SLOT_LIST:
+        return _intern(val)
+    if slotName in _LIST_SLOT_LIST:
+        return _toTuple(val)
+    return val
+
+
+class CompactWfDataObject(object):
+
+    """Slotted container for the identifying state of a workflow data object.
+
+    The slots are the keys of the dictionary form of the data object (see WfDataObject.toDict()).
+
+    """
+
+    __slots__ = (
+        "referenceType",
+        "contentType",
+        "fileFormat",
+        "storageType",
+        "versionId",
+        "partitionNumber",
+        "depositionDataSetId",
+        "workflowInstanceId",
+        "workflowNameSpace",
+        "externalFilePath",
+        "sessionPath",
+        "sessionDataSetId",
+        "selectorType",
+        "selectCategoryName",
+        "selectAttributeList",
+        "selectConditionList",
+        "containerTypeName",
+        "valueTypeName",
+        "value",
+    )
+
+    def __init__(self, wfo=None):
+        """
+        :param wfo:  WfDataObject() instance to be compacted (default: an undefined data object)
+        """
+        dataD = (wfo if wfo is not None else WfDataObject()).toDict()
+        self.referenceType = _compactValue("referenceType", dataD["referenceType"])
+        self.contentType = _compactValue("contentType", dataD["contentType"])
+        self.fileFormat = _compactValue("fileFormat", dataD["fileFormat"])
+        self.storageType = _compactValue("storageType", dataD["storageType"])
+        self.versionId = _compactValue("versionId", dataD["versionId"])
+        self.partitionNumber = _compactValue("partitionNumber", dataD["partitionNumber"])
+        self.depositionDataSetId = _compactValue("depositionDataSetId", dataD["depositionDataSetId"])
+        self.workflowInstanceId = _compactValue("workflowInstanceId", dataD["workflowInstanceId"])
+        self.workflowNameSpace = _compactValue("workflowNameSpace", dataD["workflowNameSpace"])
+        self.externalFilePath = _compactValue("externalFilePath", dataD["externalFilePath"])
+        self.sessionPath = _compactValue("sessionPath", dataD["sessionPath"])
+        self.sessionDataSetId = _compactValue("sessionDataSetId", dataD["sessionDataSetId"])
+        self.selectorType = _compactValue("selectorType", dataD["selectorType"])
+        self.selectCategoryName = _compactValue("selectCategoryName", dataD["selectCategoryName"])
+        self.selectAttributeList = _compactValue("selectAttributeList", dataD["selectAttributeList"])
+        self.selectConditionList = _compactValue("selectConditionList", dataD["selectConditionList"])
+        self.containerTypeName = _compactValue("containerTypeName", dataD["containerTypeName"])
+        self.valueTypeName = _compactValue("valueTypeName", dataD["valueTypeName"])
+        self.value = _compactValue("value", dataD["value"])
+
+    def toDict(self):
+        """Returns:
+
+        Dictionary of the state of this data object (see WfDataObject.toDict()).
+        """
+        dataD = {slotName: getattr(self, slotName) for slotName in self.__slots__}
+        for slotName in _LIST_SLOT_LIST:
+            dataD[slotName] = [list(v) if isinstance(v, tuple) else v for v in dataD[slotName]]
+        return dataD
+
+    def toWfDataObject(self):
+        """Returns:
+
+        A new WfDataObject() instance with the state of this data object.
+        """
+        return WfDataObject.fromDict(self.toDict())
+
+    def getReferenceType(self):
+        return self.referenceType
+
+    def getContentType(self):
+        return self.contentType
+
+    def getFileFormat(self):
+        return self.fileFormat
+
+    def getStorageType(self):
+        return self.storageType
+
+    def getVersionId(self):
+        return self.versionId
+
+    def getPartitionNumber(self):
+        return self.partitionNumber
+
+    def getDepositionDataSetId(self):
+        return self.depositionDataSetId
+
+    def getWorkflowInstanceId(self):
+        return self.workflowInstanceId
+
+    def getContainerTypeName(self):
+        return self.containerTypeName
+
+    def getValueTypeName(self):
+        return self.valueTypeName
+
+    def getValue(self):
+        return self.value
+
+    def __getstate__(self):
+        return tuple(getattr(self, slotName) for slotName in self.__slots__)
+
+    def __setstate__(self, state):
+        for slotName, val in zip(self.__slots__, state):
+            setattr(self, slotName, _compactValue(slotName, val))
+
+    def __repr__(self):
+        return "CompactWfDataObject(%s)" % ", ".join("%s=%r" % (slotName, getattr(self, slotName)) for slotName in self.__slots__ if getattr(self, slotName) not in (None, ()))
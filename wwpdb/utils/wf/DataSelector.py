@@ -3,7 +3,7 @@
 # Date:    5-April-2010
 #
 # Updates:
-#
+# 17-Oct-2026 jdw add clearSelection()
 ##
 """
 Container for data selection criteria.
@@ -104,3 +104,10 @@ class DataSelector(object):
     def getSelectConditionList(self):
         """Get the list selection conditions."""
         return self.__selectConditionList
+
+    def clearSelection(self):
+        """Remove the category, attributes and conditions of the current selection."""
+        self.__selectorType = None
+        self.__targetCategoryName = None
+        self.__targetAttributeList = []
+        self.__selectConditionList = []
@@ -3,7 +3,8 @@
 # Date:    28-Mar-2010
 #
 # Updates:
-#
+# 16-Oct-2026 jdw map value type float/double to the Python float type
+# 16-Oct-2026 jdw add array-backed storage for int, float and boolean lists - setValueArray()
 ##
 """
 Container for data values.
@@ -15,11 +16,31 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import array
 from datetime import datetime, date
 
 # For python 2/3 compatible comparison with isinstace
 from builtins import str
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#
+# array.array type codes, NumPy data types and NumPy dtype kinds for typed list storage keyed by value type
+_ARRAY_TYPECODE_D = {bool: "b", int: "q", float: "d"}
+_NUMPY_DTYPE_D = {bool: "bool", int: "int64", float: "float64"}
+_NUMPY_KIND_D = {bool: "b", int: "iu", float: "f"}
+#
+_BOOLEAN_D = {"y": True, "yes": True, "true": True, "1": True, "n": False, "no": False, "false": False, "0": False}
+
+
+def _toBoolean(val):
+    if isinstance(val, (bool, int)) and val in (0, 1):
+        return bool(val)
+    return _BOOLEAN_D[str(val).strip().lower()]
+
 
 class DataValueContainer(object):
 
@@ -69,6 +90,10 @@ class DataValueContainer(object):
         True if value and container types correspond to the current type settings or False otherwise.
         """
         if self.__containerTypeName == "list":
+            if isinstance(self.__value, array.array):
+                return self.__value.typecode == _ARRAY_TYPECODE_D.get(self.__valueType)
+            if numpy is not None and isinstance(self.__value, numpy.ndarray):
+                return self.__value.ndim == 1 and self.__value.dtype.kind in _NUMPY_KIND_D.get(self.__valueType, "")
             if isinstance(self.__value, list):
                 for v in self.__value:
                     if not isinstance(v, self.__valueType):
@@ -104,6 +129,38 @@ class DataValueContainer(object):
     def getValue(self):
         return self.__value
 
+    def setValueArray(self, valueList, useNumpy=None):
+        """Set the value of a list container of boolean, int or float values as a typed array.
+        The array is a NumPy array if NumPy is available (and *useNumpy* is not False) or an
+        array.array otherwise.   Input values are converted to the value type -- numeric strings
+        are accepted and boolean values may be given as y/yes/true/1 or n/no/false/0.  Boolean
+        values in an array.array are stored as 0 or 1.
+
+        The container and value types must be set before the value.
+
+        Returns:
+
+        True if the values were stored as a typed array or False otherwise (the value is unchanged).
+        """
+        if self.__containerTypeName != "list" or self.__valueType not in _ARRAY_TYPECODE_D:
+            return False
+        convert = _toBoolean if self.__valueType is bool else self.__valueType
+        try:
+            if numpy is not None and useNumpy is not False:
+                self.__value = numpy.fromiter((convert(v) for v in valueList), dtype=_NUMPY_DTYPE_D[self.__valueType], count=len(valueList))
+            else:
+                self.__value = array.array(_ARRAY_TYPECODE_D[self.__valueType], (convert(v) for v in valueList))
+            return True
+        except (TypeError, ValueError, KeyError, OverflowError):
+            return False
+
+    def isValueArray(self):
+        """Returns:
+
+        True if the current value is stored as a typed array (see setValueArray()) or False otherwise.
+        """
+        return isinstance(self.__value, array.array) or (numpy is not None and isinstance(self.__value, numpy.ndarray))
+
     def setValueTypeName(self, typeName):
         """Set the data type name for the container.
 
@@ -126,7 +183,7 @@ class DataValueContainer(object):
             elif typeName == "integer" or typeName == "int":
                 self.__valueType = int
             elif typeName == "float" or typeName == "double":
-                self.__valueType = int
+                self.__valueType = float
             elif typeName == "string":
                 self.__valueType = str
             elif typeName == "date":
@@ -5,6 +5,17 @@
 # Updates:
 #    1-May-2015  jdw   add common output method
 #    7-Sep-2015  jdw   add __str__ and __repl__
+#   16-Oct-2026  jdw   add __getstate__/__setstate__ so data objects pickle without site configuration
+#   16-Oct-2026  jdw   memoize file and directory path references - add refresh()
+#   16-Oct-2026  jdw   add resolveFilePathReferences() resolving symbolic versions from one directory scan
+#   16-Oct-2026  jdw   add toDict()/fromDict() and toBytes()/fromBytes() for inter-process transport
+#   16-Oct-2026  jdw   encode typed array list values
+#   16-Oct-2026  jdw   initialize the path memo in __init__(), refresh it in setReferenceType() and add
+#                      isFilePathReferenceResolved()/setResolvedFilePathReference()
+#   16-Oct-2026  jdw   resolve symbolic versions of single and many data objects with the same version parsing
+#   17-Oct-2026  jdw   toDict()/fromDict() use the public getters and setters - add getExternalFilePath(),
+#                      getSessionPath() and getSessionDataSetId()
+#   17-Oct-2026  jdw   add updateFrom()
 #
 ##
 """
@@ -17,14 +28,151 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import array
+import bisect
+import copy
+import json
+import os
+import sys
+from datetime import date, datetime
+
 try:
     import cStringIO as StringIO
 except ImportError:
     import io as StringIO
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from wwpdb.utils.wf.DataSelector import DataSelector
 from wwpdb.io.locator.DataReference import DataFileReference
 from wwpdb.utils.wf.DataValueContainer import DataValueContainer
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+
+#
+# Attributes of DataFileReference() that are derived from the site configuration or
+# are process specific.  These are dropped when pickling and rebuilt on unpickling.
+_TRANSIENT_ATTRIBUTE_LIST = [
+    "_DataFileReference__cI",
+    "_DataFileReference__contentInfoD",
+    "_DataFileReference__formatExtensionD",
+    "_DataFileReference__lfh",
+    "_WfDataObject__pathD",
+]
+#
+# Leading byte of the binary encodings written by WfDataObject.toBytes()
+_MSGPACK_TAG = b"M"
+_JSON_TAG = b"J"
+#
+# msgpack extension type codes for date and datetime values
+_DATE_EXT_CODE = 1
+_DATETIME_EXT_CODE = 2
+_ARRAY_EXT_CODE = 3
+#
+# ConfigInfo() instances shared by unpickled data objects keyed by site identifier
+_configInfoD = {}
+#
+# Newly constructed data objects keyed by class (see WfDataObject.fromDict())
+_prototypeD = {}
+
+
+def _getConfigInfo(siteId):
+    if siteId not in _configInfoD:
+        _configInfoD[siteId] = ConfigInfo(siteId=siteId, verbose=False, log=sys.stderr)
+    return _configInfoD[siteId]
+
+
+def _getPrototype(cls):
+    if cls not in _prototypeD:
+        _prototypeD[cls] = cls()
+    return _prototypeD[cls]
+
+
+def _getVersionNumber(fileName, baseName):
+    """Returns the version number of *fileName* as a version of file *baseName* or None.   As in
+    DataFileReference(), a version is any name starting with *baseName* with digits after the first '.V'.
+    """
+    if not fileName.startswith(baseName):
+        return None
+    fSp = fileName.split(".V")
+    if len(fSp) < 2 or not fSp[1].isdigit():
+        return None
+    return int(fSp[1])
+
+
+def _toArray(obj):
+    """Returns the input typed list value (see DataValueContainer.setValueArray()) as an array.array or None for other values."""
+    if isinstance(obj, array.array):
+        return obj
+    if numpy is not None and isinstance(obj, numpy.ndarray) and obj.ndim == 1 and obj.dtype.kind in "biuf":
+        return array.array({"b": "b", "i": "q", "u": "q", "f": "d"}[obj.dtype.kind], obj.astype({"b": "int8", "i": "int64", "u": "int64", "f": "float64"}[obj.dtype.kind]).tobytes())
+    return None
+
+
+def _packArray(arr):
+    """Typecode followed by the little-endian array items."""
+    if sys.byteorder == "big":
+        arr = array.array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.typecode.encode("ascii") + arr.tobytes()
+
+
+def _unpackArray(data):
+    arr = array.array(data[:1].decode("ascii"))
+    arr.frombytes(data[1:])
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+
+def _msgpackDefault(obj):
+    arr = _toArray(obj)
+    if arr is not None:
+        return msgpack.ExtType(_ARRAY_EXT_CODE, _packArray(arr))
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(_DATETIME_EXT_CODE, obj.isoformat().encode("ascii"))
+    if isinstance(obj, date):
+        return msgpack.ExtType(_DATE_EXT_CODE, obj.isoformat().encode("ascii"))
+    raise TypeError("cannot serialize %r" % type(obj))
+
+
+def _msgpackExtHook(code, data):
+    if code == _DATETIME_EXT_CODE:
+        return datetime.fromisoformat(data.decode("ascii"))
+    if code == _DATE_EXT_CODE:
+        return date.fromisoformat(data.decode("ascii"))
+    if code == _ARRAY_EXT_CODE:
+        return _unpackArray(data)
+    return msgpack.ExtType(code, data)
+
+
+def _jsonDefault(obj):
+    arr = _toArray(obj)
+    if arr is not None:
+        return {"__array__": arr.typecode, "data": arr.tolist()}
+    if isinstance(obj, datetime):
+        return {"__datetime__": obj.isoformat()}
+    if isinstance(obj, date):
+        return {"__date__": obj.isoformat()}
+    raise TypeError("cannot serialize %r" % type(obj))
+
+
+def _jsonObjectHook(objD):
+    if len(objD) == 1:
+        if "__datetime__" in objD:
+            return datetime.fromisoformat(objD["__datetime__"])
+        if "__date__" in objD:
+            return date.fromisoformat(objD["__date__"])
+    if len(objD) == 2 and "__array__" in objD:
+        return array.array(objD["__array__"], objD["data"])
+    return objD
 
 
 class WfDataObject(DataSelector, DataValueContainer, DataFileReference):
@@ -38,11 +186,13 @@ class WfDataObject(DataSelector, DataValueContainer, DataFileReference):
 
     """
 
-    # Inherit base __init__
-    # def __init__(self):
-    #    super(WfDataObject, self).__init__()
-    # self.__verbose = False
-    # sys.stderr.write("WfDataObject.__init_()\n")
+    def __init__(self):
+        super(WfDataObject, self).__init__()
+        self.__pathD = {}
+        # settings of the file reference without public getters in DataFileReference()
+        self.__externalFilePath = None
+        self.__sessionPath = None
+        self.__sessionDataSetId = None
 
     def printMe(self, ofh):
         if self.getReferenceType() in ["file"]:
@@ -83,6 +233,303 @@ class WfDataObject(DataSelector, DataValueContainer, DataFileReference):
         output.close()
         return contents
 
+    def refresh(self):
+        """Discard the memoized file and directory path references.  Paths are resolved again on
+        the next request, e.g. to pick up a new latest version of a file written externally.
+        """
+        self.__pathD = {}
+
+    def __getPath(self, pathType, getter):
+        if pathType not in self.__pathD:
+            self.__pathD[pathType] = getter()
+        return self.__pathD[pathType]
+
+    def isFilePathReferenceResolved(self):
+        """Returns:
+
+        True if the file path reference is memoized (see getFilePathReference()) or False otherwise.
+        """
+        return "file" in self.__pathD
+
+    def setResolvedFilePathReference(self, filePath):
+        """Memoize the input file path as the file path reference -- e.g. a path resolved for many
+        data objects at once (see resolveFilePathReferences()).
+        """
+        self.__pathD["file"] = filePath
+
+    def getFilePathReference(self):
+        """Get the versioned file path for an internal data file reference or the path to an external
+        data file reference.  The path is resolved on first request and memoized until an identifying
+        attribute of the reference is changed or refresh() is called.   Symbolic versions are resolved
+        as in resolveFilePathReferences().
+        """
+        if "file" not in self.__pathD:
+            self.__resolveVersions([self])
+        return self.__getPath("file", super(WfDataObject, self).getFilePathReference)
+
+    def getDirPathReference(self):
+        """Get the path to the directory containing the data file reference (memoized as getFilePathReference())."""
+        return self.__getPath("dir", super(WfDataObject, self).getDirPathReference)
+
+    @classmethod
+    def resolveFilePathReferences(cls, wfoList):
+        """Resolve the file path references of the input data objects, reading each directory holding
+        file references with a *latest*, *next* or *previous* version once.   The resolved paths are
+        memoized on the data objects (see getFilePathReference()).
+
+        Returns:
+
+        The list of file path references in the order of the input data objects.
+        """
+        cls.__resolveVersions(wfoList)
+        return [wfo.getFilePathReference() for wfo in wfoList]
+
+    @classmethod
+    def __resolveVersions(cls, wfoList):
+        """Memoize the file path references of the input data objects with a *latest*, *next* or *previous* version."""
+        pendingD = {}
+        for wfo in wfoList:
+            versionId = wfo.getVersionId()
+            if wfo.getReferenceType() != "file" or versionId not in ["latest", "next", "previous"] or not isinstance(wfo.getPartitionNumber(), int):
+                continue
+            if wfo.getExternalFilePath() is not None:
+                continue
+            if wfo.isFilePathReferenceResolved() or not wfo.isReferenceValid():
+                continue
+            searchTarget = wfo.getVersionIdSearchTarget()
+            dirPath = wfo.getDirPathReference()
+            if searchTarget is None or dirPath is None:
+                continue
+            pendingD.setdefault(dirPath, []).append((wfo, searchTarget[: -len(".V*")], versionId))
+        #
+        for dirPath, pendingL in pendingD.items():
+            try:
+                with os.scandir(dirPath) as it:
+                    fileNameL = sorted(entry.name for entry in it)
+            except OSError:
+                fileNameL = []
+            latestD = {}
+            for _, baseName, _ in pendingL:
+                if baseName not in latestD:
+                    # names starting with the base name sort together
+                    vL = [0]
+                    for fileName in fileNameL[bisect.bisect_left(fileNameL, baseName) :]:
+                        if not fileName.startswith(baseName):
+                            break
+                        vL.append(_getVersionNumber(fileName, baseName) or 0)
+                    latestD[baseName] = max(vL)
+            for wfo, baseName, versionId in pendingL:
+                iV = latestD[baseName]
+                if versionId == "latest":
+                    fP = os.path.join(dirPath, "%s.V%d" % (baseName, max(iV, 1)))
+                elif versionId == "next":
+                    fP = os.path.join(dirPath, "%s.V%d" % (baseName, iV + 1))
+                else:
+                    fP = os.path.join(dirPath, "%s.V%d" % (baseName, iV - 1)) if iV > 1 else None
+                wfo.setResolvedFilePathReference(fP)
+
+    #
+    # Setters of the identifying attributes of the file reference invalidate the memoized paths
+    #
+    def setReferenceType(self, refType):
+        self.refresh()
+        return super(WfDataObject, self).setReferenceType(refType)
+
+    def setExternalFilePath(self, filePath, fileFormat="any"):
+        self.refresh()
+        ok = super(WfDataObject, self).setExternalFilePath(filePath, fileFormat=fileFormat)
+        if ok:
+            self.__externalFilePath = filePath
+        return ok
+
+    def getExternalFilePath(self):
+        """Returns:
+
+        The external file path as set by setExternalFilePath() or *None* if this is not set.
+        """
+        return self.__externalFilePath
+
+    def setContentTypeAndFormat(self, contentType, fileFormat):
+        self.refresh()
+        return super(WfDataObject, self).setContentTypeAndFormat(contentType, fileFormat)
+
+    def setStorageType(self, storageType):
+        self.refresh()
+        return super(WfDataObject, self).setStorageType(storageType)
+
+    def setVersionId(self, versionId):
+        self.refresh()
+        return super(WfDataObject, self).setVersionId(versionId)
+
+    def setPartitionNumber(self, iPartitionNumber=1):
+        self.refresh()
+        return super(WfDataObject, self).setPartitionNumber(iPartitionNumber)
+
+    def setDepositionDataSetId(self, dId):
+        self.refresh()
+        return super(WfDataObject, self).setDepositionDataSetId(dId)
+
+    def setWorkflowInstanceId(self, wId):
+        self.refresh()
+        return super(WfDataObject, self).setWorkflowInstanceId(wId)
+
+    def setWorkflowNameSpace(self, wNameSpace):
+        self.refresh()
+        return super(WfDataObject, self).setWorkflowNameSpace(wNameSpace)
+
+    def setSessionDataSetId(self, sId):
+        self.refresh()
+        ok = super(WfDataObject, self).setSessionDataSetId(sId)
+        if ok:
+            self.__sessionDataSetId = sId
+        return ok
+
+    def getSessionDataSetId(self):
+        """Returns:
+
+        The session data set identifier as set by setSessionDataSetId() or *None* if this is not set.
+        """
+        return self.__sessionDataSetId
+
+    def setSessionPath(self, dirPath=None):
+        self.refresh()
+        ok = super(WfDataObject, self).setSessionPath(dirPath)
+        if ok:
+            self.__sessionPath = dirPath
+        return ok
+
+    def getSessionPath(self):
+        """Returns:
+
+        The session directory path as set by setSessionPath() or *None* if this is not set.
+        """
+        return self.__sessionPath
+
+    def toDict(self):
+        """Returns:
+
+        Dictionary of the identifying state of the data object -- the file reference, the selector and
+        the value container -- read with the public getters.  The data value is included as is (not copied).
+        """
+        return {
+            "referenceType": self.getReferenceType(),
+            "contentType": self.getContentType(),
+            "fileFormat": self.getFileFormat(),
+            "storageType": self.getStorageType(),
+            "versionId": self.getVersionId(),
+            "partitionNumber": self.getPartitionNumber(),
+            "depositionDataSetId": self.getDepositionDataSetId(),
+            "workflowInstanceId": self.getWorkflowInstanceId(),
+            "workflowNameSpace": self.getWorkflowNameSpace(),
+            "externalFilePath": self.getExternalFilePath(),
+            "sessionPath": self.getSessionPath(),
+            "sessionDataSetId": self.getSessionDataSetId(),
+            "selectorType": self.getSelectorType(),
+            "selectCategoryName": self.getSelectCategoryName(),
+            "selectAttributeList": list(self.getSelectAttributeList()),
+            "selectConditionList": [list(cond) for cond in self.getSelectConditionList()],
+            "containerTypeName": self.getContainerTypeName(),
+            "valueTypeName": self.getValueTypeName(),
+            "value": self.getValue(),
+        }
+
+    @classmethod
+    def fromDict(cls, dataD):
+        """Build a data object from its dictionary form with the public setters.   The new object is a copy
+        of a prototype data object, so the site configuration is read once per process.  The selector type
+        follows from the selected attributes and the reference type is set last, since setting a content
+        type or storage type makes the object a file reference.
+
+        Returns:
+
+        A new data object with the state in the input dictionary (see toDict()).
+        """
+        wfo = copy.copy(_getPrototype(cls))
+        wfo.clearSelection()
+        if dataD.get("externalFilePath") is not None:
+            wfo.setExternalFilePath(dataD["externalFilePath"], dataD.get("fileFormat") or "any")
+        if dataD.get("contentType") is not None:
+            wfo.setContentTypeAndFormat(dataD["contentType"], dataD.get("fileFormat"))
+        for ky, setter in [
+            ("storageType", wfo.setStorageType),
+            ("versionId", wfo.setVersionId),
+            ("partitionNumber", wfo.setPartitionNumber),
+            ("depositionDataSetId", wfo.setDepositionDataSetId),
+            ("workflowInstanceId", wfo.setWorkflowInstanceId),
+            ("workflowNameSpace", wfo.setWorkflowNameSpace),
+            ("sessionPath", wfo.setSessionPath),
+            ("sessionDataSetId", wfo.setSessionDataSetId),
+            ("selectCategoryName", wfo.setSelectCategoryName),
+            ("containerTypeName", wfo.setContainerTypeName),
+            ("valueTypeName", wfo.setValueTypeName),
+        ]:
+            if dataD.get(ky) is not None:
+                setter(dataD[ky])
+        for attributeName in dataD.get("selectAttributeList") or []:
+            wfo.addSelectAttributeName(attributeName)
+        for cond in dataD.get("selectConditionList") or []:
+            wfo.addSelectCondition(*cond)
+        wfo.setValue(dataD.get("value"))
+        wfo.setReferenceType(dataD.get("referenceType"))
+        return wfo
+
+    def toBytes(self, useMsgpack=None):
+        """Encode the data object (see toDict()) as msgpack or, if msgpack is not installed or
+        *useMsgpack* is False, as JSON.   Date and datetime values are tagged and restored by fromBytes().
+        Typed array list values (see setValueArray()) are restored as array.array instances.
+        Dictionary values with non-string keys require msgpack.
+
+        Returns:
+
+        Encoded data object.
+        """
+        if useMsgpack is None:
+            useMsgpack = msgpack is not None
+        if useMsgpack:
+            return _MSGPACK_TAG + msgpack.packb(self.toDict(), default=_msgpackDefault, use_bin_type=True)
+        return _JSON_TAG + json.dumps(self.toDict(), default=_jsonDefault, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def fromBytes(cls, data):
+        """Returns:
+
+        A new data object decoded from the output of toBytes().
+        """
+        tag, body = data[:1], data[1:]
+        if tag == _MSGPACK_TAG:
+            if msgpack is None:
+                raise ValueError("msgpack encoded data object but msgpack is not installed")
+            return cls.fromDict(msgpack.unpackb(body, ext_hook=_msgpackExtHook, raw=False, strict_map_key=False))
+        if tag == _JSON_TAG:
+            return cls.fromDict(json.loads(body.decode("utf-8"), object_hook=_jsonObjectHook))
+        raise ValueError("unrecognized data object encoding %r" % tag)
+
+    def updateFrom(self, wfo):
+        """Copy the identifying state of the input data object (e.g. a copy returned from another process)
+        onto this data object -- the file reference, the selector and the value container.  The site
+        configuration of this data object is kept and the memoized paths are discarded.
+        """
+        self.__dict__.update(wfo.__getstate__())
+        self.refresh()
+
+    def __getstate__(self):
+        """Pickle only the identifying state of the data object.  The site configuration
+        and log stream are not picklable and are rebuilt by __setstate__().
+        """
+        stateD = self.__dict__.copy()
+        for ky in _TRANSIENT_ATTRIBUTE_LIST:
+            stateD.pop(ky, None)
+        return stateD
+
+    def __setstate__(self, stateD):
+        self.__dict__.update(stateD)
+        cI = _getConfigInfo(stateD.get("_DataFileReference__siteId"))
+        self.__dict__["_DataFileReference__cI"] = cI
+        self.__dict__["_DataFileReference__contentInfoD"] = cI.get("CONTENT_TYPE_DICTIONARY")
+        self.__dict__["_DataFileReference__formatExtensionD"] = cI.get("FILE_FORMAT_EXTENSION_DICTIONARY")
+        self.__dict__["_DataFileReference__lfh"] = sys.stderr
+        self.__pathD = {}
+
 
 if __name__ == "__main__":
     wfd = WfDataObject()
@@ -41,7 +41,8 @@ try:
 except ImportError:
     pass
 
-
+# Process-wide on purpose -- the NMR libraries print to stdout from every method, and a
+# per-call redirect is not safe when plugin methods run concurrently on pipeline threads.
 sys.stdout = sys.stderr
 
 
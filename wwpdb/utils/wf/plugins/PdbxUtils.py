@@ -5,6 +5,8 @@
 # Updates:
 # 24-April-2010  jdw statusOp method to return a dictionary of common status items.
 #  9-May-2024    zf  add fetchAnnAutoOp
+# 16-Oct-2026   jdw use the LogSink() set by UtilsBase
+# 16-Oct-2026   jdw add fetchArrayOp returning int, float and boolean lists as typed arrays
 #
 ##
 """
@@ -80,7 +82,6 @@ class PdbxUtils(UtilsBase):
         self.__targetBlockName = None
         self.__targetBlockIndex = 0
         self.__cifFile = None
-        self._lfh = log
 
     def __getBlock(self, pdbxPath):
         """Open the input PDBx file and set the target data block.
@@ -163,7 +164,7 @@ class PdbxUtils(UtilsBase):
 
         return False
 
-    def __templateFetchAttribute(self, kwD):
+    def __templateFetchAttribute(self, kwD, asArray=False):
         """Template fetch column method.
 
         This method supports recovering the values of an attribute (or column of attributes).
@@ -172,7 +173,8 @@ class PdbxUtils(UtilsBase):
         - targetCategoryName  name of the target category
         - targetAttributeName name of the target attribute
 
-        Only container types *list* and *value* are support.
+        Only container types *list* and *value* are support.  If *asArray* is set, lists of int,
+        float and boolean values are returned as typed arrays (see DataValueContainer.setValueArray()).
         """
         try:
             (inpObjD, outObjD, _uD, _pD) = self._getArgs(kwD)
@@ -195,7 +197,8 @@ class PdbxUtils(UtilsBase):
             if outObjD["dst"].getContainerTypeName() == "value":
                 outObjD["dst"].setValue(rList[0])
             elif outObjD["dst"].getContainerTypeName() == "list":
-                outObjD["dst"].setValue(rList)
+                if not asArray or not outObjD["dst"].setValueArray(rList):
+                    outObjD["dst"].setValue(rList)
             else:
                 return False
             #
@@ -311,6 +314,9 @@ class PdbxUtils(UtilsBase):
     def fetchOp(self, **kwArgs):
         return self.__templateFetchAttribute(kwArgs)
 
+    def fetchArrayOp(self, **kwArgs):
+        return self.__templateFetchAttribute(kwArgs, asArray=True)
+
     def fetchAnnAutoOp(self, **kwArgs):
         return self.__templateFetchAnnAuto(kwArgs)
 
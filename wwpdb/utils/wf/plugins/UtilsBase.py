@@ -3,7 +3,8 @@
 # Date:    8-April-2010
 #
 # Updates:
-#
+# 16-Oct-2026 jdw log through a LogSink() with deferred message formatting
+# 17-Oct-2026 jdw standard stream logs are buffered and other file handles are written through
 ##
 """
 Module containing the base class describing the call interface for methods callable
@@ -19,6 +20,8 @@ __version__ = "V0.01"
 
 import sys
 
+from wwpdb.utils.wf.process.LogSink import getLogSink
+
 
 class UtilsBase(object):
 
@@ -33,11 +36,15 @@ class UtilsBase(object):
     Each method in the class handles its own exceptions and returns
     True on success or False otherwise.
 
+    The log stream `_lfh` is a `LogSink` -- the standard output and error streams are buffered
+    and other file handles passed as *log* are written through.
+    Messages written with `_lfh.debug()` are only formatted in verbose mode.
+
     """
 
     def __init__(self, verbose=True, log=sys.stderr):
         self._verbose = verbose
-        self._lfh = log
+        self._lfh = getLogSink(log, verbose)
 
     def _getArgs(self, kwD):
         """Extract the keyword arguments used by methods in this class."""
@@ -49,4 +56,4 @@ class UtilsBase(object):
 
     def dumpArgs(self, kwD):
         for k, v in kwD.items():
-            self._lfh.write("+UtilsBase.dumArgs() key: %s  value: %r \n" % (k, v))
+            self._lfh.info("+UtilsBase.dumArgs() key: %s  value: %r ", k, v)
@@ -6,6 +6,14 @@
 #
 # 21-Apr-2010 jdw Added method getActions()
 #  7-Sep-2015 jdw Return names in parse order -
+# 16-Oct-2026 jdw Add getActionValidator() returning compiled action type requirements
+# 16-Oct-2026 jdw Add getResourceLimitDict()
+# 16-Oct-2026 jdw Add getRetryPolicyDict()
+# 16-Oct-2026 jdw Add optional registry file path and process-wide shared registry getSharedActionRegistry()
+# 16-Oct-2026 jdw Add lazy mode parsing action definitions on first access
+# 16-Oct-2026 jdw Add useCache option
+# 16-Oct-2026 jdw Add reverse indexes of actions by plugin module, data object content type/format and parameter name
+# 16-Oct-2026 jdw Add scheduling hint getters
 ##
 """
 Repository for process action definitions.
@@ -17,11 +25,49 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import os
 import sys
+import threading
 import traceback
 from wwpdb.utils.wf.process.ActionRegistryIo import ActionRegistryIo
+from wwpdb.utils.wf.process.ActionValidator import ActionValidator
 from wwpdb.utils.config.ConfigInfo import ConfigInfo
 
+#
+# Process-wide shared registries -  registry file path -> (file signature, ActionRegistry instance)
+_sharedRegistryD = {}
+_sharedRegistryPathD = {}
+_sharedLock = threading.Lock()
+#
+# Environment variable (yes/true/1) selecting lazy registry loading by default
+LAZY_ENV_NAME = "WWPDB_ACTION_REGISTRY_LAZY"
+
+
+def getSharedActionRegistry(filePath=None):
+    """Return the process-wide shared ActionRegistry() instance for the input registry file path
+    or for the registry file of the current site (SITE_REGISTRY_FILE_PATH).
+
+    The registry file is parsed on first request and parsed again only when its modification time,
+    size or inode changes.  A reload replaces the shared instance, so instances already in use are
+    unaffected.   Callers must not modify the shared instance (e.g. with setUserParameter()).
+    """
+    with _sharedLock:
+        if filePath is None:
+            siteId = os.getenv("WWPDB_SITE_ID")
+            if siteId not in _sharedRegistryPathD:
+                _sharedRegistryPathD[siteId] = ConfigInfo().get("SITE_REGISTRY_FILE_PATH")
+            filePath = _sharedRegistryPathD[siteId]
+        try:
+            st = os.stat(filePath)
+            sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except (OSError, TypeError):
+            sig = None
+        tup = _sharedRegistryD.get(filePath)
+        if tup is None or tup[0] != sig:
+            tup = (sig, ActionRegistry(filePath=filePath))
+            _sharedRegistryD[filePath] = tup
+        return tup[1]
+
 
 class ActionRegistry(object):
 
@@ -37,6 +83,9 @@ class ActionRegistry(object):
         the action method.
       + INTERNAL_PARAMETER_DICTIONARY,  container for internal parameters passed to
         the action method.
+      + RESOURCE_LIMIT_DICT,  optional limits on wall-clock time, CPU time and address space
+        for the action method.
+      + RETRY_POLICY_DICT,  optional policy for retrying failed invocations of the action method.
       + MODULE_NAME,   Python module(class) name containing the target method
       + METHOD_NAME,   Python method name
 
@@ -46,11 +95,23 @@ class ActionRegistry(object):
 
     """
 
-    def __init__(self):
-        self.__cI = ConfigInfo()
-        regPath = self.__cI.get("SITE_REGISTRY_FILE_PATH")
-        aR = ActionRegistryIo(filePath=regPath)
+    def __init__(self, filePath=None, lazy=None, useCache=True):
+        """
+        :param filePath: registry file path (default: SITE_REGISTRY_FILE_PATH of the current site)
+        :param lazy:     parse each action definition on first access (default: environment variable WWPDB_ACTION_REGISTRY_LAZY)
+        :param useCache: load and store the compiled registry cache (see ActionRegistryIo)
+
+        See getSharedActionRegistry() for a shared instance parsed once per process.
+        """
+        if filePath is None:
+            filePath = ConfigInfo().get("SITE_REGISTRY_FILE_PATH")
+        if lazy is None:
+            lazy = os.getenv(LAZY_ENV_NAME, "").lower() in ("yes", "y", "true", "1")
+        aR = ActionRegistryIo(filePath=filePath, useCache=useCache, lazy=lazy)
         self.__D = aR.getRegistry()
+        self.__validatorD = {}
+        self.__indexD = None
+        self.__indexLock = threading.Lock()
 
     def getActions(self):
         """Returns:
@@ -74,6 +135,90 @@ class ActionRegistry(object):
         else:
             return False
 
+    def getActionValidator(self, actionId):
+        """Returns:
+
+        The compiled type requirements (`ActionValidator`) for the input action identifier.
+        Validators are compiled on first request and reused thereafter.
+        """
+        try:
+            return self.__validatorD[actionId]
+        except KeyError:
+            aV = ActionValidator(self, actionId)
+            self.__validatorD[actionId] = aV
+            return aV
+
+    def __getIndex(self):
+        """Build the reverse indexes on first use -- the registry is scanned once (in lazy mode all actions are parsed).
+
+        Index keys are:
+
+        - ("module", moduleName) and ("module", className)
+        - ("input" | "output", contentType, fileFormat), with None in place of either value for partial matches
+        - ("parameter", parameterName) for user and internal parameters
+        """
+        if self.__indexD is not None:
+            return self.__indexD
+        with self.__indexLock:
+            if self.__indexD is not None:
+                return self.__indexD
+            iD = {}
+            for actionId in self.getActions():
+                rD = self.__D[actionId]
+                kyL = []
+                moduleName = rD["MODULE_NAME"]
+                if moduleName is not None:
+                    kyL.extend([("module", moduleName), ("module", moduleName.split(".")[-1])])
+                for ioKy, infoKy in (("input", "INPUT_INFO_LIST"), ("output", "OUTPUT_INFO_LIST")):
+                    for tD in rD[infoKy].values():
+                        contentType, fileFormat = tD["contentType"], tD["fileFormat"]
+                        if contentType is None and fileFormat is None:
+                            continue
+                        kyL.extend([(ioKy, contentType, fileFormat), (ioKy, contentType, None), (ioKy, None, fileFormat)])
+                for paramKy in ("USER_PARAMETER_DICT", "INTERNAL_PARAMETER_DICT"):
+                    kyL.extend([("parameter", name) for name in rD[paramKy]])
+                for ky in kyL:
+                    aL = iD.setdefault(ky, [])
+                    if not aL or aL[-1] != actionId:
+                        aL.append(actionId)
+            self.__indexD = iD
+        return self.__indexD
+
+    def getActionsByModule(self, moduleName):
+        """Returns:
+
+        List of action identifiers implemented in the input plugin module (full module path or class name)
+        in registry order.
+        """
+        return list(self.__getIndex().get(("module", moduleName), []))
+
+    def getActionsByInput(self, contentType=None, fileFormat=None):
+        """Returns:
+
+        List of action identifiers with an input data object of the input content type and file format
+        in registry order.  A content type or file format of None matches any value.
+        """
+        if contentType is None and fileFormat is None:
+            return [actionId for actionId in self.getActions() if self.__D[actionId]["INPUT_INFO_LIST"]]
+        return list(self.__getIndex().get(("input", contentType, fileFormat), []))
+
+    def getActionsByOutput(self, contentType=None, fileFormat=None):
+        """Returns:
+
+        List of action identifiers with an output data object of the input content type and file format
+        in registry order.  A content type or file format of None matches any value.
+        """
+        if contentType is None and fileFormat is None:
+            return [actionId for actionId in self.getActions() if self.__D[actionId]["OUTPUT_INFO_LIST"]]
+        return list(self.__getIndex().get(("output", contentType, fileFormat), []))
+
+    def getActionsByParameter(self, paramName):
+        """Returns:
+
+        List of action identifiers with a user or internal parameter of the input name in registry order.
+        """
+        return list(self.__getIndex().get(("parameter", paramName), []))
+
     def getMethodName(self, actionId):
         """Returns:
 
@@ -121,6 +266,79 @@ class ActionRegistry(object):
         except Exception as _e:  # noqa: F841
             return {}
 
+    def getResourceLimitDict(self, actionId):
+        """Returns:
+
+        The resource limit dictionary (wallTime, cpuTime, addressSpace) for the input action
+        identifier or {} if the action is not defined or declares no limits.
+        """
+
+        try:
+            return self.__D[actionId]["RESOURCE_LIMIT_DICT"]
+        except Exception as _e:  # noqa: F841
+            return {}
+
+    def getRetryPolicyDict(self, actionId):
+        """Returns:
+
+        The retry policy dictionary (attempts, backoff, backoffFactor, maxBackoff, retryOn) for the
+        input action identifier or {} if the action is not defined or declares no policy.
+        """
+
+        try:
+            return self.__D[actionId]["RETRY_POLICY_DICT"]
+        except Exception as _e:  # noqa: F841
+            return {}
+
+    def getHintDict(self, actionId):
+        """Returns:
+
+        The scheduling hint dictionary (cpuCores, peakMemory, runtime, parallelSafe, cacheable) for the
+        input action identifier or {} if the action is not defined or declares no hints.
+        """
+
+        try:
+            return self.__D[actionId]["HINT_DICT"]
+        except Exception as _e:  # noqa: F841
+            return {}
+
+    def getCpuCores(self, actionId, default=1):
+        """Returns:
+
+        The expected number of CPU cores used by the input action or *default* if not declared.
+        """
+        return self.getHintDict(actionId).get("cpuCores", default)
+
+    def getPeakMemory(self, actionId, default=None):
+        """Returns:
+
+        The expected peak memory (bytes) of the input action or *default* if not declared.
+        """
+        return self.getHintDict(actionId).get("peakMemory", default)
+
+    def getTypicalRuntime(self, actionId, default=None):
+        """Returns:
+
+        The typical runtime (seconds) of the input action or *default* if not declared.
+        """
+        return self.getHintDict(actionId).get("runtime", default)
+
+    def isParallelSafe(self, actionId, default=False):
+        """Returns:
+
+        True if the input action may run in parallel with other actions on the same entry,
+        False if not, or *default* if not declared.
+        """
+        return self.getHintDict(actionId).get("parallelSafe", default)
+
+    def isCacheable(self, actionId, default=None):
+        """Returns:
+
+        True if the results of the input action are deterministic and may be cached, False if not,
+        or *default* if not declared.
+        """
+        return self.getHintDict(actionId).get("cacheable", default)
+
     def getInputObjectCount(self, actionId):
         """Returns:
 
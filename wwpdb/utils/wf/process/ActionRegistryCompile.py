@@ -0,0 +1,78 @@
+##
+# File:    ActionRegistryCompile.py
+# Date:    16-Oct-2026
+#
+# Updates:
+#
+##
+"""
+Compile the action registry file and verify that every action resolves to a plugin class and method.
+
+The compiled registry is written to the registry cache file (<registry>.cache) read by `ActionRegistryIo`,
+so a deployment may ship the compiled registry and skip parsing the registry file at startup.  The
+compiled registry is not written if any action fails verification.
+
+Usage::
+
+    wwpdb_wf_compile_registry [--registry actionData.xml] [--output actionData.xml.cache] [--verify_only]
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import argparse
+import sys
+
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.wf.process.ActionRegistry import ActionRegistry
+from wwpdb.utils.wf.process.ActionRegistryIo import ActionRegistryIo
+from wwpdb.utils.wf.process.ProcessRunner import ProcessRunner
+
+
+def compileRegistry(filePath=None, outputPath=None, verify=True, write=True, verbose=False, log=sys.stderr):
+    """Parse the input registry file (default: SITE_REGISTRY_FILE_PATH of the current site), check that
+    each action resolves to a plugin class and method and write the compiled registry to *outputPath*
+    (default: the registry cache file).
+
+    Returns:
+
+    Tuple of (status, dictionary of error text keyed by action identifier).
+    """
+    if filePath is None:
+        filePath = ConfigInfo().get("SITE_REGISTRY_FILE_PATH")
+    aR = ActionRegistryIo(filePath=filePath, useCache=False, verbose=verbose, log=log)
+    if not aR.getRegistry():
+        return False, {None: "no actions read from registry file %s\n" % filePath}
+    errD = ProcessRunner.checkDispatch(ActionRegistry(filePath=filePath, lazy=False, useCache=False)) if verify else {}
+    if verbose:
+        for actionId, err in errD.items():
+            log.write("+ActionRegistryCompile.compileRegistry() action %s %s" % (actionId, err))
+    if errD:
+        return False, errD
+    if write and not aR.writeCache(outputPath):
+        return False, {None: "compiled registry write failed for %s\n" % (outputPath if outputPath else aR.getCacheFilePath())}
+    if verbose:
+        log.write("+ActionRegistryCompile.compileRegistry() %d actions compiled from %s\n" % (len(aR.getRegistry()), filePath))
+    return True, errD
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the action registry and verify the plugin class and method of each action")
+    parser.add_argument("--registry", dest="filePath", default=None, help="registry file path (default: site registry)")
+    parser.add_argument("--output", dest="outputPath", default=None, help="compiled registry file path (default: <registry>.cache)")
+    parser.add_argument("--verify_only", dest="verifyOnly", action="store_true", default=False, help="verify the registry without writing the compiled registry")
+    parser.add_argument("--skip_verify", dest="skipVerify", action="store_true", default=False, help="write the compiled registry without verifying the plugins")
+    parser.add_argument("--verbose", dest="verbose", action="store_true", default=False, help="verbose output")
+    args = parser.parse_args()
+    #
+    ok, errD = compileRegistry(args.filePath, outputPath=args.outputPath, verify=not args.skipVerify, write=not args.verifyOnly, verbose=args.verbose)
+    for actionId, err in errD.items():
+        sys.stderr.write("%s: %s" % (actionId if actionId is not None else "registry", err))
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,12 @@
 #
 # Updates:
 #    7-Sep-2015  jdw -  Add lists to capture order of input's and output's
+#   16-Oct-2026  jdw -  Add optional resourceLimits section
+#   16-Oct-2026  jdw -  Add optional retryPolicy section
+#   16-Oct-2026  jdw -  Streaming parser and compiled registry cache stored next to the registry file
+#   16-Oct-2026  jdw -  Add lazy mode parsing action definitions on first access
+#   16-Oct-2026  jdw -  Add writeCache() and load a deployed compiled registry without the registry file
+#   16-Oct-2026  jdw -  Add optional hints section
 ##
 """
 I/O manager for the registry of action definitions.
@@ -15,11 +21,72 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import hashlib
+import io
+import marshal
+import os
+import re
+import stat
 import sys
+import tempfile
 import traceback
-from xml.dom import minidom
+from collections.abc import Mapping
+from xml.etree import ElementTree
 from wwpdb.io.misc.FormatOut import FormatOut
 
+#
+# Version of the compiled registry cache layout -- increment when the registry dictionary organization changes
+REGISTRY_CACHE_FORMAT_VERSION = 2
+#
+# Start tags of action elements and comments in the registry text indexed in lazy mode
+_ACTION_PATTERN = re.compile(rb"<action\s[^>]*?\bname\s*=\s*(?P<q>[\"'])(?P<name>.*?)(?P=q)[^>]*>", re.DOTALL)
+_COMMENT_PATTERN = re.compile(rb"<!--.*?-->", re.DOTALL)
+
+
+def _toBool(val):
+    if val.lower() in ("yes", "y", "true", "1"):
+        return True
+    if val.lower() in ("no", "n", "false", "0"):
+        return False
+    raise ValueError(val)
+
+
+class LazyActionDict(Mapping):
+
+    """Read-only mapping of action identifiers to action definition dictionaries that are parsed
+    from the registry text on first access.   Parsed definitions are kept, so they may be modified
+    in place (e.g. ActionRegistry.setUserParameter()).
+
+    """
+
+    def __init__(self, data, indexD, parser):
+        self.__data = data
+        self.__indexD = indexD
+        self.__parser = parser
+        self.__D = {}
+
+    def __getitem__(self, actionId):
+        try:
+            return self.__D[actionId]
+        except KeyError:
+            start, end = self.__indexD[actionId]
+            rD = self.__parser(actionId, self.__data, start, end)
+            # concurrent first accesses may both parse -- the last one stored wins
+            self.__D[actionId] = rD
+            return rD
+
+    def __contains__(self, actionId):
+        return actionId in self.__indexD
+
+    def __iter__(self):
+        return iter(self.__indexD)
+
+    def __len__(self):
+        return len(self.__indexD)
+
+    def getParsedCount(self):
+        return len(self.__D)
+
 
 class ActionRegistryIo(object):
 
@@ -56,6 +123,25 @@ class ActionRegistryIo(object):
                <internalParameters>
                    <parameter name="force">-f</parameter>
                </internalParameters>
+               <resourceLimits>
+                   <limit name="wallTime">3600</limit>
+                   <limit name="cpuTime">1800</limit>
+                   <limit name="addressSpace">8589934592</limit>
+               </resourceLimits>
+               <retryPolicy>
+                   <attempts>3</attempts>
+                   <backoff>5</backoff>
+                   <backoffFactor>2</backoffFactor>
+                   <maxBackoff>60</maxBackoff>
+                   <retryOn>exception,failure,timeout</retryOn>
+               </retryPolicy>
+               <hints>
+                   <cpuCores>1</cpuCores>
+                   <peakMemory>1073741824</peakMemory>
+                   <runtime>30</runtime>
+                   <parallelSafe>yes</parallelSafe>
+                   <cacheable>yes</cacheable>
+               </hints>
                <moduleName>FileUtils</moduleName>
                <methodName>copyOp</methodName>
            </action>
@@ -70,125 +156,283 @@ class ActionRegistryIo(object):
         tuples of (reference_type, (data_type,container_type), selector_type)
       + USER_PARAMETER_DICTIONARY,  container for user settable parameters passed to the action method.
       + INTERNAL_PARAMETER_DICTIONARY,  container for internal parameters passed to the action method.
+      + RESOURCE_LIMIT_DICT,  optional limits on wall-clock time (wallTime, seconds), CPU time (cpuTime, seconds)
+        and address space (addressSpace, bytes) enforced by ProcessRunner().
+      + RETRY_POLICY_DICT,  optional retry policy applied by ProcessRunner() with the number of attempts,
+        the initial delay between attempts (backoff, seconds), the delay multiplier (backoffFactor),
+        the maximum delay (maxBackoff, seconds) and the list of retryable failure kinds (retryOn)
+        from exception, failure (method returned False) and timeout.
+      + HINT_DICT,  optional scheduling hints with the expected number of CPU cores (cpuCores), peak memory
+        (peakMemory, bytes), typical runtime (runtime, seconds), whether the action may run in parallel with
+        other actions on the same entry (parallelSafe) and whether its results are deterministic and may be
+        cached (cacheable).
       + MODULE_NAME,   Python module(class) name containing the target method
       + METHOD_NAME,   Python method name
 
+    The registry dictionary is compiled to the file <filePath>.cache (marshal format) keyed by the SHA-1
+    digest of the registry file.  Later instances load the compiled dictionary rather than parsing the
+    registry file while the registry file contents are unchanged.  If the registry file is not present
+    a compiled registry in the cache file is used without checking the digest (e.g. a deployment shipping
+    only the output of ActionRegistryCompile).
+
+    In lazy mode only the byte offsets of the action elements are indexed and each action definition
+    is parsed on first access.  The compiled registry cache is not used in lazy mode.
+
     Method prototype:
 
     method(inputObjList=[],outputObjList=[],parameterDictionary={})
 
     """
 
-    def __init__(self, filePath="./examples/resources/actionData.xml", verbose=False, log=sys.stderr):
+    def __init__(self, filePath="./examples/resources/actionData.xml", useCache=True, lazy=False, verbose=False, log=sys.stderr):
+        """
+        :param filePath: registry file path
+        :param useCache: load and store the compiled registry cache
+        :param lazy:     only index the registry file and parse each action on first access (see LazyActionDict)
+        """
         #
         self.__lfh = log
-        self.__verbose = verbose  # pylint: disable=unused-private-member
+        self.__verbose = verbose
         #
         # self.lt = time.strftime("%Y%m%d", time.localtime())
         #
         self.__fileName = filePath
+        self.__useCache = useCache
+        self.__lazy = lazy
+        self.__digest = None
         self.__dict = {}
         self.__setup()
         #
 
+    def getCacheFilePath(self):
+        """Returns:
+
+        The path of the compiled registry cache file stored next to the registry file.
+        """
+        return self.__fileName + ".cache"
+
     def __setup(self):
         try:
-            self.__dom = minidom.parse(self.__fileName)
-            self.__dict = self.__getActionDictionary()
+            if self.__useCache and not os.access(self.__fileName, os.R_OK) and self.__readCache(None):
+                return True
+            with open(self.__fileName, "rb") as ifh:
+                data = ifh.read()
+            if self.__lazy:
+                self.__dict = LazyActionDict(data, self.__getActionIndex(data), self.__parseIndexedAction)
+                return True
+            self.__digest = hashlib.sha1(data).hexdigest()
+            if self.__useCache and self.__readCache(self.__digest):
+                return True
+            self.__dict = self.__getActionDictionary(io.BytesIO(data))
+            if self.__useCache:
+                self.writeCache()
             return True
         except Exception as _e:  # noqa: F841
             self.__lfh.write("+ActionRegistryIo.__setup() - read failed for %s\n" % self.__fileName)
             traceback.print_exc(file=self.__lfh)
             return False
 
+    def __readCache(self, digest):
+        """Load the compiled registry if the cache file matches the registry file contents (unless *digest* is None) and the cache format."""
+        try:
+            with open(self.getCacheFilePath(), "rb") as ifh:
+                # loads() of the whole file is much faster than load() from the file object
+                formatVersion, marshalVersion, cacheDigest, aD = marshal.loads(ifh.read())
+            if formatVersion != REGISTRY_CACHE_FORMAT_VERSION or marshalVersion != marshal.version or (digest is not None and cacheDigest != digest):
+                return False
+            self.__dict = aD
+            self.__digest = cacheDigest
+            return True
+        except Exception as _e:  # noqa: F841
+            return False
+
+    def writeCache(self, cacheFilePath=None):
+        """Store the compiled registry in the input file or in the cache file next to the registry file.
+
+        Returns:
+
+        True on success or False otherwise (e.g. the directory is not writable or the registry is lazy).
+        """
+        cacheFilePath = cacheFilePath if cacheFilePath else self.getCacheFilePath()
+        tmpPath = None
+        try:
+            fd, tmpPath = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(cacheFilePath)), prefix=".actionRegistry")
+            # readable by the same users as the registry file
+            os.chmod(tmpPath, stat.S_IMODE(os.stat(self.__fileName).st_mode))
+            with os.fdopen(fd, "wb") as ofh:
+                ofh.write(marshal.dumps((REGISTRY_CACHE_FORMAT_VERSION, marshal.version, self.__digest, self.__dict)))
+            os.replace(tmpPath, cacheFilePath)
+            tmpPath = None
+            return True
+        except Exception as _e:  # noqa: F841
+            if self.__verbose:
+                self.__lfh.write("+ActionRegistryIo.writeCache() - cache write failed for %s\n" % cacheFilePath)
+            return False
+        finally:
+            if tmpPath is not None and os.path.exists(tmpPath):
+                os.remove(tmpPath)
+
     def getRegistry(self):
         """Returns the dictionary data structure representing the action registry."""
         return self.__dict
 
+    @staticmethod
+    def __hasContent(el):
+        return el.text is not None or len(el) > 0
+
     def __getWfDataObjectList(self, el):
         oD = {}
         oL = []
-        for child in el.childNodes:
-            if child.nodeType != child.ELEMENT_NODE:
-                continue
-            if len(child.childNodes) == 0:
+        for child in el:
+            if not self.__hasContent(child):
                 continue
             #
-            if child.nodeName == "wfDataObject":
-                dId = child.getAttributeNode("name").nodeValue
+            if child.tag == "wfDataObject":
+                dId = child.get("name")
                 tD = {"dataReferenceType": None, "contentType": None, "fileFormat": None, "containerType": None, "valueType": None, "selectorType": None}
-                for tch in child.childNodes:
-                    if tch.nodeName in tD.keys():
-                        if len(tch.childNodes) > 0:
-                            tD[tch.nodeName] = tch.childNodes[0].nodeValue
+                for tch in child:
+                    if tch.tag in tD:
+                        tD[tch.tag] = tch.text
                 oD[dId] = tD
                 oL.append(dId)
         #
         return oD, oL
 
-    def __getActionDictionary(self):
-        """Parser for action registry data file.  Builds dictionary of action definitions."""
+    @staticmethod
+    def __getParameterDict(el):
+        pD = {}
+        for tch in el:
+            if tch.tag == "parameter":
+                pD[tch.get("name")] = tch.text
+        return pD
+
+    def __getResourceLimitDict(self, actionId, el):
+        lD = {}
+        for tch in el:
+            if tch.tag == "limit":
+                ky = tch.get("name")
+                try:
+                    lD[ky] = float(tch.text)
+                except Exception as _e:  # noqa: F841
+                    self.__lfh.write("+ActionRegistryIo.__getResourceLimitDict() - action %s ignoring bad limit %s\n" % (actionId, ky))
+        return lD
+
+    def __getRetryPolicyDict(self, actionId, el):
+        pD = {}
+        convD = {"attempts": int, "backoff": float, "backoffFactor": float, "maxBackoff": float, "retryOn": lambda v: [tS.strip() for tS in v.split(",") if tS.strip()]}
+        for tch in el:
+            if tch.tag in convD and tch.text is not None:
+                try:
+                    pD[tch.tag] = convD[tch.tag](tch.text.strip())
+                except Exception as _e:  # noqa: F841
+                    self.__lfh.write("+ActionRegistryIo.__getRetryPolicyDict() - action %s ignoring bad setting %s\n" % (actionId, tch.tag))
+        return pD
+
+    def __getHintDict(self, actionId, el):
+        hD = {}
+        convD = {"cpuCores": int, "peakMemory": float, "runtime": float, "parallelSafe": _toBool, "cacheable": _toBool}
+        for tch in el:
+            if tch.tag in convD and tch.text is not None:
+                try:
+                    hD[tch.tag] = convD[tch.tag](tch.text.strip())
+                except Exception as _e:  # noqa: F841
+                    self.__lfh.write("+ActionRegistryIo.__getHintDict() - action %s ignoring bad hint %s\n" % (actionId, tch.tag))
+        return hD
+
+    def __getActionDictionary(self, ifh):
+        """Streaming parser for action registry data file.  Builds dictionary of action definitions."""
         aD = {}
-        els = self.__dom.getElementsByTagName("action")
-        for el in els:
-            actionId = el.getAttributeNode("name").nodeValue
-            rD = {}
-            rD["MODULE_NAME"] = None
-            rD["METHOD_NAME"] = None
-            rD["INPUT_INFO_LIST"] = {}
-            rD["OUTPUT_INFO_LIST"] = {}
-            rD["INPUT_NAME_LIST"] = []
-            rD["OUTPUT_NAME_LIST"] = []
-            rD["USER_PARAMETER_DICT"] = {}
-            rD["INTERNAL_PARAMETER_DICT"] = {}
-            #
-            for child in el.childNodes:
-                if child.nodeType != child.ELEMENT_NODE:
-                    continue
-                if len(child.childNodes) == 0:
-                    continue
-
-                if child.nodeName == "moduleName":
-                    rD["MODULE_NAME"] = child.childNodes[0].nodeValue
-
-                if child.nodeName == "methodName":
-                    rD["METHOD_NAME"] = child.childNodes[0].nodeValue
-
-                elif child.nodeName == "userParameters":
-                    pD = {}
-                    for tch in child.childNodes:
-                        if tch.nodeName == "parameter":
-                            ky = tch.getAttributeNode("name").nodeValue
-                            if len(tch.childNodes) > 0:
-                                val = tch.childNodes[0].nodeValue
-                            else:
-                                val = None
-                            pD[ky] = val
-                    rD["USER_PARAMETER_DICT"] = pD
-
-                elif child.nodeName == "internalParameters":
-                    pD = {}
-                    for tch in child.childNodes:
-                        if tch.nodeName == "parameter":
-                            ky = tch.getAttributeNode("name").nodeValue
-                            if len(tch.childNodes) > 0:
-                                val = tch.childNodes[0].nodeValue
-                            else:
-                                val = None
-                            pD[ky] = val
-                    rD["INTERNAL_PARAMETER_DICT"] = pD
-
-                elif child.nodeName == "inputList":
-                    rD["INPUT_INFO_LIST"], rD["INPUT_NAME_LIST"] = self.__getWfDataObjectList(child)
-                elif child.nodeName == "outputList":
-                    rD["OUTPUT_INFO_LIST"], rD["OUTPUT_NAME_LIST"] = self.__getWfDataObjectList(child)
-                else:
-                    pass
-
-            aD[actionId] = rD
+        for _event, el in ElementTree.iterparse(ifh, events=("end",)):
+            if el.tag != "action":
+                continue
+            actionId = el.get("name")
+            aD[actionId] = self.__getActionDefinition(actionId, el)
+            # release the parsed action subtree
+            el.clear()
         return aD
 
+    def __getActionDefinition(self, actionId, el):
+        """Build the definition dictionary of a single parsed action element."""
+        rD = {}
+        rD["MODULE_NAME"] = None
+        rD["METHOD_NAME"] = None
+        rD["INPUT_INFO_LIST"] = {}
+        rD["OUTPUT_INFO_LIST"] = {}
+        rD["INPUT_NAME_LIST"] = []
+        rD["OUTPUT_NAME_LIST"] = []
+        rD["USER_PARAMETER_DICT"] = {}
+        rD["INTERNAL_PARAMETER_DICT"] = {}
+        rD["RESOURCE_LIMIT_DICT"] = {}
+        rD["RETRY_POLICY_DICT"] = {}
+        rD["HINT_DICT"] = {}
+        #
+        for child in el:
+            if not self.__hasContent(child):
+                continue
+
+            if child.tag == "moduleName":
+                rD["MODULE_NAME"] = child.text
+
+            elif child.tag == "methodName":
+                rD["METHOD_NAME"] = child.text
+
+            elif child.tag == "userParameters":
+                rD["USER_PARAMETER_DICT"] = self.__getParameterDict(child)
+
+            elif child.tag == "internalParameters":
+                rD["INTERNAL_PARAMETER_DICT"] = self.__getParameterDict(child)
+
+            elif child.tag == "resourceLimits":
+                rD["RESOURCE_LIMIT_DICT"] = self.__getResourceLimitDict(actionId, child)
+
+            elif child.tag == "retryPolicy":
+                rD["RETRY_POLICY_DICT"] = self.__getRetryPolicyDict(actionId, child)
+
+            elif child.tag == "hints":
+                rD["HINT_DICT"] = self.__getHintDict(actionId, child)
+
+            elif child.tag == "inputList":
+                rD["INPUT_INFO_LIST"], rD["INPUT_NAME_LIST"] = self.__getWfDataObjectList(child)
+            elif child.tag == "outputList":
+                rD["OUTPUT_INFO_LIST"], rD["OUTPUT_NAME_LIST"] = self.__getWfDataObjectList(child)
+            else:
+                pass
+        return rD
+
+    @staticmethod
+    def __getActionIndex(data):
+        """Index the byte range of each <action name="..."> element in the input registry text
+        without parsing it.  Actions within comments are skipped.
+        """
+        commentL = [(mt.start(), mt.end()) for mt in _COMMENT_PATTERN.finditer(data)]
+        iC = 0
+        indexD = {}
+        pos = 0
+        while True:
+            mt = _ACTION_PATTERN.search(data, pos)
+            if mt is None:
+                break
+            while iC < len(commentL) and commentL[iC][1] <= mt.start():
+                iC += 1
+            if iC < len(commentL) and commentL[iC][0] <= mt.start():
+                pos = commentL[iC][1]
+                continue
+            if data[mt.end() - 2 : mt.end()] == b"/>":
+                end = mt.end()
+            else:
+                end = data.find(b"</action>", mt.end())
+                if end < 0:
+                    raise ValueError("unterminated action element at offset %d" % mt.start())
+                end += len(b"</action>")
+            indexD[mt.group("name").decode("utf-8")] = (mt.start(), end)
+            pos = end
+        return indexD
+
+    def __parseIndexedAction(self, actionId, data, start, end):
+        el = ElementTree.fromstring(data[start:end])
+        return self.__getActionDefinition(actionId, el)
+
     def dump(self):
         out = FormatOut()
-        out.autoFormat("Action registry file", self.__dict, 3, 3)
+        out.autoFormat("Action registry file", dict(self.__dict.items()), 3, 3)
         out.writeStream(self.__lfh)
@@ -0,0 +1,381 @@
+##
+# File:    ActionResultCache.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw hash input files on every lookup and track the store size incrementally
+# 17-Oct-2026 jdw lock the store and re-read it after changes by other processes - check all outputs before restoring
+##
+"""
+Content-addressed store of action results for memoizing deterministic actions.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import copy
+import fcntl
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+
+
+class ActionResultCache(object):
+
+    """Local content-addressed store of action results.
+
+    Results are keyed on the action identifier, the user and internal parameter dictionaries,
+    a content hash of each input file (or the value of each input value container),
+    the selection criteria of the inputs and the type settings of the outputs.
+
+    The store has the following organization:
+
+    - <cachePath>/objects/<hh>/<hash>   output file contents keyed by content hash
+    - <cachePath>/entries/<key>.pic     pickled manifest of the outputs of a single result
+
+    The manifest modification time records the last use of an entry.  When the store exceeds
+    *maxBytes* the least recently used entries are evicted along with any output file contents
+    that are no longer referenced.   The object sizes and entry references are read from the
+    store on the first store() and are then tracked incrementally by this instance.
+
+    A store may be shared by several processes.  store() holds an exclusive lock on the store
+    (<cachePath>/store.lock) and restore() a shared lock.  Each store() increments the generation
+    number in <cachePath>/generation -- if another process has changed the store since this
+    instance last did, the object sizes and entry references are read again before the store
+    is changed, so objects referenced by entries of other processes are not removed and the
+    size limit applies to the whole store.
+
+    """
+
+    def __init__(self, cachePath, maxBytes=10 * 1024**3, verbose=False, log=sys.stderr):
+        self.__cachePath = os.path.abspath(cachePath)
+        self.__objectPath = os.path.join(self.__cachePath, "objects")
+        self.__entryPath = os.path.join(self.__cachePath, "entries")
+        self.__maxBytes = maxBytes
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__lockPath = os.path.join(self.__cachePath, "store.lock")
+        self.__generationPath = os.path.join(self.__cachePath, "generation")
+        self.__indexD = None
+        self.__generation = None
+        self.__statsD = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        for pth in [self.__objectPath, self.__entryPath]:
+            if not os.path.isdir(pth):
+                os.makedirs(pth)
+
+    def getStats(self):
+        """Returns:
+
+        Dictionary of hit, miss, store and eviction counts for this instance.
+        """
+        return dict(self.__statsD)
+
+    @staticmethod
+    def __hashFile(filePath):
+        """Return the SHA-256 digest of the content of the input file.   The content is hashed on every
+        call -- file size and modification time do not identify content (e.g. cp -p, rsync -t).
+        """
+        h = hashlib.sha256()
+        with open(filePath, "rb") as ifh:
+            for chunk in iter(lambda: ifh.read(1 << 20), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def __describeInput(self, wfo):
+        if wfo.getReferenceType() == "file":
+            fP = wfo.getFilePathReference()
+            if fP is None or not os.access(fP, os.R_OK):
+                return None
+            tD = {"file": self.__hashFile(fP), "format": wfo.getFileFormat()}
+        else:
+            tD = {"container": wfo.getContainerTypeName(), "valueType": wfo.getValueTypeName(), "value": repr(wfo.getValue())}
+        if wfo.getSelectorType() is not None:
+            tD["selector"] = [wfo.getSelectCategoryName(), wfo.getSelectAttributeList(), wfo.getSelectConditionList()]
+        return tD
+
+    @staticmethod
+    def __describeOutput(wfo):
+        return [wfo.getReferenceType(), wfo.getContentType(), wfo.getFileFormat(), wfo.getContainerTypeName(), wfo.getValueTypeName(), wfo.getSelectorType()]
+
+    def lookup(self, actionId, userParameterD, internalParameterD, inputObjectD, outputObjectD):
+        """Compute the cache entry reference for an action invocation.   Output file paths are
+        resolved here, before the action runs, so that version identifiers such as 'next'
+        refer to the files the action will write.
+
+        Returns:
+
+        A reference dictionary for restore() and store() or None if the invocation cannot be cached
+        (e.g. an input file is missing).
+        """
+        try:
+            inpD = {}
+            for name, wfo in inputObjectD.items():
+                tD = self.__describeInput(wfo)
+                if tD is None:
+                    return None
+                inpD[name] = tD
+            keyD = {
+                "action": actionId,
+                "user": userParameterD,
+                "internal": internalParameterD,
+                "input": inpD,
+                "output": dict((name, self.__describeOutput(wfo)) for name, wfo in outputObjectD.items()),
+            }
+            key = hashlib.sha256(json.dumps(keyD, sort_keys=True, default=repr).encode("utf-8")).hexdigest()
+            pathD = {}
+            for name, wfo in outputObjectD.items():
+                if wfo.getReferenceType() == "file":
+                    pathD[name] = wfo.getFilePathReference()
+            return {"KEY": key, "ACTION_ID": actionId, "OUTPUT_PATH_DICT": pathD}
+        except Exception as _e:  # noqa: F841
+            if self.__verbose:
+                traceback.print_exc(file=self.__lfh)
+            return None
+
+    def __getEntryFilePath(self, key):
+        return os.path.join(self.__entryPath, key + ".pic")
+
+    def __getObjectFilePath(self, digest):
+        return os.path.join(self.__objectPath, digest[:2], digest)
+
+    def restore(self, ref, outputObjectD):
+        """Restore the output files and values of a cached result onto the output data objects.
+
+        Returns:
+
+        True for a cache hit or False otherwise.
+        """
+        if ref is None:
+            return False
+        try:
+            lockFh = self.__lock(fcntl.LOCK_SH)
+            try:
+                ok = self.__restore(ref, outputObjectD)
+            finally:
+                lockFh.close()
+            self.__statsD["hits" if ok else "misses"] += 1
+            if ok and self.__verbose:
+                self.__lfh.write("+ActionResultCache.restore() action %s restored from entry %s\n" % (ref["ACTION_ID"], ref["KEY"]))
+            return ok
+        except Exception as _e:  # noqa: F841
+            self.__statsD["misses"] += 1
+            if self.__verbose:
+                traceback.print_exc(file=self.__lfh)
+            return False
+
+    def __restore(self, ref, outputObjectD):
+        """Restore the outputs of the entry -- nothing is written unless every output can be restored."""
+        entryFilePath = self.__getEntryFilePath(ref["KEY"])
+        if not os.access(entryFilePath, os.R_OK):
+            return False
+        with open(entryFilePath, "rb") as ifh:
+            eD = pickle.load(ifh)
+        for name, tup in eD["OUTPUT"].items():
+            if tup[0] == "file":
+                if ref["OUTPUT_PATH_DICT"].get(name) is None or not os.access(self.__getObjectFilePath(tup[1]), os.R_OK):
+                    return False
+            elif tup[0] == "value" and name not in outputObjectD:
+                return False
+        for name, tup in eD["OUTPUT"].items():
+            if tup[0] == "file":
+                oPth = ref["OUTPUT_PATH_DICT"][name]
+                dirPath = os.path.dirname(oPth)
+                if not os.path.isdir(dirPath):
+                    os.makedirs(dirPath)
+                shutil.copyfile(self.__getObjectFilePath(tup[1]), oPth)
+            elif tup[0] == "value":
+                outputObjectD[name].setValue(copy.deepcopy(tup[1]))
+        os.utime(entryFilePath, None)
+        if self.__indexD is not None and ref["KEY"] in self.__indexD["ENTRY"]:
+            self.__indexD["ENTRY"][ref["KEY"]][0] = time.time()
+        return True
+
+    def __lock(self, operation):
+        """Returns:
+
+        An open handle of the store lock file locked with *operation* (fcntl.LOCK_SH or LOCK_EX) -- closing it releases the lock.
+        """
+        lockFh = open(self.__lockPath, "a")
+        try:
+            fcntl.flock(lockFh.fileno(), operation)
+        except Exception:
+            lockFh.close()
+            raise
+        return lockFh
+
+    def __readGeneration(self):
+        try:
+            with open(self.__generationPath, "r") as ifh:
+                return int(ifh.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def __writeGeneration(self, generation):
+        fd, tmpPath = tempfile.mkstemp(dir=self.__cachePath)
+        with os.fdopen(fd, "w") as ofh:
+            ofh.write("%d\n" % generation)
+        os.replace(tmpPath, self.__generationPath)
+        self.__generation = generation
+
+    def __getIndex(self):
+        """Read the object sizes and entry references of the store (once per instance).
+
+        Returns:
+
+        Dictionary with keys OBJECT_SIZE (size by digest), ENTRY ([last use, digest set] by key),
+        REF_COUNT (entry count by digest) and TOTAL_BYTES.
+        """
+        if self.__indexD is None:
+            objSizeD = {}
+            for dirPath, _dirNames, fileNames in os.walk(self.__objectPath):
+                for fN in fileNames:
+                    if len(fN) == 64:
+                        objSizeD[fN] = os.path.getsize(os.path.join(dirPath, fN))
+            entryD = {}
+            refCountD = {}
+            for fN in os.listdir(self.__entryPath):
+                if not fN.endswith(".pic"):
+                    continue
+                pth = os.path.join(self.__entryPath, fN)
+                try:
+                    with open(pth, "rb") as ifh:
+                        digestS = set(tup[1] for tup in pickle.load(ifh)["OUTPUT"].values() if tup[0] == "file")
+                    entryD[fN[: -len(".pic")]] = [os.path.getmtime(pth), digestS]
+                except Exception as _e:  # noqa: F841
+                    continue
+                for digest in digestS:
+                    refCountD[digest] = refCountD.get(digest, 0) + 1
+            self.__indexD = {"OBJECT_SIZE": objSizeD, "ENTRY": entryD, "REF_COUNT": refCountD, "TOTAL_BYTES": sum(objSizeD.values())}
+        return self.__indexD
+
+    def __releaseEntry(self, key):
+        """Drop the references of entry *key* and remove output file contents that are no longer referenced."""
+        indexD = self.__getIndex()
+        if key not in indexD["ENTRY"]:
+            return
+        _lastUse, digestS = indexD["ENTRY"].pop(key)
+        for digest in digestS:
+            indexD["REF_COUNT"][digest] -= 1
+            if indexD["REF_COUNT"][digest] == 0:
+                del indexD["REF_COUNT"][digest]
+                if digest in indexD["OBJECT_SIZE"]:
+                    try:
+                        os.remove(self.__getObjectFilePath(digest))
+                    except FileNotFoundError:
+                        pass
+                    indexD["TOTAL_BYTES"] -= indexD["OBJECT_SIZE"].pop(digest)
+
+    def __storeObject(self, filePath):
+        digest = self.__hashFile(filePath)
+        objFilePath = self.__getObjectFilePath(digest)
+        if not os.access(objFilePath, os.R_OK):
+            dirPath = os.path.dirname(objFilePath)
+            if not os.path.isdir(dirPath):
+                os.makedirs(dirPath)
+            fd, tmpPath = tempfile.mkstemp(dir=dirPath)
+            os.close(fd)
+            shutil.copyfile(filePath, tmpPath)
+            os.replace(tmpPath, objFilePath)
+        indexD = self.__getIndex()
+        if digest not in indexD["OBJECT_SIZE"]:
+            indexD["OBJECT_SIZE"][digest] = os.path.getsize(objFilePath)
+            indexD["TOTAL_BYTES"] += indexD["OBJECT_SIZE"][digest]
+        return digest, indexD["OBJECT_SIZE"][digest]
+
+    def store(self, ref, outputObjectD):
+        """Store the output files and values of a completed action.
+
+        Returns:
+
+        True on success or False otherwise.
+        """
+        if ref is None:
+            return False
+        try:
+            lockFh = self.__lock(fcntl.LOCK_EX)
+            try:
+                self.__store(ref, outputObjectD)
+            finally:
+                lockFh.close()
+            self.__statsD["stores"] += 1
+            return True
+        except Exception as _e:  # noqa: F841
+            if self.__verbose:
+                traceback.print_exc(file=self.__lfh)
+            return False
+
+    def __store(self, ref, outputObjectD):
+        """Store the outputs of the entry and evict as required (with the store locked)."""
+        generation = self.__readGeneration()
+        if generation != self.__generation:
+            # changed by another process -- read the object sizes and entry references again
+            self.__indexD = None
+        self.__getIndex()
+        try:
+            oD = {}
+            nBytes = 0
+            for name, wfo in outputObjectD.items():
+                if name in ref["OUTPUT_PATH_DICT"]:
+                    oPth = ref["OUTPUT_PATH_DICT"][name]
+                    if oPth is not None and os.access(oPth, os.R_OK):
+                        digest, size = self.__storeObject(oPth)
+                        oD[name] = ("file", digest)
+                        nBytes += size
+                    else:
+                        oD[name] = ("none",)
+                elif wfo.isValueSet():
+                    oD[name] = ("value", wfo.getValue())
+                else:
+                    oD[name] = ("none",)
+            eD = {"ACTION_ID": ref["ACTION_ID"], "OUTPUT": oD, "SIZE": nBytes}
+            fd, tmpPath = tempfile.mkstemp(dir=self.__entryPath)
+            try:
+                with os.fdopen(fd, "wb") as ofh:
+                    pickle.dump(eD, ofh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmpPath, self.__getEntryFilePath(ref["KEY"]))
+            finally:
+                if os.path.exists(tmpPath):
+                    os.remove(tmpPath)
+            digestS = set(tup[1] for tup in oD.values() if tup[0] == "file")
+            for digest in digestS:
+                self.__indexD["REF_COUNT"][digest] = self.__indexD["REF_COUNT"].get(digest, 0) + 1
+            self.__releaseEntry(ref["KEY"])
+            self.__indexD["ENTRY"][ref["KEY"]] = [time.time(), digestS]
+            self.__evict()
+        except Exception:
+            self.__indexD = None
+            raise
+        finally:
+            self.__writeGeneration(generation + 1)
+
+    def __evict(self):
+        """Evict least recently used entries until the object store is within the size limit."""
+        indexD = self.__getIndex()
+        if indexD["TOTAL_BYTES"] <= self.__maxBytes:
+            return
+        # restore() by other processes updates the last use of an entry on disk only
+        for key, eL in indexD["ENTRY"].items():
+            try:
+                eL[0] = os.path.getmtime(self.__getEntryFilePath(key))
+            except OSError:
+                pass
+        for _lastUse, key in sorted((eL[0], key) for key, eL in indexD["ENTRY"].items()):
+            if indexD["TOTAL_BYTES"] <= self.__maxBytes:
+                break
+            try:
+                os.remove(self.__getEntryFilePath(key))
+            except FileNotFoundError:
+                pass
+            self.__releaseEntry(key)
+            self.__statsD["evictions"] += 1
+        if self.__verbose:
+            self.__lfh.write("+ActionResultCache.__evict() object store size %d bytes after eviction\n" % indexD["TOTAL_BYTES"])
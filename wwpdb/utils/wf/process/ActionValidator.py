@@ -0,0 +1,110 @@
+##
+# File:    ActionValidator.py
+# Date:    16-Oct-2026
+#
+# Updates:
+#
+##
+"""
+Compiled type requirements of the input and output data objects of a registry action.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+from operator import methodcaller
+
+#
+# (requirement label, registry accessor suffix, data object accessor) in check order
+_REQUIREMENT_LIST = [
+    ("reference type", "ReferenceType", "getReferenceType"),
+    ("container type", "ContainerType", "getContainerTypeName"),
+    ("value type", "ValueType", "getValueTypeName"),
+    ("selector type", "SelectorType", "getSelectorType"),
+    ("content type", "ContentType", "getContentType"),
+    ("file format", "FileFormat", "getFileFormat"),
+]
+
+
+class ActionValidator(object):
+
+    """Type requirements of a single action compiled from the action registry.
+
+    The requirements for each input and output data object are reduced to a list of
+    (label, expected value, accessor) tuples so that a check is a single comparison
+    pass over the data objects without further registry lookups.
+
+    """
+
+    def __init__(self, aReg, actionId):
+        self.__actionId = actionId
+        self.__isDefined = aReg.isDefinedAction(actionId)
+        self.__inputCount = 0
+        self.__outputCount = 0
+        self.__inputL = []
+        self.__outputL = []
+        if self.__isDefined:
+            self.__inputCount = aReg.getInputObjectCount(actionId)
+            self.__outputCount = aReg.getOutputObjectCount(actionId)
+            self.__inputL = self.__compile(aReg, "Input", aReg.getInputObjectNames(actionId))
+            self.__outputL = self.__compile(aReg, "Output", aReg.getOutputObjectNames(actionId))
+
+    def __compile(self, aReg, direction, nameList):
+        """Build the list of (name, [(label, expected value, accessor),...]) for the input
+        or output data objects using the registry isSet*() and get*() methods.
+        """
+        oL = []
+        for name in nameList:
+            reqL = []
+            for label, suffix, getterName in _REQUIREMENT_LIST:
+                if getattr(aReg, "isSet" + direction + suffix)(self.__actionId, name):
+                    reqL.append((label, getattr(aReg, "get" + direction + suffix)(self.__actionId, name), methodcaller(getterName)))
+            oL.append((name, reqL))
+        return oL
+
+    def getActionId(self):
+        return self.__actionId
+
+    def __check(self, direction, count, reqL, objD, errL):
+        if count != len(objD):
+            errL.append("%s count %d expected %d" % (direction, len(objD), count))
+        if count == 0:
+            return
+        for name, tReqL in reqL:
+            if name not in objD:
+                errL.append("%s %s missing" % (direction, name))
+                continue
+            wfo = objD[name]
+            for label, expected, getter in tReqL:
+                try:
+                    value = getter(wfo)
+                except Exception as _e:  # noqa: F841
+                    errL.append("%s %s %s not available" % (direction, name, label))
+                    continue
+                if value != expected:
+                    errL.append("%s %s %s %r expected %r" % (direction, name, label, value, expected))
+
+    def check(self, inputObjectD, outputObjectD):
+        """Check the input and output data objects against the requirements of this action.
+
+        Returns:
+
+        The list of all requirement mismatches.  An empty list is returned if all
+        requirements are satisfied.
+        """
+        if not self.__isDefined:
+            return ["action %s not defined" % self.__actionId]
+        errL = []
+        self.__check("input", self.__inputCount, self.__inputL, inputObjectD, errL)
+        self.__check("output", self.__outputCount, self.__outputL, outputObjectD, errL)
+        return errL
+
+    def isValid(self, inputObjectD, outputObjectD):
+        """Returns:
+
+        True if the input and output data objects satisfy the requirements of this action or False otherwise.
+        """
+        return len(self.check(inputObjectD, outputObjectD)) == 0
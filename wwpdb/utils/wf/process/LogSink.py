@@ -0,0 +1,251 @@
+##
+# File:    LogSink.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw write through to caller-supplied handles and keep text that could not be written
+# 17-Oct-2026 jdw getLogSink() buffers the standard output and error streams
+##
+"""
+Buffered log stream with level filtering and deferred message formatting.
+
+A LogSink() instance may be used anywhere a `log=` file handle is accepted.  Messages written
+with log() (or debug(), info(), warning() and error()) are only formatted if their level is
+enabled.
+
+A buffered LogSink() holds text written with write() in memory and copies it to the underlying
+stream from a background thread, before a fork, at exit or on flush().   Messages at level ERROR
+and above are flushed immediately.   Text that cannot be written is kept and retried -- at exit
+it is written to sys.__stderr__.   getLogSink() buffers the standard output and error streams
+(the default log of ProcessRunner() and the plugins) and wraps other caller-supplied file handles
+without buffering, since the caller may close the handle as soon as the call returns.
+
+The flush interval in seconds is taken from the environment variable WWPDB_LOG_FLUSH_INTERVAL
+(default 0.25).  An interval of 0 disables buffering.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import atexit
+import logging
+import os
+import sys
+import threading
+import weakref
+
+LOG_FLUSH_INTERVAL_ENV_NAME = "WWPDB_LOG_FLUSH_INTERVAL"
+#
+# Buffered sinks drained by the process-wide flusher thread
+_sinkS = weakref.WeakSet()
+_sinkLock = threading.Lock()
+_flusherThread = None
+
+
+def _getFlushInterval():
+    try:
+        return max(0.0, float(os.environ.get(LOG_FLUSH_INTERVAL_ENV_NAME, "0.25")))
+    except ValueError:
+        return 0.25
+
+
+def _flushAll():
+    with _sinkLock:
+        sinkL = list(_sinkS)
+    for sink in sinkL:
+        try:
+            sink.flush()
+        except Exception as _e:  # noqa: F841
+            pass
+
+
+def _flushAllAtExit():
+    with _sinkLock:
+        sinkL = list(_sinkS)
+    for sink in sinkL:
+        sink._flushOrSalvage()  # pylint: disable=protected-access
+
+
+def _runFlusher(interval):
+    while True:
+        threading.Event().wait(interval)
+        _flushAll()
+
+
+def _startFlusher(interval):
+    global _flusherThread  # pylint: disable=global-statement
+    with _sinkLock:
+        if _flusherThread is None:
+            _flusherThread = threading.Thread(target=_runFlusher, args=(interval,), name="LogSinkFlusher", daemon=True)
+            _flusherThread.start()
+
+
+def _afterForkInChild():
+    """Pending text belongs to the parent process -- discard it and reset the locks and flusher thread."""
+    global _sinkLock, _flusherThread  # pylint: disable=global-statement
+    _sinkLock = threading.Lock()
+    _flusherThread = None
+    for sink in list(_sinkS):
+        sink._resetAfterFork()  # pylint: disable=protected-access
+
+
+atexit.register(_flushAllAtExit)
+os.register_at_fork(before=_flushAll, after_in_child=_afterForkInChild)
+
+
+def getLogSink(log=sys.stderr, verbose=False):
+    """Returns:
+
+    The input log if it is a LogSink() instance or a new LogSink() instance writing to the input
+    file handle with level DEBUG if *verbose* is set or INFO otherwise.   Only the standard output
+    and error streams are buffered.
+    """
+    if isinstance(log, LogSink):
+        return log
+    buffered = any(log is fh for fh in (sys.stderr, sys.stdout, sys.__stderr__, sys.__stdout__) if fh is not None)
+    return LogSink(log, level=logging.DEBUG if verbose else logging.INFO, buffered=buffered)
+
+
+class LogSink(object):
+
+    """File-like log stream with level filtering, deferred formatting and asynchronous flushing.
+
+    Attributes not defined here (e.g. fileno(), isatty(), encoding) are those of the underlying stream.
+
+    """
+
+    def __init__(self, stream=sys.stderr, level=logging.INFO, buffered=True):
+        """
+        :param stream:   underlying output stream (file handle or LogSink() instance)
+        :param level:    minimum level of messages written by log()
+        :param buffered: buffer output (subject to WWPDB_LOG_FLUSH_INTERVAL)
+        """
+        self.__stream = stream.getStream() if isinstance(stream, LogSink) else stream
+        self.__level = level
+        self.__lock = threading.Lock()
+        self.__ioLock = threading.Lock()
+        self.__chunkL = []
+        self.__nBytes = 0
+        self.__maxBytes = 1 << 16
+        self.__interval = _getFlushInterval()
+        self.__buffered = buffered and self.__interval > 0
+        if self.__buffered:
+            with _sinkLock:
+                _sinkS.add(self)
+
+    def getStream(self):
+        return self.__stream
+
+    def setLevel(self, level):
+        self.__level = level
+
+    def getLevel(self):
+        return self.__level
+
+    def isBuffered(self):
+        return self.__buffered
+
+    def isEnabledFor(self, level):
+        return level >= self.__level
+
+    def write(self, text):
+        """Write the input text to the buffer (or the underlying stream if buffering is disabled).
+
+        Returns:
+
+        The number of characters written.
+        """
+        if not self.__buffered:
+            with self.__ioLock:
+                self.__stream.write(text)
+            return len(text)
+        with self.__lock:
+            self.__chunkL.append(text)
+            self.__nBytes += len(text)
+            isFull = self.__nBytes >= self.__maxBytes
+        if isFull:
+            self.flush()
+        elif _flusherThread is None:
+            _startFlusher(self.__interval)
+        return len(text)
+
+    def log(self, level, msg, *args):
+        """Write the message *msg* % *args* followed by a newline if *level* is enabled.
+        The message is only formatted if it is written.
+        """
+        if level < self.__level:
+            return
+        self.write((msg % args if args else msg) + "\n")
+        if level >= logging.ERROR:
+            self.flush()
+
+    def debug(self, msg, *args):
+        self.log(logging.DEBUG, msg, *args)
+
+    def info(self, msg, *args):
+        self.log(logging.INFO, msg, *args)
+
+    def warning(self, msg, *args):
+        self.log(logging.WARNING, msg, *args)
+
+    def error(self, msg, *args):
+        self.log(logging.ERROR, msg, *args)
+
+    def flush(self):
+        """Copy any buffered text to the underlying stream and flush the stream.   If the text
+        cannot be written it is kept in the buffer and the exception is raised.
+        """
+        with self.__ioLock:
+            with self.__lock:
+                chunkL = self.__chunkL
+                self.__chunkL = []
+                self.__nBytes = 0
+            if chunkL:
+                text = "".join(chunkL)
+                try:
+                    self.__stream.write(text)
+                except Exception:
+                    with self.__lock:
+                        self.__chunkL.insert(0, text)
+                        self.__nBytes += len(text)
+                    raise
+            self.__stream.flush()
+
+    def _flushOrSalvage(self):
+        """Flush -- text that cannot be written to the underlying stream is written to sys.__stderr__."""
+        try:
+            self.flush()
+        except Exception as _e:  # noqa: F841
+            with self.__lock:
+                chunkL = self.__chunkL
+                self.__chunkL = []
+                self.__nBytes = 0
+            if chunkL and sys.__stderr__ is not None:
+                try:
+                    sys.__stderr__.write("".join(chunkL))
+                    sys.__stderr__.flush()
+                except Exception as _e2:  # noqa: F841
+                    pass
+
+    def close(self):
+        self.flush()
+
+    def _resetAfterFork(self):
+        self.__lock = threading.Lock()
+        self.__ioLock = threading.Lock()
+        self.__chunkL = []
+        self.__nBytes = 0
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.__stream, name)
+
+    def __del__(self):
+        try:
+            self._flushOrSalvage()
+        except Exception as _e:  # noqa: F841
+            pass
@@ -0,0 +1,100 @@
+##
+# File:    ProcessAsyncRunner.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw use the process-wide shared action registry
+##
+"""
+Run registry actions from asyncio code with bounded concurrency for each plugin class.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import asyncio
+import functools
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from wwpdb.utils.wf.process.ActionRegistry import getSharedActionRegistry
+from wwpdb.utils.wf.process.ProcessJob import makeJob, runJob, mergeJobResult
+
+
+class ProcessAsyncRunner(object):
+
+    """Run action jobs (see `ProcessJob`) as coroutines.
+
+    Each job waits on the semaphore of its plugin class (e.g. ValidationUtils, FileUtils) and
+    then runs in the executor, so any number of jobs may be awaited at once while only a bounded
+    number of each class are running.   Concurrency limits are set per plugin class name in
+    *concurrencyD* and default to *defaultConcurrency*.
+
+    Jobs run in the input executor or in the default executor of the running event loop.
+    With a thread executor all jobs share the process-wide action registry.
+    Semaphores are created in the first event loop in which jobs are run, so an instance
+    should only be used with a single event loop.
+
+    """
+
+    def __init__(self, executor=None, concurrencyD=None, defaultConcurrency=4, preCheck=False, verbose=False, log=sys.stderr):
+        self.__executor = executor
+        self.__concurrencyD = concurrencyD if concurrencyD is not None else {}
+        self.__defaultConcurrency = defaultConcurrency
+        self.__preCheck = preCheck
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__semaphoreD = {}
+
+    def getActionClassName(self, actionId):
+        """Returns:
+
+        The plugin class name for the input action identifier or None if the action is not defined.
+        """
+        modulePath = getSharedActionRegistry().getModuleName(actionId)
+        return modulePath.split(".")[-1] if modulePath else None
+
+    def __getSemaphore(self, actionId):
+        clsName = self.getActionClassName(actionId)
+        if clsName not in self.__semaphoreD:
+            self.__semaphoreD[clsName] = asyncio.Semaphore(self.__concurrencyD.get(clsName, self.__defaultConcurrency))
+        return self.__semaphoreD[clsName]
+
+    async def runJob(self, jobD):
+        """Run the input job once a slot is available for the plugin class of its action.
+        Data values set on output objects are copied back onto the job's output objects.
+
+        Returns:
+
+        The job result dictionary.
+        """
+        async with self.__getSemaphore(jobD.get("ACTION_ID")):
+            loop = asyncio.get_running_loop()
+            if isinstance(self.__executor, ProcessPoolExecutor):
+                rD = await loop.run_in_executor(self.__executor, runJob, jobD, self.__preCheck, self.__verbose)
+            else:
+                pFunc = functools.partial(runJob, jobD, preCheck=self.__preCheck, verbose=self.__verbose, log=self.__lfh, actionRegistry=getSharedActionRegistry())
+                rD = await loop.run_in_executor(self.__executor, pFunc)
+        mergeJobResult(jobD, rD)
+        if self.__verbose:
+            self.__lfh.write("+ProcessAsyncRunner.runJob() job %r action %r status %r in %.3f sec\n" % (rD["JOB_ID"], rD["ACTION_ID"], rD["STATUS"], rD["ELAPSED_SEC"]))
+        return rD
+
+    async def runAction(self, actionId, inputObjectD=None, outputObjectD=None, userParameterD=None, jobId=None):
+        """Returns:
+
+        The job result dictionary of running the input action on the input data objects.
+        """
+        return await self.runJob(makeJob(actionId, inputObjectD, outputObjectD, userParameterD, jobId=jobId))
+
+    async def runJobs(self, jobList):
+        """Run the input list of jobs concurrently.
+
+        Returns:
+
+        List of job result dictionaries in job order.
+        """
+        return list(await asyncio.gather(*[self.runJob(jobD) for jobD in jobList]))
@@ -0,0 +1,187 @@
+##
+# File:    ProcessBatchRunner.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw add dry-run plan()
+# 16-Oct-2026 jdw use the process-wide shared action registry
+# 16-Oct-2026 jdw add runFanOut() to apply one action to many deposition data sets
+# 16-Oct-2026 jdw build results of lost jobs with makeJobResult()
+##
+"""
+Run batches of registry actions in a pool of worker processes.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from wwpdb.utils.wf.process.ActionRegistry import getSharedActionRegistry
+from wwpdb.utils.wf.process.ProcessJob import makeJob, makeJobResult, runJob, runFanOutJob, checkJobs, mergeJobResult
+from wwpdb.utils.wf.process.ProcessPlanner import ProcessPlanner
+
+
+def _runWorkerJob(jobD, preCheck, verbose):
+    """Worker process entry point -- log output goes to the worker's own stderr stream."""
+    return runJob(jobD, preCheck=preCheck, verbose=verbose, log=sys.stderr)
+
+
+def _runWorkerFanOut(actionId, depDataSetIdList, inputTemplateD, outputTemplateD, userParameterD, preCheck, verbose):
+    """Worker process entry point for a chunk of deposition data sets."""
+    return runFanOutJob(actionId, depDataSetIdList, inputTemplateD, outputTemplateD, userParameterD, preCheck=preCheck, verbose=verbose, log=sys.stderr)
+
+
+class ProcessBatchRunner(object):
+
+    """Run a list of action jobs in a process pool.
+
+    Each job is described by an action identifier, dictionaries of input and output
+    `WfDataObject` objects and an optional dictionary of user parameters (see `ProcessJob`).
+    Jobs are run by a ProcessRunner() instance in a worker process and the per-job status,
+    timing and any exception traceback are returned in submission order.
+
+    Data values set on output objects in the workers are copied back onto the caller's
+    output data objects.
+
+    """
+
+    def __init__(self, numProc=None, preCheck=False, verbose=False, log=sys.stderr):
+        """
+        :param numProc:  number of worker processes (default: number of processors)
+        :param preCheck: only run jobs satisfying the type requirements of their action
+        """
+        self.__numProc = numProc
+        self.__preCheck = preCheck
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__jobL = []
+
+    def addJob(self, actionId, inputObjectD=None, outputObjectD=None, userParameterD=None, jobId=None):
+        """Add a job to the current batch.
+
+        Returns:
+
+        The job identifier (assigned from the batch position if not provided).
+        """
+        if jobId is None:
+            jobId = len(self.__jobL)
+        self.__jobL.append(makeJob(actionId, inputObjectD, outputObjectD, userParameterD, jobId=jobId))
+        return jobId
+
+    def getJobs(self):
+        return self.__jobL
+
+    def clear(self):
+        self.__jobL = []
+
+    def preCheck(self, jobList=None):
+        """Check the input list of jobs or the jobs added to this batch against the type
+        requirements of their actions without running them.
+
+        Returns:
+
+        A list with the list of all requirement mismatches for each job in job order.
+        """
+        jobL = jobList if jobList is not None else self.__jobL
+        errLL = checkJobs(jobL, getSharedActionRegistry())
+        if self.__verbose:
+            for jobD, errL in zip(jobL, errLL):
+                for err in errL:
+                    self.__lfh.write("+ProcessBatchRunner.preCheck() job %r action %r %s\n" % (jobD.get("JOB_ID"), jobD.get("ACTION_ID"), err))
+        return errLL
+
+    def plan(self, jobList=None):
+        """Resolve and check the data object paths of the input list of jobs or the jobs added to
+        this batch without running them (see `ProcessPlanner`).
+
+        Returns:
+
+        List of plan dictionaries in job order.
+        """
+        jobL = jobList if jobList is not None else self.__jobL
+        return ProcessPlanner(verbose=self.__verbose, log=self.__lfh).plan(jobL)
+
+    def run(self, jobList=None):
+        """Run the input list of job specifications or the jobs added to this batch.
+
+        Returns:
+
+        List of job result dictionaries in job order.
+        """
+        jobL = jobList if jobList is not None else self.__jobL
+        resultL = [None] * len(jobL)
+        if not jobL:
+            return resultL
+        t0 = time.time()
+        with ProcessPoolExecutor(max_workers=self.__numProc) as executor:
+            futureD = {}
+            for ii, jobD in enumerate(jobL):
+                futureD[executor.submit(_runWorkerJob, jobD, self.__preCheck, self.__verbose)] = ii
+            for future in as_completed(futureD):
+                ii = futureD[future]
+                jobD = jobL[ii]
+                try:
+                    rD = future.result()
+                    mergeJobResult(jobD, rD)
+                except Exception as _e:  # noqa: F841
+                    # Failures to ship the job or its result or a lost worker process
+                    rD = makeJobResult(jobD.get("JOB_ID"), jobD.get("ACTION_ID"), jobD.get("OUTPUT_OBJECT_DICT"), exception=traceback.format_exc(), started=False)
+                resultL[ii] = rD
+                if self.__verbose:
+                    self.__lfh.write("+ProcessBatchRunner.run() job %r action %r status %r in %.3f sec\n" % (rD["JOB_ID"], rD["ACTION_ID"], rD["STATUS"], rD["ELAPSED_SEC"]))
+        if self.__verbose:
+            nOk = len([rD for rD in resultL if rD["STATUS"]])
+            self.__lfh.write("+ProcessBatchRunner.run() completed %d of %d jobs in %.3f sec\n" % (nOk, len(jobL), time.time() - t0))
+        return resultL
+
+    def runFanOut(self, actionId, depDataSetIdList, inputTemplateD=None, outputTemplateD=None, userParameterD=None, chunkSize=None):
+        """Apply the input action to each deposition data set in the input list.
+
+        Input and output data objects for each data set are copied from the template dictionaries with
+        the deposition data set identifier substituted (see ProcessJob.expandTemplate()).   Data sets are
+        run in chunks of *chunkSize* (default: spread evenly over the worker processes) so the registry
+        lookup, the plugin import and the plugin instance are shared by all of the data sets in a chunk,
+        and only the templates and identifiers are shipped to the workers.
+
+        Returns:
+
+        List of job result dictionaries in data set order with JOB_ID set to the deposition data set identifier.
+        """
+        depIdL = list(depDataSetIdList)
+        resultL = [None] * len(depIdL)
+        if not depIdL:
+            return resultL
+        t0 = time.time()
+        with ProcessPoolExecutor(max_workers=self.__numProc) as executor:
+            if not chunkSize:
+                numProc = self.__numProc if self.__numProc else (os.cpu_count() or 1)
+                chunkSize = max(1, -(-len(depIdL) // (4 * numProc)))
+            futureD = {}
+            for ii in range(0, len(depIdL), chunkSize):
+                future = executor.submit(_runWorkerFanOut, actionId, depIdL[ii : ii + chunkSize], inputTemplateD, outputTemplateD, userParameterD, self.__preCheck, self.__verbose)
+                futureD[future] = ii
+            for future in as_completed(futureD):
+                ii = futureD[future]
+                chunkL = depIdL[ii : ii + chunkSize]
+                try:
+                    rL = future.result()
+                except Exception as _e:  # noqa: F841
+                    # Failures to ship the chunk or its results or a lost worker process
+                    exc = traceback.format_exc()
+                    rL = [makeJobResult(depId, actionId, exception=exc, started=False) for depId in chunkL]
+                resultL[ii : ii + len(rL)] = rL
+                if self.__verbose:
+                    for rD in rL:
+                        self.__lfh.write("+ProcessBatchRunner.runFanOut() data set %r action %r status %r in %.3f sec\n" % (rD["JOB_ID"], actionId, rD["STATUS"], rD["ELAPSED_SEC"]))
+        if self.__verbose:
+            nOk = len([rD for rD in resultL if rD["STATUS"]])
+            self.__lfh.write("+ProcessBatchRunner.runFanOut() completed %d of %d data sets in %.3f sec\n" % (nOk, len(depIdL), time.time() - t0))
+        return resultL
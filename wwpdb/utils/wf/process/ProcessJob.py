@@ -0,0 +1,230 @@
+##
+# File:    ProcessJob.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw add per-phase action timings to the job result
+# 16-Oct-2026 jdw add action attempts to the job result
+# 16-Oct-2026 jdw add makeJobResult(), expandTemplate() and runFanOutJob()
+# 16-Oct-2026 jdw makeJobResult() option for jobs that were not started
+# 17-Oct-2026 jdw mergeJobResult() copies the complete state of the returned output data objects
+##
+"""
+Job specifications for running registry actions outside of a single ProcessRunner() instance.
+
+A job is a plain dictionary so that it can be shipped to worker processes:
+
+- JOB_ID               caller assigned or generated job identifier
+- ACTION_ID            action identifier defined in the action registry
+- INPUT_OBJECT_DICT    dictionary of input `WfDataObject` objects keyed by input name
+- OUTPUT_OBJECT_DICT   dictionary of output `WfDataObject` objects keyed by output name
+- USER_PARAMETER_DICT  dictionary of user adjustable parameters (optional)
+
+The result of running a job is a dictionary with the following keys:
+
+- JOB_ID, ACTION_ID    as above
+- STATUS               True if the action completed successfully or False otherwise
+- START_TIME           time (seconds since the epoch) at which the job started
+- ELAPSED_SEC          elapsed wall-clock time of the job in seconds
+- EXCEPTION            formatted traceback of any exception raised while running the job or None
+- OUTPUT_OBJECT_DICT   the output data objects as modified by the action
+- PID                  process id of the process that ran the job
+- TIMING_DICT          per-phase timings of the action (see ProcessRunner.getTimings())
+- ATTEMPT_LIST         attempts made to run the action (see ProcessRunner.getAttempts())
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import copy
+import os
+import sys
+import time
+import traceback
+
+from wwpdb.utils.wf.process.ProcessRunner import ProcessRunner
+
+
+def makeJob(actionId, inputObjectD=None, outputObjectD=None, userParameterD=None, jobId=None):
+    """Returns:
+
+    A job specification dictionary for the input action and data objects.
+    """
+    return {
+        "JOB_ID": jobId,
+        "ACTION_ID": actionId,
+        "INPUT_OBJECT_DICT": inputObjectD if inputObjectD is not None else {},
+        "OUTPUT_OBJECT_DICT": outputObjectD if outputObjectD is not None else {},
+        "USER_PARAMETER_DICT": userParameterD,
+    }
+
+
+def makeJobResult(jobId, actionId, outputObjectD=None, exception=None, started=True):
+    """All job results (including those of failed, lost and skipped jobs) are built here.
+
+    If *started* is False the job was not started in this process and START_TIME and PID are None.
+
+    Returns:
+
+    A job result dictionary with a failed status and the input exception text.
+    """
+    return {
+        "JOB_ID": jobId,
+        "ACTION_ID": actionId,
+        "STATUS": False,
+        "START_TIME": time.time() if started else None,
+        "ELAPSED_SEC": 0.0,
+        "EXCEPTION": exception,
+        "OUTPUT_OBJECT_DICT": outputObjectD if outputObjectD is not None else {},
+        "PID": os.getpid() if started else None,
+        "TIMING_DICT": {},
+        "ATTEMPT_LIST": [],
+    }
+
+
+def runJob(jobD, preCheck=False, verbose=False, log=sys.stderr, actionRegistry=None):
+    """Run the action described by the input job specification using a ProcessRunner() instance.
+    An already loaded action registry may be provided as *actionRegistry*.
+
+    If *preCheck* is set the job is only run if the input and output data objects satisfy
+    the registry type requirements of the action.
+
+    Returns:
+
+    A job result dictionary.  Exceptions are captured in the result rather than raised.
+    """
+    rD = makeJobResult(jobD.get("JOB_ID"), jobD.get("ACTION_ID"), jobD.get("OUTPUT_OBJECT_DICT"))
+    t0 = time.time()
+    try:
+        pR = ProcessRunner(verbose=verbose, log=log, actionRegistry=actionRegistry)
+        for name, wfo in jobD.get("INPUT_OBJECT_DICT", {}).items():
+            pR.setInput(name, wfo)
+        for name, wfo in jobD.get("OUTPUT_OBJECT_DICT", {}).items():
+            pR.setOutput(name, wfo)
+        if not pR.setAction(jobD.get("ACTION_ID")):
+            rD["EXCEPTION"] = "Undefined action %r\n" % jobD.get("ACTION_ID")
+        else:
+            if jobD.get("USER_PARAMETER_DICT") is not None:
+                pR.setParameterDict(jobD["USER_PARAMETER_DICT"])
+            errL = checkJobs([jobD], pR.getActionRegistry())[0] if preCheck else []
+            if errL:
+                rD["EXCEPTION"] = "Data objects fail the type requirements of action %r\n%s\n" % (jobD.get("ACTION_ID"), "\n".join(errL))
+            else:
+                rD["STATUS"] = bool(pR.run())
+                rD["EXCEPTION"] = pR.getLastException()
+            rD["TIMING_DICT"] = pR.getTimings()
+            rD["ATTEMPT_LIST"] = pR.getAttempts()
+    except Exception as _e:  # noqa: F841
+        rD["STATUS"] = False
+        rD["EXCEPTION"] = traceback.format_exc()
+        if verbose:
+            log.write("+ProcessJob.runJob() failed for job %r action %r\n%s" % (rD["JOB_ID"], rD["ACTION_ID"], rD["EXCEPTION"]))
+    rD["ELAPSED_SEC"] = time.time() - t0
+    return rD
+
+
+def expandTemplate(templateD, depDataSetId):
+    """Copy the input dictionary of template data objects for the input deposition data set.
+    The deposition data set identifier is set on each copy that is an archive or workflow file
+    reference (i.e. not an external file path).  Copies share the site configuration of the template.
+
+    Returns:
+
+    Dictionary of data objects keyed as the template dictionary.
+    """
+    oD = {}
+    for name, tWfo in (templateD or {}).items():
+        wfo = copy.copy(tWfo)
+        if wfo.getReferenceType() == "file" and wfo.getContentType() is not None:
+            wfo.setDepositionDataSetId(depDataSetId)
+        oD[name] = wfo
+    return oD
+
+
+def runFanOutJob(actionId, depDataSetIdList, inputTemplateD=None, outputTemplateD=None, userParameterD=None, preCheck=False, verbose=False, log=sys.stderr, actionRegistry=None):
+    """Apply the input action to each deposition data set in the input list using data objects
+    expanded from the input and output templates (see expandTemplate()).
+
+    The action is looked up in the registry once and one ProcessRunner() instance and one plugin
+    instance are used for all data sets.
+
+    Returns:
+
+    List of job result dictionaries in data set order with JOB_ID set to the deposition data set identifier.
+    """
+    resultL = []
+    try:
+        pR = ProcessRunner(verbose=verbose, log=log, actionRegistry=actionRegistry)
+        pR.setPluginReuse(True)
+        if not pR.setAction(actionId):
+            return [makeJobResult(depId, actionId, exception="Undefined action %r\n" % actionId) for depId in depDataSetIdList]
+        if userParameterD is not None:
+            pR.setParameterDict(userParameterD)
+        aV = pR.getActionRegistry().getActionValidator(actionId)
+    except Exception as _e:  # noqa: F841
+        return [makeJobResult(depId, actionId, exception=traceback.format_exc()) for depId in depDataSetIdList]
+    #
+    for depId in depDataSetIdList:
+        t0 = time.time()
+        rD = makeJobResult(depId, actionId)
+        try:
+            inpD = expandTemplate(inputTemplateD, depId)
+            outD = expandTemplate(outputTemplateD, depId)
+            rD["OUTPUT_OBJECT_DICT"] = outD
+            for name, wfo in inpD.items():
+                pR.setInput(name, wfo)
+            for name, wfo in outD.items():
+                pR.setOutput(name, wfo)
+            errL = aV.check(inpD, outD) if preCheck else []
+            if errL:
+                rD["EXCEPTION"] = "Data objects fail the type requirements of action %r\n%s\n" % (actionId, "\n".join(errL))
+            else:
+                pR.clearTimings()
+                rD["STATUS"] = bool(pR.run())
+                rD["EXCEPTION"] = pR.getLastException()
+                rD["TIMING_DICT"] = pR.getTimings()
+                rD["ATTEMPT_LIST"] = pR.getAttempts()
+        except Exception as _e:  # noqa: F841
+            rD["STATUS"] = False
+            rD["EXCEPTION"] = traceback.format_exc()
+            if verbose:
+                log.write("+ProcessJob.runFanOutJob() failed for data set %r action %r\n%s" % (depId, actionId, rD["EXCEPTION"]))
+        rD["ELAPSED_SEC"] = time.time() - t0
+        resultL.append(rD)
+    return resultL
+
+
+def checkJobs(jobList, aReg):
+    """Check the data objects of each job in the input list against the type requirements of its action
+    in the action registry *aReg*.  Action requirements are compiled once and shared across jobs.
+
+    Returns:
+
+    A list with the list of all requirement mismatches for each job in job order.
+    """
+    return [aReg.getActionValidator(jobD.get("ACTION_ID")).check(jobD.get("INPUT_OBJECT_DICT", {}), jobD.get("OUTPUT_OBJECT_DICT", {})) for jobD in jobList]
+
+
+def mergeJobResult(jobD, resultD):
+    """Copy the output data objects returned in *resultD* onto the output data objects of the
+    original job specification *jobD* (see WfDataObject.updateFrom()).   This is required when
+    the job has been run in another process and the returned objects are copies.   The complete
+    state is copied, so values and any reference settings made by the action (e.g. a version
+    or partition number) are kept.
+
+    Returns:
+
+    True on success or False otherwise.
+    """
+    try:
+        outD = jobD.get("OUTPUT_OBJECT_DICT", {})
+        for name, wfo in resultD.get("OUTPUT_OBJECT_DICT", {}).items():
+            if name not in outD or outD[name] is wfo:
+                continue
+            outD[name].updateFrom(wfo)
+        return True
+    except Exception as _e:  # noqa: F841
+        return False
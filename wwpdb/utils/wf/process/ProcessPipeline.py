@@ -0,0 +1,177 @@
+##
+# File:    ProcessPipeline.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw add dry-run plan()
+# 16-Oct-2026 jdw build skipped step results with makeJobResult()
+# 17-Oct-2026 jdw pin symbolic versions of output file references before a step is started
+##
+"""
+Run a dependency graph of registry actions with independent branches in parallel.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from wwpdb.utils.wf.process.ProcessJob import makeJob, makeJobResult, runJob, mergeJobResult
+from wwpdb.utils.wf.process.ProcessPlanner import ProcessPlanner
+
+
+def _getFileIdentity(wfo):
+    """Version independent identity of a file reference or None for other data objects."""
+    try:
+        if wfo.getReferenceType() != "file":
+            return None
+        if wfo.getContentType() is None:
+            # external file path
+            return (wfo.getFilePathReference(),)
+        return (wfo.getDirPathReference(), wfo.getDepositionDataSetId(), wfo.getContentType(), wfo.getFileFormat(), wfo.getPartitionNumber())
+    except Exception as _e:  # noqa: F841
+        return None
+
+
+class ProcessPipeline(object):
+
+    """Run a pipeline of actions organized as a directed acyclic graph of steps.
+
+    A step depends on an earlier step if:
+
+    - it is listed in the step's *dependsOn* list,
+    - one of its input data objects is an output data object of the earlier step, or
+    - one of its input file references names the same file (ignoring the version) as
+      an output file reference of the earlier step.
+
+    Steps are run in a process pool as soon as all of the steps they depend on have
+    completed successfully.  When a step is started, the *latest*, *next* and *previous*
+    versions of its output file references are resolved and set as explicit version numbers,
+    and the returned output data objects are copied back onto the step's output data objects
+    before dependent steps are started.  A data object may therefore be shared as the output
+    of one step and the input of the next.   Steps depending on a failed step are not run.
+
+    """
+
+    def __init__(self, numProc=None, preCheck=False, verbose=False, log=sys.stderr):
+        self.__numProc = numProc
+        self.__preCheck = preCheck
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__stepIdL = []
+        self.__jobD = {}
+        self.__dependsOnD = {}
+
+    def addStep(self, stepId, actionId, inputObjectD=None, outputObjectD=None, userParameterD=None, dependsOn=None):
+        """Add a step to the pipeline.   Steps may only depend on steps that have already been added.
+
+        Returns:
+
+        True on success or False otherwise.
+        """
+        if stepId in self.__jobD:
+            self.__lfh.write("+ProcessPipeline.addStep() duplicate step %r\n" % stepId)
+            return False
+        depS = set(dependsOn) if dependsOn else set()
+        for depId in depS:
+            if depId not in self.__jobD:
+                self.__lfh.write("+ProcessPipeline.addStep() step %r depends on undefined step %r\n" % (stepId, depId))
+                return False
+        jobD = makeJob(actionId, inputObjectD, outputObjectD, userParameterD, jobId=stepId)
+        #
+        for inpWfo in jobD["INPUT_OBJECT_DICT"].values():
+            inpIdentity = _getFileIdentity(inpWfo)
+            for prevStepId in self.__stepIdL:
+                for outWfo in self.__jobD[prevStepId]["OUTPUT_OBJECT_DICT"].values():
+                    if outWfo is inpWfo or (inpIdentity is not None and inpIdentity == _getFileIdentity(outWfo)):
+                        depS.add(prevStepId)
+        self.__stepIdL.append(stepId)
+        self.__jobD[stepId] = jobD
+        self.__dependsOnD[stepId] = depS
+        return True
+
+    def getDependencies(self, stepId):
+        """Returns:
+
+        List of the steps on which the input step depends in the order the steps were added.
+        """
+        return sorted(self.__dependsOnD.get(stepId, []), key=self.__stepIdL.index)
+
+    def plan(self):
+        """Resolve and check the data object paths of all pipeline steps without running them
+        (see `ProcessPlanner`).  Inputs written by other steps are not reported missing.
+
+        Returns:
+
+        Dictionary of plan dictionaries keyed by step identifier.
+        """
+        planL = ProcessPlanner(verbose=self.__verbose, log=self.__lfh).plan([self.__jobD[stepId] for stepId in self.__stepIdL])
+        return dict(zip(self.__stepIdL, planL))
+
+    def __makeSkippedResult(self, stepId, failedStepId):
+        jobD = self.__jobD[stepId]
+        return makeJobResult(stepId, jobD["ACTION_ID"], jobD["OUTPUT_OBJECT_DICT"], exception="Not run -- step %r failed\n" % failedStepId, started=False)
+
+    def __pinOutputVersions(self, stepId):
+        """Set the resolved version number of each output file reference of the step with a symbolic version."""
+        for wfo in self.__jobD[stepId]["OUTPUT_OBJECT_DICT"].values():
+            try:
+                if wfo.getReferenceType() != "file" or wfo.getVersionId() not in ["latest", "next", "previous"]:
+                    continue
+                wfo.refresh()
+                fP = wfo.getFilePathReference()
+                if fP is not None and fP.rsplit(".V", 1)[-1].isdigit():
+                    wfo.setVersionId(int(fP.rsplit(".V", 1)[-1]))
+            except Exception as _e:  # noqa: F841
+                if self.__verbose:
+                    traceback.print_exc(file=self.__lfh)
+
+    def run(self):
+        """Run all pipeline steps.
+
+        Returns:
+
+        Dictionary of job result dictionaries (see `ProcessJob`) keyed by step identifier.
+        """
+        resultD = {}
+        pendingS = set(self.__stepIdL)
+        t0 = time.time()
+        with ProcessPoolExecutor(max_workers=self.__numProc) as executor:
+            runningD = {}
+            while pendingS or runningD:
+                #
+                # Skip steps depending on failed steps and submit steps whose dependencies have completed
+                for stepId in [sId for sId in self.__stepIdL if sId in pendingS]:
+                    failedL = [depId for depId in self.__dependsOnD[stepId] if depId in resultD and not resultD[depId]["STATUS"]]
+                    if failedL:
+                        resultD[stepId] = self.__makeSkippedResult(stepId, failedL[0])
+                        pendingS.discard(stepId)
+                    elif all(depId in resultD for depId in self.__dependsOnD[stepId]):
+                        self.__pinOutputVersions(stepId)
+                        runningD[executor.submit(runJob, self.__jobD[stepId], self.__preCheck, self.__verbose)] = stepId
+                        pendingS.discard(stepId)
+                if not runningD:
+                    continue
+                doneS, _ = wait(list(runningD.keys()), return_when=FIRST_COMPLETED)
+                for future in doneS:
+                    stepId = runningD.pop(future)
+                    jobD = self.__jobD[stepId]
+                    try:
+                        rD = future.result()
+                        mergeJobResult(jobD, rD)
+                    except Exception as _e:  # noqa: F841
+                        rD = self.__makeSkippedResult(stepId, stepId)
+                        rD["EXCEPTION"] = traceback.format_exc()
+                    resultD[stepId] = rD
+                    if self.__verbose:
+                        self.__lfh.write("+ProcessPipeline.run() step %r action %r status %r in %.3f sec\n" % (stepId, rD["ACTION_ID"], rD["STATUS"], rD["ELAPSED_SEC"]))
+        if self.__verbose:
+            nOk = len([rD for rD in resultD.values() if rD["STATUS"]])
+            self.__lfh.write("+ProcessPipeline.run() completed %d of %d steps in %.3f sec\n" % (nOk, len(self.__stepIdL), time.time() - t0))
+        return resultD
@@ -0,0 +1,145 @@
+##
+# File:    ProcessPlanner.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw use the process-wide shared action registry
+# 16-Oct-2026 jdw resolve the versions of all file references of a job from one scan of each directory
+##
+"""
+Dry-run planning of action jobs -- resolve and check all data object paths before any plugin runs.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import stat
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from wwpdb.utils.wf.process.ActionRegistry import getSharedActionRegistry
+from wwpdb.utils.wf.process.ProcessJob import checkJobs
+from wwpdb.utils.wf.WfDataObject import WfDataObject
+
+
+class ProcessPlanner(object):
+
+    """Check a list of action jobs (see `ProcessJob`) without running them.
+
+    For each job the file paths of all input and output file references are resolved and the
+    input files are checked with os.stat() in a pool of threads.   An input file is not reported
+    missing if it is an output file of another job in the list.
+
+    The plan for each job is returned as a dictionary with the following keys:
+
+    - JOB_ID, ACTION_ID   as in the job specification
+    - READY               True if no errors were found or False otherwise
+    - ERROR_LIST          type requirement mismatches and missing, unreadable or unresolved inputs
+    - WARNING_LIST        missing or unwritable output directories
+    - INPUT_PATH_DICT     resolved input file paths keyed by input name
+    - OUTPUT_PATH_DICT    resolved output file paths keyed by output name
+
+    """
+
+    def __init__(self, numThreads=8, verbose=False, log=sys.stderr):
+        self.__numThreads = numThreads
+        self.__verbose = verbose
+        self.__lfh = log
+
+    @staticmethod
+    def __resolvePaths(wfoD):
+        pathD = {}
+        for name, wfo in wfoD.items():
+            if wfo.getReferenceType() == "file":
+                pathD[name] = wfo.getFilePathReference()
+        return pathD
+
+    def __resolveJob(self, jobD):
+        """Returns the tuple (input path dictionary, output path dictionary, error list) for the input job."""
+        try:
+            WfDataObject.resolveFilePathReferences(list(jobD.get("INPUT_OBJECT_DICT", {}).values()) + list(jobD.get("OUTPUT_OBJECT_DICT", {}).values()))
+            return self.__resolvePaths(jobD.get("INPUT_OBJECT_DICT", {})), self.__resolvePaths(jobD.get("OUTPUT_OBJECT_DICT", {})), []
+        except Exception as _e:  # noqa: F841
+            if self.__verbose:
+                traceback.print_exc(file=self.__lfh)
+            return {}, {}, ["path resolution failed"]
+
+    @staticmethod
+    def __checkInputPath(filePath):
+        """Returns None if the input path is a readable file or a description of the problem otherwise."""
+        try:
+            st = os.stat(filePath)
+        except FileNotFoundError:
+            return "missing"
+        except OSError as e:
+            return "unreadable (%s)" % e.strerror
+        if stat.S_ISDIR(st.st_mode):
+            return "is a directory"
+        if not os.access(filePath, os.R_OK):
+            return "unreadable"
+        return None
+
+    @staticmethod
+    def __checkOutputDir(dirPath):
+        if not os.path.isdir(dirPath):
+            return "does not exist"
+        if not os.access(dirPath, os.W_OK):
+            return "is not writable"
+        return None
+
+    def plan(self, jobList):
+        """Returns:
+
+        List of plan dictionaries in job order.
+        """
+        errLL = checkJobs(jobList, getSharedActionRegistry())
+        with ThreadPoolExecutor(max_workers=self.__numThreads) as executor:
+            resolvedL = list(executor.map(self.__resolveJob, jobList))
+            producedS = set()
+            for _inpPathD, outPathD, _errL in resolvedL:
+                producedS.update(pth for pth in outPathD.values() if pth is not None)
+            inpPathL = sorted(set(pth for inpPathD, _outPathD, _errL in resolvedL for pth in inpPathD.values() if pth is not None and pth not in producedS))
+            dirPathL = sorted(set(os.path.dirname(pth) for _inpPathD, outPathD, _errL in resolvedL for pth in outPathD.values() if pth is not None))
+            inpStatusD = dict(zip(inpPathL, executor.map(self.__checkInputPath, inpPathL)))
+            dirStatusD = dict(zip(dirPathL, executor.map(self.__checkOutputDir, dirPathL)))
+        #
+        planL = []
+        for jobD, errL, (inpPathD, outPathD, resolveErrL) in zip(jobList, errLL, resolvedL):
+            pErrL = list(errL) + resolveErrL
+            for name in sorted(inpPathD):
+                pth = inpPathD[name]
+                if pth is None:
+                    pErrL.append("input %s path not resolved" % name)
+                elif inpStatusD.get(pth) is not None:
+                    pErrL.append("input %s %s %s" % (name, pth, inpStatusD[pth]))
+            warnL = []
+            for name in sorted(outPathD):
+                pth = outPathD[name]
+                if pth is None:
+                    pErrL.append("output %s path not resolved" % name)
+                elif dirStatusD.get(os.path.dirname(pth)) is not None:
+                    warnL.append("output %s directory %s %s" % (name, os.path.dirname(pth), dirStatusD[os.path.dirname(pth)]))
+            planL.append(
+                {
+                    "JOB_ID": jobD.get("JOB_ID"),
+                    "ACTION_ID": jobD.get("ACTION_ID"),
+                    "READY": len(pErrL) == 0,
+                    "ERROR_LIST": pErrL,
+                    "WARNING_LIST": warnL,
+                    "INPUT_PATH_DICT": inpPathD,
+                    "OUTPUT_PATH_DICT": outPathD,
+                }
+            )
+            if self.__verbose:
+                for msg in pErrL:
+                    self.__lfh.write("+ProcessPlanner.plan() job %r action %r error %s\n" % (jobD.get("JOB_ID"), jobD.get("ACTION_ID"), msg))
+                for msg in warnL:
+                    self.__lfh.write("+ProcessPlanner.plan() job %r action %r warning %s\n" % (jobD.get("JOB_ID"), jobD.get("ACTION_ID"), msg))
+        if self.__verbose:
+            self.__lfh.write("+ProcessPlanner.plan() %d of %d jobs ready - %d input files checked\n" % (len([pD for pD in planL if pD["READY"]]), len(planL), len(inpPathL)))
+        return planL
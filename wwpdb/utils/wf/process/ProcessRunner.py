@@ -4,6 +4,23 @@
 #
 # Updates:
 # 01-May-2010 jdw add getParameterDict() method and add adjust return values in setParamterDict()
+# 16-Oct-2026 jdw add getLastException() to report the traceback of a failed run()
+# 16-Oct-2026 jdw add process-wide plugin dispatch cache and warmDispatchCache()
+# 16-Oct-2026 jdw preCheck() uses the compiled action validator and reports all mismatches
+# 16-Oct-2026 jdw optional actionRegistry argument to share a loaded registry between instances
+# 16-Oct-2026 jdw add opt-in action result cache setResultCache()
+# 16-Oct-2026 jdw add wall-clock, CPU time and address space limits enforced in a child process
+# 16-Oct-2026 jdw add awaitable runAsync()
+# 16-Oct-2026 jdw add per-phase wall-clock and CPU timings getTimings() and optional JSON lines timing log
+# 16-Oct-2026 jdw add opt-in cProfile/tracemalloc profiling of plugin methods
+# 16-Oct-2026 jdw add per-action retry policies and getAttempts()
+# 16-Oct-2026 jdw use the process-wide shared action registry by default
+# 16-Oct-2026 jdw add setPluginReuse() and clearTimings() for running one action over many data sets
+# 16-Oct-2026 jdw log through a buffered LogSink() with deferred message formatting
+# 16-Oct-2026 jdw add checkDispatch() reporting actions that do not resolve to a plugin method
+# 16-Oct-2026 jdw skip the result cache for actions with registry hint cacheable=no
+# 16-Oct-2026 jdw flush the log at the end of run() and of each plugin method
+# 16-Oct-2026 jdw run resource limited actions in a new interpreter process and return the complete output data objects
 #
 ##
 """
@@ -17,11 +34,80 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import asyncio
+import cProfile
+import json
+import logging
+import math
+import os
+import pickle
+import resource
+import shutil
+import signal
+import subprocess
 import sys
+import tempfile
+import threading
+import time
 import traceback
+import tracemalloc
 
 #
-from wwpdb.utils.wf.process.ActionRegistry import ActionRegistry
+from wwpdb.utils.wf.process.ActionRegistry import getSharedActionRegistry
+from wwpdb.utils.wf.process.LogSink import getLogSink
+
+#
+# Process-wide plugin dispatch cache -  actionId -> (modulePath, methodName, plugin class, plugin method)
+_dispatchCacheD = {}
+_dispatchLock = threading.Lock()
+#
+# Profiling switches -- environment variable with a comma separated list of action identifiers (or 'all')
+# and reserved user parameter (yes/true/1)
+PROFILE_ENV_NAME = "WWPDB_PROCESS_PROFILE"
+PROFILE_PARAMETER_NAME = "_profile"
+#
+# Attributes of ProcessRunner() which are not passed to a resource limited child process (see ProcessRunner.__getstate__())
+_CHILD_EXCLUDED_ATTRIBUTE_LIST = ["_ProcessRunner__lfh", "_ProcessRunner__aReg", "_ProcessRunner__resultCache", "_ProcessRunner__pluginD"]
+
+
+def _runLimitedMain():
+    """Entry point of the resource limited child process (see ProcessRunner.__runLimited()).
+
+    The pickled runner and action arguments are read from stdin and the pickled result dictionary
+    is written to the file path given as the first command line argument.
+    """
+    resultPath, logPath = sys.argv[1:3]
+    runner, aCls, methodName, internalParameterD, limitD = pickle.load(sys.stdin.buffer)
+    rD = runner._runLimitedChild(aCls, methodName, internalParameterD, limitD, logPath)  # pylint: disable=protected-access
+    with open(resultPath + ".tmp", "wb") as ofh:
+        pickle.dump(rD, ofh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(resultPath + ".tmp", resultPath)
+
+
+def _resolveDispatch(aReg, actionId):
+    """Return the tuple (plugin class, plugin method) for the input action using the dispatch cache.
+
+    Cache entries are checked against the current registry module and method names so that
+    entries for redefined actions are resolved again.  Raises an exception if the module or
+    class cannot be imported and returns a method of None if the method is not defined.
+    """
+    modulePath = aReg.getModuleName(actionId)
+    methodName = aReg.getMethodName(actionId)
+    tup = _dispatchCacheD.get(actionId)
+    if tup is not None and tup[0] == modulePath and tup[1] == methodName:
+        return tup[2], tup[3]
+    #
+    aMod = __import__(modulePath, globals(), locals(), [""])
+    sys.modules[modulePath] = aMod
+    #
+    # Strip off any leading path to the module to get the class name
+    clN = modulePath.split(".")[-1]
+    aCls = getattr(aMod, clN)
+    aMeth = getattr(aCls, methodName, None) if methodName is not None else None
+    if aMeth is not None:
+        with _dispatchLock:
+            _dispatchCacheD[actionId] = (modulePath, methodName, aCls, aMeth)
+    return aCls, aMeth
 
 
 class ProcessRunner(object):
@@ -31,15 +117,28 @@ class ProcessRunner(object):
 
     """
 
-    def __init__(self, verbose=True, log=sys.stderr):
+    def __init__(self, verbose=True, log=sys.stderr, actionRegistry=None):
         self.__verbose = verbose
-        self.__lfh = log
+        # log output to the standard streams is buffered and the sink is shared with the plugins -- see getLogSink()
+        self.__lfh = getLogSink(log, verbose)
         self.__debug = False
         self.__actionId = None
         self.__userParameterD = {}
         self.__inputD = {}
         self.__outputD = {}
-        self.__aReg = ActionRegistry()
+        self.__lastException = None
+        self.__resultCache = None
+        self.__resourceLimitD = {}
+        self.__timedOut = False
+        self.__timingD = {}
+        self.__timingLogPath = os.environ.get("WWPDB_PROCESS_TIMING_LOG")
+        self.__profile = False
+        self.__profilePathList = []
+        self.__retryPolicyD = {}
+        self.__attemptL = []
+        self.__pluginReuse = False
+        self.__pluginD = {}
+        self.__aReg = actionRegistry if actionRegistry is not None else getSharedActionRegistry()
 
     def setInput(self, name, wfDataObject):
         """Set the input data object identified by the input name.
@@ -76,11 +175,16 @@ class ProcessRunner(object):
         True on success or false otherwise.
         """
         self.__actionId = actionId
-        if self.__aReg.isDefinedAction(self.__actionId):
-            self.__setParameterDictDefault()
-            return True
-        else:
-            return False
+        self.__timingD = {}
+        clock = self.__getClock()
+        try:
+            if self.__aReg.isDefinedAction(self.__actionId):
+                self.__setParameterDictDefault()
+                return True
+            else:
+                return False
+        finally:
+            self.__addTiming("registryLookup", clock)
 
     def __setParameterDictDefault(self):
         """Copy the default user adjustable parameters from the action definition
@@ -101,31 +205,292 @@ class ProcessRunner(object):
     def getParameterDict(self):
         return self.__userParameterD
 
+    @staticmethod
+    def warmDispatchCache(aReg=None, verbose=False, log=sys.stderr):
+        """Preload the plugin modules for every action in the action registry and populate
+        the process-wide dispatch cache.
+
+        Returns:
+
+        True if every action resolves to a plugin class and method or False otherwise.
+        """
+        errD = ProcessRunner.checkDispatch(aReg)
+        if verbose:
+            for actionId, err in errD.items():
+                log.write("+ProcessRunner.warmDispatchCache() action %s %s" % (actionId, err))
+        return not errD
+
+    @staticmethod
+    def checkDispatch(aReg=None, actionIdList=None):
+        """Resolve the plugin class and method of each action in the input list (default: all registry actions).
+        Resolved actions are added to the process-wide dispatch cache.
+
+        Returns:
+
+        Dictionary of error text keyed by the identifier of each action that does not resolve.
+        """
+        aReg = aReg if aReg is not None else getSharedActionRegistry()
+        errD = {}
+        for actionId in actionIdList if actionIdList is not None else aReg.getActions():
+            if aReg.getModuleName(actionId) is None:
+                errD[actionId] = "module name not defined\n"
+                continue
+            try:
+                _aCls, aMeth = _resolveDispatch(aReg, actionId)
+                if aMeth is None:
+                    errD[actionId] = "method %s not defined in %s\n" % (aReg.getMethodName(actionId), aReg.getModuleName(actionId))
+            except Exception as _e:  # noqa: F841
+                errD[actionId] = "module %s import failed\n%s" % (aReg.getModuleName(actionId), traceback.format_exc())
+        return errD
+
+    @staticmethod
+    def clearDispatchCache():
+        with _dispatchLock:
+            _dispatchCacheD.clear()
+
+    def setResultCache(self, resultCache):
+        """Memoize the results of run() in the input `ActionResultCache` instance (or None to disable).
+
+        Only enable this for deterministic actions -- on a cache hit the output files and values
+        are restored from the cache and the plugin method is not called.  The cache is not used
+        for actions declared not cacheable in the registry (hint cacheable=no).
+        """
+        self.__resultCache = resultCache
+
+    def setResourceLimits(self, wallTime=None, cpuTime=None, addressSpace=None):
+        """Set limits for run() on wall-clock time (seconds), CPU time (seconds) and
+        address space (bytes).  Limits set here override any limits declared for the
+        action in the registry.   A value of 0 removes the corresponding registry limit.
+
+        When any limit applies the action is run in a child process in its own process group.
+        On exceeding the wall-clock limit the process group (including any external programs
+        started by the action) is terminated.   The child is a new Python interpreter (not a fork of
+        the calling process), so limits may be used from any thread.   The input and output data objects
+        and parameters are passed to the child by pickling and the output data objects, as updated by
+        the action, are copied back.   Log output of the child is copied to the log when the child exits.
+        """
+        for ky, val in (("wallTime", wallTime), ("cpuTime", cpuTime), ("addressSpace", addressSpace)):
+            if val is not None:
+                self.__resourceLimitD[ky] = val
+
+    def getResourceLimits(self):
+        """Returns:
+
+        Dictionary of the limits applied to the current action by run().
+        """
+        lD = dict(self.__aReg.getResourceLimitDict(self.__actionId))
+        lD.update(self.__resourceLimitD)
+        return dict((ky, val) for ky, val in lD.items() if val)
+
+    def setRetryPolicy(self, attempts=None, backoff=None, backoffFactor=None, maxBackoff=None, retryOn=None):
+        """Set the retry policy for run() overriding any policy declared for the action in the registry.
+
+        :param attempts:       maximum number of attempts
+        :param backoff:        delay in seconds before the second attempt
+        :param backoffFactor:  multiplier applied to the delay after each further attempt
+        :param maxBackoff:     maximum delay in seconds between attempts
+        :param retryOn:        list of retryable failure kinds from 'exception', 'failure' (the method
+                               returned False) and 'timeout' (a time limit was exceeded)
+
+        Actions should be safe to repeat as output files may be partially written by a failed attempt.
+        """
+        for ky, val in (("attempts", attempts), ("backoff", backoff), ("backoffFactor", backoffFactor), ("maxBackoff", maxBackoff), ("retryOn", retryOn)):
+            if val is not None:
+                self.__retryPolicyD[ky] = val
+
+    def getRetryPolicy(self):
+        """Returns:
+
+        Dictionary of the retry policy applied to the current action by run() with default settings of
+        a single attempt, a one second backoff doubling up to 60 seconds, retrying on any failure kind.
+        """
+        pD = {"attempts": 1, "backoff": 1.0, "backoffFactor": 2.0, "maxBackoff": 60.0, "retryOn": ["exception", "failure", "timeout"]}
+        pD.update(self.__aReg.getRetryPolicyDict(self.__actionId))
+        pD.update(self.__retryPolicyD)
+        return pD
+
+    def getAttempts(self):
+        """Returns:
+
+        List of the attempts made by the last call to run().   Each attempt is described by a dictionary
+        with the attempt number (ATTEMPT), START_TIME, ELAPSED_SEC, STATUS, the kind of failure
+        (FAILURE_KIND: None, exception, failure or timeout) and EXCEPTION.
+        """
+        return self.__attemptL
+
+    def getTimedOut(self):
+        """Returns:
+
+        True if the last call to run() was terminated on exceeding its wall-clock or CPU time limit.
+        """
+        return self.__timedOut
+
+    @staticmethod
+    def __getClock():
+        tms = os.times()
+        return (time.time(), time.process_time(), tms.children_user + tms.children_system)
+
+    def __addTiming(self, phase, clock0):
+        clock1 = self.__getClock()
+        tD = self.__timingD.setdefault(phase, {"WALL_SEC": 0.0, "CPU_SEC": 0.0, "CHILD_CPU_SEC": 0.0})
+        for ky, t0, t1 in zip(("WALL_SEC", "CPU_SEC", "CHILD_CPU_SEC"), clock0, clock1):
+            tD[ky] += t1 - t0
+
+    def clearTimings(self):
+        self.__timingD = {}
+
+    def setPluginReuse(self, reuse=True):
+        """Construct each plugin class once and reuse the instance in subsequent calls to run()
+        on this ProcessRunner() instance (e.g. when applying one action to many data sets).
+        """
+        self.__pluginReuse = reuse
+        self.__pluginD = {}
+
+    def getTimings(self):
+        """Returns:
+
+        Dictionary of the time spent in each phase of the current action since setAction() keyed by phase:
+
+        - registryLookup   action registry lookups
+        - preCheck         checking the data objects against the action type requirements
+        - resultCache      result cache lookup, restore and store (when a result cache is set)
+        - moduleImport     plugin module import and class/method resolution
+        - pluginInit       plugin class construction
+        - methodRun        plugin method execution
+
+        Each phase has the elapsed wall-clock time (WALL_SEC), the CPU time of this process
+        (CPU_SEC) and the CPU time of completed child processes such as the external programs
+        run by the plugin (CHILD_CPU_SEC) in seconds.   Repeated phases are accumulated.
+        """
+        return dict((phase, dict(tD)) for phase, tD in self.__timingD.items())
+
+    def setTimingLogPath(self, filePath):
+        """Append the timings of each call to run() as a JSON line to the input file (or None to disable).
+        The default path is taken from the environment variable WWPDB_PROCESS_TIMING_LOG.
+        """
+        self.__timingLogPath = filePath
+
+    def __writeTimingLog(self, startTime, ok):
+        try:
+            rD = {
+                "ACTION_ID": self.__actionId,
+                "MODULE_NAME": self.__aReg.getModuleName(self.__actionId),
+                "METHOD_NAME": self.__aReg.getMethodName(self.__actionId),
+                "PID": os.getpid(),
+                "START_TIME": startTime,
+                "STATUS": bool(ok),
+                "TIMED_OUT": self.__timedOut,
+                "ATTEMPT_COUNT": len(self.__attemptL),
+                "TIMINGS": self.__timingD,
+            }
+            with open(self.__timingLogPath, "a") as ofh:
+                ofh.write(json.dumps(rD, sort_keys=True) + "\n")
+        except Exception as _e:  # noqa: F841
+            self.__lfh.debug("+ProcessRunner.run() timing log write failed for %s", self.__timingLogPath)
+
+    def __isProfiling(self):
+        if self.__profile:
+            return True
+        envL = [tS.strip() for tS in os.environ.get(PROFILE_ENV_NAME, "").split(",") if tS.strip()]
+        return "all" in envL or self.__actionId in envL
+
+    def getProfilePaths(self):
+        """Returns:
+
+        List of the profile (.prof) and allocation report files written by the last profiled run().
+        """
+        return self.__profilePathList
+
+    def __getProfileDirPath(self):
+        """Profiles are stored in the directory of the first output file reference or the current directory."""
+        for wfo in self.__outputD.values():
+            try:
+                if wfo.getReferenceType() == "file":
+                    fP = wfo.getFilePathReference()
+                    if fP is not None:
+                        return os.path.dirname(fP)
+            except Exception as _e:  # noqa: F841
+                pass
+        return os.getcwd()
+
+    def __invokeProfiled(self, aObj, aMeth, internalParameterD):
+        """Run the plugin method under cProfile and tracemalloc and write the profile and the top allocations."""
+        self.__profilePathList = []
+        prof = cProfile.Profile()
+        startTrace = not tracemalloc.is_tracing()
+        if startTrace:
+            tracemalloc.start(25)
+        try:
+            prof.enable()
+            try:
+                return aMeth(aObj, inputObjectD=self.__inputD, outputObjectD=self.__outputD, userParameterD=self.__userParameterD, internalParameterD=internalParameterD)
+            finally:
+                prof.disable()
+                snapshot = tracemalloc.take_snapshot()
+                curBytes, peakBytes = tracemalloc.get_traced_memory()
+                self.__writeProfile(prof, snapshot, curBytes, peakBytes, "%s.%s" % (type(aObj).__module__, aMeth.__name__))
+        finally:
+            if startTrace:
+                tracemalloc.stop()
+
+    def __writeProfile(self, prof, snapshot, curBytes, peakBytes, methodLabel, maxStats=40):
+        try:
+            dirPath = self.__getProfileDirPath()
+            if not os.path.isdir(dirPath):
+                os.makedirs(dirPath)
+            basePath = os.path.join(dirPath, "%s-%s-%d" % (self.__actionId, time.strftime("%Y%m%d%H%M%S"), os.getpid()))
+            profPath = basePath + ".prof"
+            prof.dump_stats(profPath)
+            allocPath = basePath + "-alloc.txt"
+            snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, cProfile.__file__)])
+            with open(allocPath, "w") as ofh:
+                ofh.write("Action %s (%s)\n" % (self.__actionId, methodLabel))
+                ofh.write("Traced memory current %d bytes peak %d bytes\n" % (curBytes, peakBytes))
+                ofh.write("Top %d allocations by line:\n" % maxStats)
+                for stat in snapshot.statistics("lineno")[:maxStats]:
+                    ofh.write("%s\n" % stat)
+            self.__profilePathList = [profPath, allocPath]
+            self.__lfh.debug("+ProcessRunner.run() action %s profile written to %s and %s", self.__actionId, profPath, allocPath)
+        except Exception as _e:  # noqa: F841
+            if self.__verbose:
+                self.__lfh.write("+ProcessRunner.run() action %s profile write failed\n" % self.__actionId)
+                traceback.print_exc(file=self.__lfh)
+
+    def getActionRegistry(self):
+        return self.__aReg
+
+    def getLastException(self):
+        """Returns:
+
+        The formatted traceback of any exception raised during the last call to run() or None.
+        """
+        return self.__lastException
+
     def setParameterDict(self, pD):
         """Copy values for input parameters corresponding to any user adjustable
-        parameters for the current action.
+        parameters for the current action.   The reserved parameter '_profile' (yes/no)
+        enables profiling of the action method in run().
 
         Returns:
 
         True on success or false otherwise.
         """
         self.__userParameterD = {}
+        self.__profile = str(pD.get(PROFILE_PARAMETER_NAME, "")).lower() in ("yes", "y", "true", "1")
         try:
             for k, v in self.__aReg.getUserParameterDict(self.__actionId).items():
 
                 if k in pD:
-                    if self.__verbose:
-                        self.__lfh.write("+ProcessRunner.setParameterDict() setting parameter %s to %r\n" % (k, pD[k]))
+                    self.__lfh.debug("+ProcessRunner.setParameterDict() setting parameter %s to %r", k, pD[k])
                     self.__userParameterD[k] = pD[k]
                 else:
-                    if self.__verbose:
-                        self.__lfh.write("+ProcessRunner.setParameterDict() using default setting for parameter %s = %r\n" % (k, v))
+                    self.__lfh.debug("+ProcessRunner.setParameterDict() using default setting for parameter %s = %r", k, v)
                     self.__userParameterD[k] = v
 
-            if self.__verbose:
-                self.__lfh.write("+ProcessRunner.setParameterDict() parameter settings:\n")
+            if self.__lfh.isEnabledFor(logging.DEBUG):
+                self.__lfh.debug("+ProcessRunner.setParameterDict() parameter settings:")
                 for k, v in self.getParameterDict().items():
-                    self.__lfh.write("+ProcessRunner.setParameterDict() parameter %s = %r\n" % (k, v))
+                    self.__lfh.debug("+ProcessRunner.setParameterDict() parameter %s = %r", k, v)
         except Exception as _e:  # noqa: F841
             traceback.print_exc(file=sys.stderr)
             return False
@@ -134,7 +499,7 @@ class ProcessRunner(object):
 
     def preCheck(self):
         """Check that input and output data objects are consistent with the type requirements
-        for the specified action.
+        for the specified action.   All mismatches are reported when verbose output is enabled.
 
         Returns:
 
@@ -143,132 +508,246 @@ class ProcessRunner(object):
         """
 
         if not self.__aReg.isDefinedAction(self.__actionId):
-            self.__lfh.write("preCheck : not a valid action  %s\n" % self.__actionId)
+            self.__lfh.info("preCheck : not a valid action  %s", self.__actionId)
             return False
 
         if self.__debug:
             self.__lfh.write("preCheck for action %s\n" % self.__actionId)
 
-        numInp = self.__aReg.getInputObjectCount(self.__actionId)
-        # number of inputs consistent?
-        if numInp != len(self.__inputD):
-            if self.__verbose:
-                self.__lfh.write("Failed input count\n")
-            return False
-        #
-        # input types consistent?
-        if numInp > 0:
-            for iN in self.__aReg.getInputObjectNames(self.__actionId):
-                if self.__aReg.isSetInputReferenceType(self.__actionId, iN):
-                    if self.__aReg.getInputReferenceType(self.__actionId, iN) != self.__inputD[iN].getReferenceType():
-                        if self.__verbose:
-                            self.__lfh.write("Failed input reference type %s\n" % iN)
-                        return False
-                if self.__aReg.isSetInputContainerType(self.__actionId, iN):
-                    if self.__aReg.getInputContainerType(self.__actionId, iN) != self.__inputD[iN].getContainerTypeName():
-                        if self.__verbose:
-                            self.__lfh.write("Failed input container type %s\n" % iN)
-                        return False
-                if self.__aReg.isSetInputValueType(self.__actionId, iN):
-                    if self.__aReg.getInputValueType(self.__actionId, iN) != self.__inputD[iN].getValueTypeName():
-                        if self.__verbose:
-                            self.__lfh.write("Failed input value type %s\n" % iN)
-                        return False
-                if self.__aReg.isSetInputSelectorType(self.__actionId, iN):
-                    if self.__aReg.getInputSelectorType(self.__actionId, iN) != self.__inputD[iN].getSelectorType():
-                        if self.__verbose:
-                            self.__lfh.write("Failed input selector type %s registered as %s \n" % (iN, self.__aReg.getInputSelectorType(self.__actionId, iN)))
-                        return False
-
-                if self.__aReg.isSetInputContentType(self.__actionId, iN):
-                    if self.__aReg.getInputContentType(self.__actionId, iN) != self.__inputD[iN].getContentType():
-                        if self.__verbose:
-                            self.__lfh.write(
-                                "Failed input content type %s - %s:%s\n" % (iN, self.__aReg.getInputContentType(self.__actionId, iN), self.__inputD[iN].getContentType())
-                            )
-                        return False
-
-                if self.__aReg.isSetInputFileFormat(self.__actionId, iN):
-                    if self.__aReg.getInputFileFormat(self.__actionId, iN) != self.__inputD[iN].getFileFormat():
-                        if self.__verbose:
-                            self.__lfh.write("Failed input file format %s \n" % iN)
-                        return False
-
-        #
-        numOut = self.__aReg.getOutputObjectCount(self.__actionId)
-        # number of outputs consistent?
-        if numOut != len(self.__outputD):
-            if self.__verbose:
-                self.__lfh.write("Failed number of outputs\n")
-            return False
-        #
-        # output types consistent?
-        if numOut > 0:
-            for oN in self.__aReg.getOutputObjectNames(self.__actionId):
-                if self.__aReg.isSetOutputReferenceType(self.__actionId, oN):
-                    if self.__aReg.getOutputReferenceType(self.__actionId, oN) != self.__outputD[oN].getReferenceType():
-                        if self.__verbose:
-                            self.__lfh.write("Failed output reference type %s\n" % oN)
-                        return False
-                if self.__aReg.isSetOutputContainerType(self.__actionId, oN):
-                    if self.__aReg.getOutputContainerType(self.__actionId, oN) != self.__outputD[oN].getContainerTypeName():
-                        if self.__verbose:
-                            self.__lfh.write("Failed output container type %s\n" % oN)
-                        return False
-                if self.__aReg.isSetOutputValueType(self.__actionId, oN):
-                    if self.__aReg.getOutputValueType(self.__actionId, oN) != self.__outputD[oN].getValueTypeName():
-                        if self.__verbose:
-                            self.__lfh.write("Failed output value type %s\n" % oN)
-                        return False
-                if self.__aReg.isSetOutputSelectorType(self.__actionId, oN):
-                    if self.__aReg.getOutputSelectorType(self.__actionId, oN) != self.__outputD[oN].getSelectorType():
-                        if self.__verbose:
-                            self.__lfh.write("Failed output selector type %s\n" % oN)
-                        return False
-                if self.__aReg.isSetOutputContentType(self.__actionId, oN):
-                    if self.__aReg.getOutputContentType(self.__actionId, oN) != self.__outputD[oN].getContentType():
-                        if self.__verbose:
-                            self.__lfh.write("Failed output content type %s\n" % oN)
-                        return False
-                if self.__aReg.isSetOutputFileFormat(self.__actionId, oN):
-                    if self.__aReg.getOutputFileFormat(self.__actionId, oN) != self.__outputD[oN].getFileFormat():
-                        if self.__verbose:
-                            self.__lfh.write("Failed output file format %s\n" % oN)
-                        return False
+        clock = self.__getClock()
+        errL = self.__aReg.getActionValidator(self.__actionId).check(self.__inputD, self.__outputD)
+        self.__addTiming("preCheck", clock)
+        for err in errL:
+            self.__lfh.debug("preCheck for action %s failed %s", self.__actionId, err)
 
-        return True
+        return len(errL) == 0
 
     def run(self):
-        """Invokes the specified action.
+        """Invokes the specified action.   Failed invocations are repeated according to
+        the retry policy of the action (see setRetryPolicy()).
 
         Returns:
 
         The True if the action completed without exception or False otherwise.
 
         """
-        try:
-            modulePath = self.__aReg.getModuleName(self.__actionId)
-            aMod = __import__(modulePath, globals(), locals(), [""])
-            sys.modules[modulePath] = aMod
-            #
-            # Strip off any leading path to the module before we instaniate the object.
-            mpL = modulePath.split(".")
-            clN = mpL[-1]
-            #
-            # aObj = getattr(aMod,modulePath)()
-            aObj = getattr(aMod, clN)(verbose=self.__verbose, log=self.__lfh)
-            aMeth = getattr(aObj, self.__aReg.getMethodName(self.__actionId), None)
-            if aMeth is not None:
-                ok = aMeth(
-                    inputObjectD=self.__inputD,
-                    outputObjectD=self.__outputD,
-                    userParameterD=self.__userParameterD,
-                    internalParameterD=self.__aReg.getInternalParameterDict(self.__actionId),
-                )
-                return ok
+        startTime = time.time()
+        self.__attemptL = []
+        policyD = self.getRetryPolicy()
+        maxAttempts = max(1, int(policyD["attempts"]))
+        delay = float(policyD["backoff"])
+        for attempt in range(1, maxAttempts + 1):
+            self.__lastException = None
+            self.__timedOut = False
+            t0 = time.time()
+            ok = False
+            try:
+                ok = self.__run()
+            except Exception as _e:  # noqa: F841
+                self.__lastException = traceback.format_exc()
+                if self.__verbose:
+                    self.__lfh.write(self.__lastException)
+            if ok:
+                failureKind = None
+            elif self.__timedOut:
+                failureKind = "timeout"
+            elif self.__lastException is not None:
+                failureKind = "exception"
             else:
-                return False
+                failureKind = "failure"
+            self.__attemptL.append(
+                {"ATTEMPT": attempt, "START_TIME": t0, "ELAPSED_SEC": time.time() - t0, "STATUS": bool(ok), "FAILURE_KIND": failureKind, "EXCEPTION": self.__lastException}
+            )
+            if ok or attempt == maxAttempts or failureKind not in policyD["retryOn"]:
+                break
+            self.__lfh.debug("+ProcessRunner.run() action %s attempt %d of %d failed (%s) retrying in %.1f sec", self.__actionId, attempt, maxAttempts, failureKind, delay)
+            time.sleep(delay)
+            delay = min(delay * float(policyD["backoffFactor"]), float(policyD["maxBackoff"]))
+        if self.__timingLogPath:
+            self.__writeTimingLog(startTime, ok)
+        self.__flushLog()
+        return ok
+
+    def __flushLog(self):
+        """Flush the log -- text that cannot be written is kept by the log sink and is not lost."""
+        try:
+            self.__lfh.flush()
         except Exception as _e:  # noqa: F841
-            if self.__verbose:
-                traceback.print_exc(file=self.__lfh)
+            pass
+
+    def __run(self):
+        clock = self.__getClock()
+        internalParameterD = self.__aReg.getInternalParameterDict(self.__actionId)
+        limitD = self.getResourceLimits()
+        self.__addTiming("registryLookup", clock)
+        #
+        cacheRef = None
+        if self.__resultCache is not None and self.__aReg.isCacheable(self.__actionId) is not False:
+            clock = self.__getClock()
+            cacheRef = self.__resultCache.lookup(self.__actionId, self.__userParameterD, internalParameterD, self.__inputD, self.__outputD)
+            isHit = self.__resultCache.restore(cacheRef, self.__outputD)
+            self.__addTiming("resultCache", clock)
+            if isHit:
+                return True
+        #
+        clock = self.__getClock()
+        aCls, aMeth = _resolveDispatch(self.__aReg, self.__actionId)
+        self.__addTiming("moduleImport", clock)
+        if aMeth is None:
             return False
+        ok = self.__runLimited(aCls, aMeth, internalParameterD, limitD) if limitD else self.__invoke(aCls, aMeth, internalParameterD)
+        if ok and cacheRef is not None:
+            clock = self.__getClock()
+            self.__resultCache.store(cacheRef, self.__outputD)
+            self.__addTiming("resultCache", clock)
+        return ok
+
+    async def runAsync(self, executor=None):
+        """Awaitable form of run() -- the action is run in the input `concurrent.futures` executor
+        or in the default executor of the running event loop.
+
+        Returns:
+
+        The True if the action completed without exception or False otherwise.
+        """
+        return await asyncio.get_running_loop().run_in_executor(executor, self.run)
+
+    def __invoke(self, aCls, aMeth, internalParameterD):
+        clock = self.__getClock()
+        if self.__pluginReuse and aCls in self.__pluginD:
+            aObj = self.__pluginD[aCls]
+        else:
+            aObj = aCls(verbose=self.__verbose, log=self.__lfh)
+            if self.__pluginReuse:
+                self.__pluginD[aCls] = aObj
+        self.__addTiming("pluginInit", clock)
+        clock = self.__getClock()
+        try:
+            if self.__isProfiling():
+                return self.__invokeProfiled(aObj, aMeth, internalParameterD)
+            return aMeth(aObj, inputObjectD=self.__inputD, outputObjectD=self.__outputD, userParameterD=self.__userParameterD, internalParameterD=internalParameterD)
+        finally:
+            self.__flushLog()
+            self.__addTiming("methodRun", clock)
+
+    @staticmethod
+    def __setChildLimits(limitD):
+        """Apply CPU time and address space limits to the current process -- hard limits are unchanged."""
+        for ky, rLimit in (("cpuTime", resource.RLIMIT_CPU), ("addressSpace", resource.RLIMIT_AS)):
+            if ky in limitD:
+                val = int(math.ceil(limitD[ky]))
+                _soft, hard = resource.getrlimit(rLimit)
+                if hard != resource.RLIM_INFINITY:
+                    val = min(val, hard)
+                resource.setrlimit(rLimit, (val, hard))
+
+    def __getstate__(self):
+        """Pickle the state needed to run the action method in a child process (see __runLimited()).
+        The log, action registry, result cache and reusable plugin instances are not pickled.
+        """
+        stateD = self.__dict__.copy()
+        for ky in _CHILD_EXCLUDED_ATTRIBUTE_LIST:
+            stateD.pop(ky, None)
+        return stateD
+
+    def __setstate__(self, stateD):
+        self.__dict__.update(stateD)
+        self.__lfh = getLogSink(sys.stderr, self.__verbose)
+        self.__aReg = None
+        self.__resultCache = None
+        self.__pluginD = {}
+
+    def _runLimitedChild(self, aCls, methodName, internalParameterD, limitD, logPath):
+        """Run the action method in the resource limited child process (see _runLimitedMain()).
+
+        Returns:
+
+        Dictionary of the status, exception, output data objects and phase timings of the action.
+        """
+        rD = {"STATUS": False, "EXCEPTION": None, "OUTPUT_DICT": {}, "TIMING_DICT": {}, "PROFILE_PATH_LIST": []}
+        with open(logPath, "a") as lfh:
+            self.__lfh = getLogSink(lfh, self.__verbose)
+            try:
+                self.__setChildLimits(limitD)
+                rD["STATUS"] = bool(self.__invoke(aCls, getattr(aCls, methodName), internalParameterD))
+                rD["OUTPUT_DICT"] = self.__outputD
+            except Exception as _e:  # noqa: F841
+                rD["STATUS"] = False
+                rD["EXCEPTION"] = traceback.format_exc()
+            rD["TIMING_DICT"] = self.__timingD
+            rD["PROFILE_PATH_LIST"] = self.__profilePathList
+        return rD
+
+    def __runLimited(self, aCls, aMeth, internalParameterD, limitD):
+        """Run the action method in a child process with the input resource limits applied.  The output
+        data objects as updated by the action and the child's phase timings are returned to the parent.
+        """
+        self.__lfh.debug("+ProcessRunner.run() action %s resource limits %r", self.__actionId, limitD)
+        self.__lfh.flush()
+        clock = self.__getClock()
+        wallTime = limitD.get("wallTime")
+        workPath = tempfile.mkdtemp(prefix="process-runner-")
+        try:
+            resultPath = os.path.join(workPath, "result.pic")
+            logPath = os.path.join(workPath, "log.txt")
+            payload = pickle.dumps((self, aCls, aMeth.__name__, internalParameterD, limitD), protocol=pickle.HIGHEST_PROTOCOL)
+            # the child resolves modules (e.g. plugins) on the search path of this process
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join(pth for pth in sys.path if pth))
+            cmd = [sys.executable, "-c", "from wwpdb.utils.wf.process.ProcessRunner import _runLimitedMain; _runLimitedMain()", resultPath, logPath]
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, env=env, start_new_session=True)
+            try:
+                proc.communicate(payload, timeout=wallTime if wallTime else None)
+            except subprocess.TimeoutExpired:
+                self.__timedOut = True
+                self.__killProcessGroup(proc)
+                self.__lastException = "Action %s exceeded the wall-clock time limit of %r seconds\n" % (self.__actionId, wallTime)
+            if os.access(logPath, os.R_OK):
+                with open(logPath, "r") as ifh:
+                    logText = ifh.read()
+                if logText:
+                    self.__lfh.write(logText)
+            rD = None
+            if not self.__timedOut and os.access(resultPath, os.R_OK):
+                with open(resultPath, "rb") as ifh:
+                    rD = pickle.load(ifh)
+        finally:
+            shutil.rmtree(workPath, ignore_errors=True)
+        if rD is not None:
+            for name, wfo in rD["OUTPUT_DICT"].items():
+                self.__outputD[name].updateFrom(wfo)
+            self.__lastException = rD["EXCEPTION"]
+            self.__timingD = rD["TIMING_DICT"]
+            self.__profilePathList = rD["PROFILE_PATH_LIST"]
+            ok = rD["STATUS"]
+        else:
+            if self.__timedOut:
+                pass
+            elif proc.returncode == -signal.SIGXCPU:
+                self.__timedOut = True
+                self.__lastException = "Action %s exceeded the CPU time limit of %r seconds\n" % (self.__actionId, limitD["cpuTime"])
+            else:
+                self.__lastException = "Action %s process terminated without result (exit code %r)\n" % (self.__actionId, proc.returncode)
+            # no timings returned by the child -- charge the time to the method
+            self.__addTiming("methodRun", clock)
+            ok = False
+        if self.__lastException is not None and self.__verbose:
+            self.__lfh.write(self.__lastException)
+        return ok
+
+    @staticmethod
+    def __killProcessGroup(proc, graceSec=5.0):
+        """Terminate the process group of the child process with SIGTERM followed by SIGKILL
+        after the grace period.   SIGKILL also removes any remaining members of the group (e.g.
+        external programs ignoring SIGTERM).
+        """
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(proc.pid, sig)
+            except ProcessLookupError:
+                pass
+            if sig == signal.SIGTERM:
+                try:
+                    proc.wait(graceSec)
+                except subprocess.TimeoutExpired:
+                    pass
+        proc.wait()
@@ -0,0 +1,266 @@
+##
+# File:    ProcessRunnerDaemon.py
+# Date:    16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 jdw use the process-wide shared action registry and reload it when the registry file changes
+# 16-Oct-2026 jdw load the site configuration in preload() without keeping an unused reference
+# 16-Oct-2026 jdw build client failure results with makeJobResult()
+##
+"""
+Long-running worker that runs registry actions on request over a local Unix domain socket.
+
+The daemon loads the site configuration, the action registry and the plugin modules once.
+Each job request is run in a child process forked from the pre-warmed daemon, so the
+child starts with every module already imported and the registry already parsed.
+
+Requests and replies are pickled `ProcessJob` job and result dictionaries framed by a
+4-byte big-endian length.   The socket is created with owner-only permissions as requests
+are unpickled by the daemon.
+
+Usage::
+
+    python -m wwpdb.utils.wf.process.ProcessRunnerDaemon --socket /path/to/runner.sock
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import argparse
+import os
+import pickle
+import signal
+import socket
+import struct
+import sys
+import threading
+import time
+import traceback
+
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.wf.process.ActionRegistry import getSharedActionRegistry
+from wwpdb.utils.wf.process.ProcessRunner import ProcessRunner
+from wwpdb.utils.wf.process.ProcessJob import makeJobResult, runJob, mergeJobResult
+
+#
+# Heavy supporting modules imported by the plugins, preloaded in addition to the registry plugin modules
+DEFAULT_PRELOAD_MODULE_LIST = [
+    "mmcif.io.IoAdapterCore",
+    "wwpdb.utils.dp.RcsbDpUtility",
+    "wwpdb.utils.db.DbLoadingApi",
+]
+
+
+def _sendMessage(sock, obj):
+    msg = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    sock.sendall(struct.pack(">I", len(msg)) + msg)
+
+
+def _recvBytes(sock, nBytes):
+    buf = b""
+    while len(buf) < nBytes:
+        chunk = sock.recv(min(nBytes - len(buf), 1 << 20))
+        if not chunk:
+            raise EOFError("connection closed after %d of %d bytes" % (len(buf), nBytes))
+        buf += chunk
+    return buf
+
+
+def _recvMessage(sock):
+    (nBytes,) = struct.unpack(">I", _recvBytes(sock, 4))
+    return pickle.loads(_recvBytes(sock, nBytes))
+
+
+class ProcessRunnerDaemon(object):
+
+    """Serve action job requests on a Unix domain socket from a pre-warmed process."""
+
+    def __init__(self, socketPath, preloadModuleList=None, maxChildren=None, preCheck=False, verbose=False, log=sys.stderr):
+        """
+        :param socketPath:        file system path of the Unix domain socket
+        :param preloadModuleList: modules to import before serving (default DEFAULT_PRELOAD_MODULE_LIST)
+        :param maxChildren:       maximum number of concurrent job processes (default: number of processors)
+        :param preCheck:          only run jobs satisfying the type requirements of their action
+        """
+        self.__socketPath = socketPath
+        self.__preloadModuleList = preloadModuleList if preloadModuleList is not None else DEFAULT_PRELOAD_MODULE_LIST
+        self.__maxChildren = maxChildren if maxChildren else (os.cpu_count() or 1)
+        self.__preCheck = preCheck
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__aReg = None
+        self.__sock = None
+        self.__childS = set()
+        self.__stop = False
+
+    def preload(self):
+        """Load the site configuration, the action registry and the plugin and supporting modules.
+
+        Returns:
+
+        True if all registry plugin modules and preload modules were imported or False otherwise.
+        """
+        t0 = time.time()
+        # imports the site configuration modules so forked children inherit them
+        ConfigInfo()
+        self.__aReg = getSharedActionRegistry()
+        ok = ProcessRunner.warmDispatchCache(self.__aReg, verbose=self.__verbose, log=self.__lfh)
+        for moduleName in self.__preloadModuleList:
+            try:
+                __import__(moduleName)
+            except Exception as _e:  # noqa: F841
+                ok = False
+                if self.__verbose:
+                    self.__lfh.write("+ProcessRunnerDaemon.preload() import failed for %s\n" % moduleName)
+                    traceback.print_exc(file=self.__lfh)
+        if self.__verbose:
+            self.__lfh.write("+ProcessRunnerDaemon.preload() status %r in %.3f sec\n" % (ok, time.time() - t0))
+        return ok
+
+    def stop(self, *_args):
+        self.__stop = True
+
+    def __reapChildren(self, block=False):
+        while self.__childS:
+            try:
+                pid, _status = os.waitpid(-1, 0 if block else os.WNOHANG)
+            except ChildProcessError:
+                self.__childS.clear()
+                return
+            if pid == 0:
+                return
+            self.__childS.discard(pid)
+
+    def __runChild(self, conn):
+        """Job process -- runs a single request and exits."""
+        exitCode = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            self.__sock.close()
+            jobD = _recvMessage(conn)
+            rD = runJob(jobD, preCheck=self.__preCheck, verbose=self.__verbose, log=self.__lfh, actionRegistry=self.__aReg)
+            _sendMessage(conn, rD)
+        except Exception as _e:  # noqa: F841
+            exitCode = 1
+            if self.__verbose:
+                traceback.print_exc(file=self.__lfh)
+        finally:
+            try:
+                conn.close()
+                self.__lfh.flush()
+            finally:
+                os._exit(exitCode)  # pylint: disable=protected-access
+
+    def serve(self):
+        """Accept and run job requests until stopped by SIGTERM/SIGINT or stop().
+
+        Returns:
+
+        True on a clean shutdown or False otherwise.
+        """
+        if self.__aReg is None:
+            self.preload()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+        try:
+            if os.path.exists(self.__socketPath):
+                os.remove(self.__socketPath)
+            self.__sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            oldMask = os.umask(0o177)
+            try:
+                self.__sock.bind(self.__socketPath)
+            finally:
+                os.umask(oldMask)
+            self.__sock.listen(128)
+            self.__sock.settimeout(0.5)
+            if self.__verbose:
+                self.__lfh.write("+ProcessRunnerDaemon.serve() listening on %s\n" % self.__socketPath)
+            while not self.__stop:
+                self.__reapChildren()
+                if len(self.__childS) >= self.__maxChildren:
+                    time.sleep(0.01)
+                    continue
+                try:
+                    conn, _addr = self.__sock.accept()
+                except socket.timeout:
+                    continue
+                except InterruptedError:
+                    continue
+                conn.settimeout(None)
+                # pick up any change to the registry file before forking the job process
+                self.__aReg = getSharedActionRegistry()
+                pid = os.fork()
+                if pid == 0:
+                    self.__runChild(conn)
+                conn.close()
+                self.__childS.add(pid)
+            return True
+        except Exception as _e:  # noqa: F841
+            if self.__verbose:
+                traceback.print_exc(file=self.__lfh)
+            return False
+        finally:
+            if self.__sock is not None:
+                self.__sock.close()
+            if os.path.exists(self.__socketPath):
+                os.remove(self.__socketPath)
+            self.__reapChildren(block=True)
+
+
+class ProcessRunnerClient(object):
+
+    """Submit action jobs to a ProcessRunnerDaemon() instance."""
+
+    def __init__(self, socketPath, timeout=None, verbose=False, log=sys.stderr):
+        self.__socketPath = socketPath
+        self.__timeout = timeout
+        self.__verbose = verbose
+        self.__lfh = log
+
+    def run(self, jobD):
+        """Run the input job in the daemon and copy any output data values back onto the job's output objects.
+
+        Returns:
+
+        The job result dictionary.
+        """
+        sock = None
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.__timeout)
+            sock.connect(self.__socketPath)
+            _sendMessage(sock, jobD)
+            rD = _recvMessage(sock)
+            mergeJobResult(jobD, rD)
+            return rD
+        except Exception as _e:  # noqa: F841
+            if self.__verbose:
+                traceback.print_exc(file=self.__lfh)
+            return makeJobResult(jobD.get("JOB_ID"), jobD.get("ACTION_ID"), jobD.get("OUTPUT_OBJECT_DICT"), exception=traceback.format_exc(), started=False)
+        finally:
+            if sock is not None:
+                sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run registry actions on request over a Unix domain socket")
+    parser.add_argument("--socket", dest="socketPath", required=True, help="Unix domain socket path")
+    parser.add_argument("--preload", dest="preloadList", action="append", default=None, help="additional module to preload (repeatable)")
+    parser.add_argument("--max_children", dest="maxChildren", type=int, default=None, help="maximum number of concurrent jobs")
+    parser.add_argument("--precheck", dest="preCheck", action="store_true", default=False, help="check job data objects before running")
+    parser.add_argument("--verbose", dest="verbose", action="store_true", default=False, help="verbose output")
+    args = parser.parse_args()
+    #
+    preloadList = DEFAULT_PRELOAD_MODULE_LIST + (args.preloadList if args.preloadList else [])
+    daemon = ProcessRunnerDaemon(args.socketPath, preloadModuleList=preloadList, maxChildren=args.maxChildren, preCheck=args.preCheck, verbose=args.verbose)
+    daemon.preload()
+    return 0 if daemon.serve() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())